@@ -0,0 +1,103 @@
+"""Compare throughput of Arrow batch lookups with Python and pandas round trips.
+
+Builds an Arrow table of descriptions drawn from the coding index (5 million
+rows by default, with a share of unknown descriptions) and codes it:
+- "python": `to_pylist()`, `SOCLookup.lookup` per row and back to Arrow,
+  timed on the first `--python-rows` rows and reported per second,
+- "pandas": `to_pandas()`, `SOCLookup.lookup_batch` and back to Arrow,
+- "arrow": `SOCLookup.lookup_arrow` on the table,
+- "pandas/d" and "arrow/d": the same on a dictionary encoded column,
+- "parquet": `ArrowBatchLookup.lookup_parquet` from one Parquet file into
+  another, reading and writing included.
+
+Usage:
+    ```
+    poetry run python benchmarks/arrow_batch.py --rows 5000000
+    ```
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from occupational_classification.lookup.soc_arrow import ArrowBatchLookup
+from occupational_classification.lookup.soc_lookup import SOCLookup
+
+
+def _report(label, rows, seconds):
+    print(f"{label:<10}{rows:>12,}{seconds:>10.2f}{rows / seconds:>16,.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--python-rows", type=int, default=200_000)
+    parser.add_argument("--distinct", type=int, default=20_000)
+    parser.add_argument("--unknown", type=float, default=0.1)
+    args = parser.parse_args()
+
+    soc_lookup = SOCLookup()
+    rng = np.random.default_rng(0)
+    pool = soc_lookup.data["description"].drop_duplicates().to_numpy(dtype=object)
+    pool = rng.choice(pool, min(args.distinct, len(pool)), replace=False)
+    n_unknown = int(len(pool) * args.unknown)
+    pool = np.concatenate(
+        [pool, [f"unknown occupation {pos}" for pos in range(n_unknown)]]
+    )
+    table = pa.table({"description": pa.array(rng.choice(pool, args.rows))})
+
+    print(f"{'method':<10}{'rows':>12}{'seconds':>10}{'rows per s':>16}")
+    start = time.perf_counter()
+    descriptions = table.slice(0, args.python_rows).column("description")
+    responses = [soc_lookup.lookup(value) for value in descriptions.to_pylist()]
+    pa.table(
+        {
+            "description": descriptions,
+            "code": [response["code"] for response in responses],
+            "code_major_group": [
+                response["code_major_group"] for response in responses
+            ],
+        }
+    )
+    _report("python", len(responses), time.perf_counter() - start)
+
+    start = time.perf_counter()
+    frame = table.to_pandas()
+    pandas_result = pa.Table.from_pandas(
+        soc_lookup.lookup_batch(frame["description"]), preserve_index=False
+    )
+    _report("pandas", table.num_rows, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    arrow_result = soc_lookup.lookup_arrow(table)
+    _report("arrow", table.num_rows, time.perf_counter() - start)
+    assert arrow_result.column("code").to_pylist() == (  # noqa: S101
+        pandas_result.column("code").to_pylist()
+    )
+
+    # As read from Parquet with read_dictionary, or sent dictionary encoded
+    encoded = pa.table({"description": table.column("description").dictionary_encode()})
+    start = time.perf_counter()
+    soc_lookup.lookup_batch(encoded.to_pandas()["description"])
+    _report("pandas/d", table.num_rows, time.perf_counter() - start)
+    start = time.perf_counter()
+    soc_lookup.lookup_arrow(encoded)
+    _report("arrow/d", table.num_rows, time.perf_counter() - start)
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = Path(directory) / "descriptions.parquet"
+        pq.write_table(table, source)
+        start = time.perf_counter()
+        n_rows = ArrowBatchLookup(soc_lookup).lookup_parquet(
+            source, Path(directory) / "coded.parquet"
+        )
+        _report("parquet", n_rows, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Compare cold start from the workbooks with cold start from an artefact.
+
+Builds the SOC resources from the configured workbooks, saves them with
+`save_soc_artefact`, then times `load_soc_resources` and `load_soc_artefact`
+in fresh processes, so that imports and caches do not carry over. Times
+cover loading only, not imports.
+
+Usage:
+    ```
+    poetry run python benchmarks/artefact_cold_start.py --repeats 5
+    ```
+"""
+
+import argparse
+import multiprocessing
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from occupational_classification.datasets.soc_artefact import (
+    load_soc_artefact,
+    save_soc_artefact,
+)
+from occupational_classification.datasets.soc_loader import load_soc_resources
+
+
+def _run(mode, path, queue):
+    start = time.perf_counter()
+    if mode == "workbooks":
+        load_soc_resources()
+    else:
+        load_soc_artefact(path)
+    queue.put(time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = str(Path(directory) / "soc_resources.json.gz")
+        start = time.perf_counter()
+        save_soc_artefact(load_soc_resources(), path)
+        print(
+            f"artefact {os.path.getsize(path) / 2**20:.2f} MB, "
+            f"built and saved in {time.perf_counter() - start:.2f} s"
+        )
+
+        context = multiprocessing.get_context("spawn")
+        print(f"{'source':<12}{'best ms':>10}{'mean ms':>10}")
+        for mode in ("workbooks", "artefact"):
+            timings = []
+            for _ in range(args.repeats):
+                queue = context.Queue()
+                process = context.Process(target=_run, args=(mode, path, queue))
+                process.start()
+                timings.append(queue.get())
+                process.join()
+            print(
+                f"{mode:<12}{min(timings) * 1000:>10.1f}"
+                f"{sum(timings) / len(timings) * 1000:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Measure `SOCAutocomplete` build time and per-query latency.
+
+Prefixes of one to six characters are taken from random coding index titles
+and completed alphabetically and ranked by frequency.
+
+Usage:
+    ```
+    poetry run python benchmarks/autocomplete_latency.py --queries 20000
+    ```
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from occupational_classification.lookup.soc_autocomplete import SOCAutocomplete
+from occupational_classification.lookup.soc_lookup import SOCLookup
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queries", type=int, default=20000)
+    parser.add_argument("--top-n", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    soc_lookup = SOCLookup()
+    start = time.perf_counter()
+    autocomplete = SOCAutocomplete.from_lookup(soc_lookup)
+    print(
+        f"built over {len(autocomplete)} titles in "
+        f"{(time.perf_counter() - start) * 1000:.1f} ms"
+    )
+
+    rng = random.Random(args.seed)  # noqa: S311
+    titles = autocomplete.titles
+    prefixes = [rng.choice(titles)[: rng.randint(1, 6)] for _ in range(args.queries)]
+    for rank_by_frequency in (False, True):
+        timings = []
+        for prefix in prefixes:
+            start = time.perf_counter()
+            autocomplete.complete(
+                prefix, top_n=args.top_n, rank_by_frequency=rank_by_frequency
+            )
+            timings.append(time.perf_counter() - start)
+        timings.sort()
+        print(
+            f"rank_by_frequency={rank_by_frequency}: "
+            f"mean {statistics.mean(timings) * 1e6:.1f} us, "
+            f"p99 {timings[int(len(timings) * 0.99)] * 1e6:.1f} us, "
+            f"max {timings[-1] * 1e6:.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Compare per-row lookups with the deduplicated batch stage.
+
+Builds a batch of survey-like responses drawn with a skewed (Zipf)
+distribution from the coding index titles, with random case and spacing
+changes, then times `SOCLookup.lookup` on every row against
+`SOCLookup.lookup_deduplicated`, and reports the dedup ratio.
+
+Usage:
+    ```
+    poetry run python benchmarks/batch_dedup.py --rows 1000000
+    ```
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from occupational_classification.lookup.soc_lookup import SOCLookup
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--zipf", type=float, default=1.3)
+    args = parser.parse_args()
+
+    soc_lookup = SOCLookup()
+    rng = np.random.default_rng(0)
+    titles = np.array(sorted(soc_lookup.lookup_dict), dtype=object)
+    ranks = rng.zipf(args.zipf, args.rows) % len(titles)
+    variants = rng.integers(0, 3, args.rows)
+    responses = [
+        (title, title.title(), f" {title.upper()} ")[variant]
+        for title, variant in zip(titles[ranks], variants.tolist(), strict=True)
+    ]
+
+    start = time.perf_counter()
+    per_row = [soc_lookup.lookup(response) for response in responses]
+    per_row_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    deduplicated, batch = soc_lookup.lookup_deduplicated(responses)
+    deduplicated_time = time.perf_counter() - start
+
+    agree = sum(
+        row["code"] == dedup["code"]
+        for row, dedup in zip(per_row, deduplicated, strict=True)
+    )
+    print(f"{args.rows:,} rows, {batch.n_unique:,} distinct after normalisation")
+    print(f"dedup ratio {batch.dedup_ratio:.1%}")
+    print(f"per row {per_row_time:.2f} s, deduplicated {deduplicated_time:.2f} s")
+    print(f"same code on {agree / args.rows:.2%} of rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Compare memory of categorical and plain string batch outputs.
+
+Runs `SOCLookup.lookup_batch` on descriptions drawn from the coding index
+(10 million rows by default) and reports the memory of its categorical output
+against the same table held as Python strings.
+
+Usage:
+    ```
+    poetry run python benchmarks/batch_output_memory.py --rows 10000000
+    ```
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from occupational_classification.lookup.soc_lookup import SOCLookup
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--distinct", type=int, default=20_000)
+    args = parser.parse_args()
+
+    soc_lookup = SOCLookup()
+    rng = np.random.default_rng(0)
+    pool = soc_lookup.data["description"].drop_duplicates().to_numpy()
+    pool = rng.choice(pool, min(args.distinct, len(pool)), replace=False)
+    descriptions = pd.Series(rng.choice(pool, args.rows), dtype=object)
+
+    start = time.perf_counter()
+    result = soc_lookup.lookup_batch(descriptions)
+    elapsed = time.perf_counter() - start
+    as_strings = result.astype(object)
+
+    categorical_mb = result.memory_usage(deep=True).sum() / 2**20
+    string_mb = as_strings.memory_usage(deep=True).sum() / 2**20
+    print(f"lookup_batch of {args.rows:,} rows in {elapsed:.2f} s")
+    print(f"{'column':<24}{'categorical MB':>16}{'strings MB':>14}")
+    for column in result.columns:
+        print(
+            f"{column:<24}"
+            f"{result[column].memory_usage(deep=True) / 2**20:>16.0f}"
+            f"{as_strings[column].memory_usage(deep=True) / 2**20:>14.0f}"
+        )
+    print(
+        f"{'total':<24}{categorical_mb:>16.0f}{string_mb:>14.0f}"
+        f"  ({string_mb / categorical_mb:.1f}x smaller)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Measure BM25 query throughput and accuracy over SOC unit groups.
+
+Builds `BM25Index.from_hierarchy` and queries it with titles drawn from the
+coding index, reporting queries per second and how often the indexed code
+is ranked first or in the top 10.
+
+Usage:
+    ```
+    poetry run python benchmarks/bm25_throughput.py --queries 20000
+    ```
+"""
+
+import argparse
+import random
+import time
+
+from occupational_classification.datasets.soc_loader import load_soc_resources
+from occupational_classification.search.soc_bm25 import BM25Index
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queries", type=int, default=20_000)
+    parser.add_argument("--top-k", type=int, default=10)
+    args = parser.parse_args()
+
+    resources = load_soc_resources()
+    start = time.perf_counter()
+    bm25 = BM25Index.from_hierarchy(resources.hierarchy)
+    print(
+        f"Built over {len(bm25)} unit groups, {len(bm25.postings)} terms "
+        f"in {time.perf_counter() - start:.2f} s"
+    )
+
+    random.seed(0)
+    pairs = random.sample(
+        sorted(resources.lookup.lookup_dict.items()),
+        min(args.queries, len(resources.lookup.lookup_dict)),
+    )
+    top_1 = top_k = 0
+    start = time.perf_counter()
+    for query, code in pairs:
+        ranked = [result["code"] for result in bm25.search(query, top_k=args.top_k)]
+        top_1 += ranked[:1] == [code]
+        top_k += code in ranked
+    elapsed = time.perf_counter() - start
+    print(
+        f"{len(pairs) / elapsed:,.0f} queries/s ({elapsed / len(pairs) * 1e6:.0f} us each)"
+    )
+    print(f"top-1 {top_1 / len(pairs):.1%}, top-{args.top_k} {top_k / len(pairs):.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Measure accuracy and latency of the cascaded lookup per threshold and deadline.
+
+Builds `CascadeLookup.from_lookup` with every stage and runs a mix of
+queries with a known code: exact titles, titles in another case or plural,
+titles inside a sentence, titles with one misspelt word, and unit group
+task descriptions. For each threshold and deadline it reports the share of
+queries answered, the accuracy of the answers, the stage which answered and
+the mean and 99th percentile latency.
+
+Usage:
+    ```
+    poetry run python benchmarks/cascade_latency.py --queries 2000
+    ```
+"""
+
+import argparse
+import random
+import statistics
+import time
+from collections import Counter
+
+from spelling_correction import misspell
+
+from occupational_classification.datasets.soc_loader import load_soc_resources
+from occupational_classification.lookup.soc_cascade import STAGES, CascadeLookup
+
+SENTENCES = (
+    "I work as a {} for the council",
+    "{} in a small firm",
+    "my job is {} on nights",
+)
+
+
+def make_queries(resources, n_queries: int, rng: random.Random) -> list:
+    """Returns (kind, query, code) triples, the same number of each kind."""
+    titles = sorted(resources.lookup.lookup_dict.items())
+    leaves = [node for node in resources.hierarchy.nodes if not node.children]
+    per_kind = n_queries // 5
+    queries = []
+    for title, code in rng.sample(titles, per_kind):
+        queries.append(("exact", title, code))
+    for title, code in rng.sample(titles, per_kind):
+        first, *rest = title.split()
+        queries.append(("variant", " ".join([f"{first}s".title(), *rest]), code))
+    for title, code in rng.sample(titles, per_kind):
+        queries.append(("sentence", rng.choice(SENTENCES).format(title), code))
+    for title, code in rng.sample(titles, per_kind):
+        words = title.split()
+        pos = max(range(len(words)), key=lambda pos: len(words[pos]))
+        words[pos] = misspell(words[pos], 1, rng)
+        queries.append(("typo", " ".join(words), code))
+    for node in rng.choices([node for node in leaves if node.tasks], k=per_kind):
+        queries.append(("task", rng.choice(node.tasks), node.soc_code))
+    return queries
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queries", type=int, default=2_000)
+    parser.add_argument("--thresholds", type=float, nargs="+", default=[0.5, 0.75, 0.9])
+    parser.add_argument("--deadlines-ms", type=float, nargs="+", default=[0.05, 0.5, 5])
+    args = parser.parse_args()
+
+    resources = load_soc_resources()
+    start = time.perf_counter()
+    cascade = CascadeLookup.from_lookup(resources.lookup, hierarchy=resources.hierarchy)
+    print(f"Built {len(cascade.stages)} stages in {time.perf_counter() - start:.2f} s")
+
+    rng = random.Random(0)  # noqa: S311
+    queries = make_queries(resources, args.queries, rng)
+    for kind, query, code in queries[:: len(queries) // 5]:
+        print(f"  {kind:<8} {query!r} -> {code}")
+    # Warm the caches of the normaliser and the stages
+    for _, query, _ in queries:
+        cascade.lookup(query)
+
+    settings = [(threshold, None) for threshold in args.thresholds] + [
+        (0.75, deadline / 1000) for deadline in args.deadlines_ms
+    ]
+    for threshold, deadline in settings:
+        answered = correct = 0
+        stages: Counter = Counter()
+        latencies = []
+        for _, query, code in queries:
+            start = time.perf_counter()
+            response = cascade.lookup(query, deadline=deadline, threshold=threshold)
+            latencies.append(time.perf_counter() - start)
+            stages[response["stage"]] += 1
+            answered += response["code"] is not None
+            correct += response["code"] == code
+        latencies.sort()
+        deadline_text = "none" if deadline is None else f"{deadline * 1000:g} ms"
+        print(
+            f"threshold {threshold:.2f}, deadline {deadline_text}: "
+            f"answered {answered / len(queries):.1%}, "
+            f"accuracy {correct / max(answered, 1):.1%}, "
+            f"mean {statistics.fmean(latencies) * 1e6:.0f} us, "
+            f"p99 {latencies[int(len(latencies) * 0.99)] * 1e6:.0f} us"
+        )
+        print(
+            "  "
+            + ", ".join(
+                f"{stage} {stages[stage] / len(queries):.0%}"
+                for stage in (*STAGES, None)
+                if stages[stage]
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
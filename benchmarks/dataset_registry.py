@@ -0,0 +1,73 @@
+"""Report the memory of two SOC index releases served side by side.
+
+Writes a "previous" release of the configured SOC index, with a share of
+its titles removed, then loads both releases (with the same SOC structure)
+independently with `load_soc_resources` and through a `DatasetRegistry`,
+and reports the memory held by each pair with `deep_sizeof`, counting
+shared objects once.
+
+Usage:
+    ```
+    poetry run python benchmarks/dataset_registry.py --removed 0.05
+    ```
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from occupational_classification._config.main import get_config
+from occupational_classification.datasets.soc_loader import load_soc_resources
+from occupational_classification.datasets.soc_registry import DatasetRegistry
+from occupational_classification.utils.memory import deep_sizeof
+
+INDEX_SHEET = "SOC2020 coding index"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--removed", type=float, default=0.05)
+    args = parser.parse_args()
+
+    data_source = get_config()["data_source"]
+    index_data_path = str(data_source["soc_index"])
+    structure_data_path = str(data_source["soc_structure"])
+    with tempfile.TemporaryDirectory() as directory:
+        previous_data_path = str(Path(directory) / "previous_index.xlsx")
+        index = pd.read_excel(index_data_path, sheet_name=INDEX_SHEET)
+        index.sample(frac=1 - args.removed, random_state=0).sort_index().to_excel(
+            previous_data_path, sheet_name=INDEX_SHEET, index=False
+        )
+
+        start = time.perf_counter()
+        independent = [
+            load_soc_resources(path, structure_data_path)
+            for path in (index_data_path, previous_data_path)
+        ]
+        independent_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        registry = DatasetRegistry()
+        registry.register("current", index_data_path, structure_data_path)
+        registry.register("previous", previous_data_path, structure_data_path)
+        shared = [registry[name] for name in registry]
+        registry_time = time.perf_counter() - start
+
+    single = deep_sizeof(independent[0])
+    print(f"one release {single / 2**20:.2f} MB")
+    for label, pair, seconds in (
+        ("independent", independent, independent_time),
+        ("registry", shared, registry_time),
+    ):
+        size = deep_sizeof(pair)
+        print(
+            f"{label:<12} two releases {size / 2**20:.2f} MB "
+            f"({size / single:.2f}x one), loaded in {seconds:.2f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
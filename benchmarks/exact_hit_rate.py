@@ -0,0 +1,77 @@
+"""Compare the exact-hit rate of `SOCLookup` with and without normalisation.
+
+Builds a sample of queries from the SOC coding index by applying the kinds
+of variation seen in survey responses (case, stray punctuation and spaces,
+plurals, ampersands, abbreviations) and reports how many are answered by the
+exact dictionaries before and after normalisation.
+
+Usage:
+    ```
+    poetry run python benchmarks/exact_hit_rate.py --sample 5000
+    ```
+"""
+
+import argparse
+import random
+import time
+
+from occupational_classification.lookup.soc_lookup import SOCLookup
+
+VARIANTS = {
+    "original": lambda text: text,
+    "title case": str.title,
+    "trailing space": lambda text: text + " ",
+    "trailing full stop": lambda text: text + ".",
+    "plural": lambda text: text + "s",
+    "ampersand": lambda text: text.replace(" and ", " & "),
+    "abbreviation": lambda text: text.replace("assistant", "asst."),
+    "double spaces": lambda text: text.replace(" ", "  "),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sample", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    soc_lookup = SOCLookup()
+    rng = random.Random(args.seed)  # noqa: S311
+    descriptions = [
+        text for text in soc_lookup.data["description"].tolist() if "(" not in text
+    ]
+    sample = rng.sample(descriptions, min(args.sample, len(descriptions)))
+    print(
+        f"{len(soc_lookup.lookup_dict)} exact keys, "
+        f"{len(soc_lookup.normalised_lookup_dict)} normalised keys"
+    )
+    print(f"{'variant':<20}{'before':>10}{'after':>10}{'correct':>10}")
+
+    total = {"before": 0, "after": 0, "queries": 0}
+    start = time.perf_counter()
+    for name, variant in VARIANTS.items():
+        before = after = correct = 0
+        for description in sample:
+            query = variant(description)
+            expected = soc_lookup.lookup_dict[description]
+            before += query.lower() in soc_lookup.lookup_dict
+            code = soc_lookup.lookup(query)["code"]
+            after += code is not None
+            correct += code == expected
+        total["before"] += before
+        total["after"] += after
+        total["queries"] += len(sample)
+        print(
+            f"{name:<20}{before / len(sample):>10.1%}"
+            f"{after / len(sample):>10.1%}{correct / len(sample):>10.1%}"
+        )
+    elapsed = time.perf_counter() - start
+    print(
+        f"{'overall':<20}{total['before'] / total['queries']:>10.1%}"
+        f"{total['after'] / total['queries']:>10.1%}"
+    )
+    print(f"{total['queries'] / elapsed:,.0f} lookups/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Compare Excel engines for loading the SOC coding index.
+
+Writes a synthetic workbook with the coding index layout (100,000 rows by
+default, with the unused columns of the published workbook) and loads it with
+`load_soc_index` using each engine in a fresh process, reporting wall time and
+peak resident memory. The "pandas" engine is the previous loader.
+
+Usage:
+    ```
+    poetry run python benchmarks/excel_ingestion.py --rows 100000
+    ```
+"""
+
+import argparse
+import importlib.util
+import multiprocessing
+import random
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import openpyxl
+
+from occupational_classification.data_access.soc_data_access import (
+    EXCEL_ENGINES,
+    load_soc_index,
+)
+
+COLUMNS = [
+    "INDEXOCC",
+    "ADD",
+    "IND",
+    "SOC_2020",
+    "SOC_2020_EXT",
+    "INDEXOCC_-_natural_word_order",
+    "SOC_2010",
+    "SIC_2007",
+    "DATE",
+    "ACTION",
+    "SOURCE",
+    "NOTES",
+]
+WORDS = ["assistant", "senior", "teacher", "engineer", "manager", "nurse", "cook"]
+
+
+def write_workbook(filepath: Path, rows: int, seed: int = 0):
+    """Writes a synthetic coding index with openpyxl's write-only mode."""
+    rng = random.Random(seed)  # noqa: S311
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet("SOC2020 coding index")
+    sheet.append(COLUMNS)
+    for row in range(rows):
+        title = " ".join(rng.choices(WORDS, k=2))
+        sheet.append(
+            [
+                title.upper(),
+                rng.choice(["nos", "head", None]),
+                rng.choice(["retail", "government", None]),
+                f"{rng.randint(1111, 9269)}",
+                f"{rng.randint(1111, 9269)}/{rng.randint(0, 99):02d}",
+                title,
+                f"{rng.randint(1111, 9269)}",
+                f"{rng.randint(1, 99):02d}",
+                "16/04/2025",
+                rng.choice(["", "Amended", "New"]),
+                "ONS",
+                f"Synthetic row {row}",
+            ]
+        )
+    workbook.save(filepath)
+
+
+def _measure(filepath: str, engine: str, queue):
+    """Loads the index in this process and reports time and memory."""
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    df = load_soc_index(filepath, engine=engine)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((elapsed, baseline, peak, len(df)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+    # ru_maxrss is in bytes on macOS and kilobytes on Linux
+    to_mb = 1 / 2**20 if sys.platform == "darwin" else 1 / 2**10
+
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filepath = Path(tmp_dir) / "coding_index.xlsx"
+        start = time.perf_counter()
+        write_workbook(filepath, args.rows)
+        print(
+            f"wrote {args.rows} rows x {len(COLUMNS)} columns "
+            f"({filepath.stat().st_size / 2**20:.1f} MB) "
+            f"in {time.perf_counter() - start:.1f} s"
+        )
+        print(f"{'engine':<10}{'wall s':>10}{'peak RSS MB':>14}{'increase MB':>14}")
+        for engine in EXCEL_ENGINES:
+            if engine == "calamine" and not importlib.util.find_spec("python_calamine"):
+                print(f"{engine:<10}{'not installed':>38}")
+                continue
+            results = []
+            for _ in range(args.repeats):
+                queue = context.Queue()
+                process = context.Process(
+                    target=_measure, args=(str(filepath), engine, queue)
+                )
+                process.start()
+                results.append(queue.get())
+                process.join()
+            elapsed, baseline, peak, _rows = min(results)
+            print(
+                f"{engine:<10}{elapsed:>10.2f}{peak * to_mb:>14.0f}"
+                f"{(peak - baseline) * to_mb:>14.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
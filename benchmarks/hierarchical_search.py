@@ -0,0 +1,79 @@
+"""Compare coarse-to-fine hierarchical search with a flat BM25 search.
+
+Queries `HierarchicalSearch` at several beam widths and a flat BM25 index
+over the same documents, for unit groups and for the example job titles,
+with titles drawn from the coding index. Reports latency per query, recall
+of the flat top result within the hierarchical top-k, and how often the
+indexed code is in the top-k.
+
+Usage:
+    ```
+    poetry run python benchmarks/hierarchical_search.py --queries 5000
+    ```
+"""
+
+import argparse
+import random
+import time
+
+from occupational_classification.datasets.soc_loader import load_soc_resources
+from occupational_classification.search.soc_hierarchical import (
+    JOB_TITLE_LEVEL,
+    LEVELS,
+    HierarchicalSearch,
+)
+
+
+def _run(search, pairs, top_k):
+    start = time.perf_counter()
+    ranked = [[result["code"] for result in search(query, top_k)] for query, _ in pairs]
+    return (time.perf_counter() - start) / len(pairs), ranked
+
+
+def _report(name, elapsed, ranked, flat_ranked, pairs):
+    with_flat_top = [
+        (flat_codes[0], codes)
+        for flat_codes, codes in zip(flat_ranked, ranked, strict=True)
+        if flat_codes
+    ]
+    recall = sum(flat_top in codes for flat_top, codes in with_flat_top)
+    accuracy = sum(
+        code in codes for (_, code), codes in zip(pairs, ranked, strict=True)
+    )
+    print(
+        f"{name:<24}{elapsed * 1e6:>10.0f}"
+        f"{recall / len(with_flat_top):>10.1%}{accuracy / len(pairs):>10.1%}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queries", type=int, default=5_000)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--beam-widths", type=int, nargs="+", default=[1, 2, 3, 5])
+    args = parser.parse_args()
+
+    resources = load_soc_resources()
+    random.seed(0)
+    items = sorted(resources.lookup.lookup_dict.items())
+    pairs = random.sample(items, min(args.queries, len(items)))
+
+    print(f"{'search':<24}{'us/query':>10}{'recall@k':>10}{'code@k':>10}")
+    for levels in (LEVELS, (*LEVELS, JOB_TITLE_LEVEL)):
+        hierarchical = HierarchicalSearch(resources.hierarchy, levels=levels)
+        flat = hierarchical.indexes[levels[-1]]
+        flat_time, flat_ranked = _run(flat.search, pairs, args.top_k)
+        _report(f"flat {levels[-1]}", flat_time, flat_ranked, flat_ranked, pairs)
+        for beam_width in args.beam_widths:
+            elapsed, ranked = _run(
+                lambda query, top_k, search=hierarchical, beam_width=beam_width: (
+                    search.search(query, top_k, beam_width=beam_width)
+                ),
+                pairs,
+                args.top_k,
+            )
+            _report(f"  beam {beam_width}", elapsed, ranked, flat_ranked, pairs)
+
+
+if __name__ == "__main__":
+    main()
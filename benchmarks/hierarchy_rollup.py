@@ -0,0 +1,65 @@
+"""Time `SOC.rollup` against per-record `find_parent` calls.
+
+Records are drawn at random from the unit groups of the SOC hierarchy.
+
+Usage:
+    ```
+    poetry run python benchmarks/hierarchy_rollup.py --records 20000000
+    ```
+"""
+
+import argparse
+import time
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from occupational_classification.datasets.soc_loader import load_soc_resources
+from occupational_classification.hierarchy.soc_hierarchy import find_parent
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=20_000_000)
+    parser.add_argument("--loop-records", type=int, default=200_000)
+    args = parser.parse_args()
+
+    hierarchy = load_soc_resources().hierarchy
+    units = [node.soc_code for node in hierarchy.nodes if node.group_level == "Unit"]
+    rng = np.random.default_rng(0)
+    codes = pd.Series(rng.choice(units, args.records))
+    weights = rng.random(args.records)
+
+    for label, values in (("object", codes), ("categorical", codes.astype("category"))):
+        start = time.perf_counter()
+        hierarchy.rollup(values)
+        counts = time.perf_counter() - start
+        start = time.perf_counter()
+        hierarchy.rollup(values, weights=weights)
+        summed = time.perf_counter() - start
+        start = time.perf_counter()
+        hierarchy.rollup(values, weights=weights, aggfunc="mean")
+        mean = time.perf_counter() - start
+        print(
+            f"rollup {args.records:,} {label} codes: counts {counts:.2f} s, "
+            f"weight sum {summed:.2f} s, weight mean {mean:.2f} s"
+        )
+
+    start = time.perf_counter()
+    counter: Counter = Counter()
+    for code in codes[: args.loop_records]:
+        group = code
+        while group is not None:
+            counter[group] += 1
+            group = find_parent(group)
+    elapsed = time.perf_counter() - start
+    print(
+        f"find_parent loop: {args.loop_records:,} codes in {elapsed:.2f} s "
+        f"({elapsed / args.loop_records * args.records:.0f} s projected for "
+        f"{args.records:,})"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Time repeated calls of the SOC hierarchy leaf group views.
+
+The first call of each view builds it, later calls reuse the cached view.
+The "rebuilt" rows invalidate the cache before every call, which is what
+each call cost before the views were cached.
+
+Usage:
+    ```
+    poetry run python benchmarks/leaf_views.py --calls 200
+    ```
+"""
+
+import argparse
+import time
+
+from occupational_classification.datasets.soc_loader import load_soc_resources
+
+
+def _time_calls(hierarchy, view, calls, invalidate):
+    start = time.perf_counter()
+    for _ in range(calls):
+        if invalidate:
+            hierarchy.invalidate_views()
+        view()
+    return (time.perf_counter() - start) / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    hierarchy = load_soc_resources().hierarchy
+    views = {
+        "all_leaf_text": hierarchy.all_leaf_text,
+        "all_group_job_titles": lambda: list(hierarchy.all_group_job_titles()),
+        "group_columns": lambda: hierarchy.group_columns("job_titles"),
+    }
+    print(f"{'view':<22}{'rebuilt ms':>12}{'cached ms':>12}{'speed up':>10}")
+    for name, view in views.items():
+        rebuilt = _time_calls(hierarchy, view, args.calls, invalidate=True)
+        view()
+        cached = _time_calls(hierarchy, view, args.calls, invalidate=False)
+        print(
+            f"{name:<22}{rebuilt * 1000:>12.3f}{cached * 1000:>12.3f}"
+            f"{rebuilt / cached:>9.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+"""Load test SOCLookup and SOCRephraseLookup with a synthetic query stream.
+
+Derives distinct queries from the coding index itself: exact titles, case
+and punctuation variants, titles with a misspelt word, titles inside a
+free-text sentence and unknown words, plus rephrase requests for known and
+unknown codes. Requests repeat the distinct queries with a Zipf-like
+distribution (the query of rank r is drawn with weight 1 / r ** s), as
+common job titles dominate real traffic. A share of lookups asks for the
+similarity search as well.
+
+The stream is replayed single-threaded, on threads sharing frozen lookups
+and on processes each holding their own lookups, and each run reports
+throughput, p50/p95/p99 latency and failed requests per request kind, to
+size the number of workers for a target load. Threads only scale on
+free-threaded CPython builds; processes pay the load of the resources once
+each, which `--artefact` (see `save_soc_artefact`) shortens.
+
+Usage:
+    ```
+    poetry run python benchmarks/load_test.py --requests 100000 --workers 1 2 4
+    ```
+"""
+
+import argparse
+import os
+import random
+import string
+import sys
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+
+import numpy as np
+from spelling_correction import misspell
+
+from occupational_classification.datasets.soc_artefact import load_soc_artefact
+from occupational_classification.datasets.soc_loader import load_soc_resources
+
+KINDS = ("exact", "variant", "typo", "sentence", "unknown", "rephrase")
+SENTENCES = (
+    "I work as a {} for the council",
+    "{}, part time",
+    "self employed {} in construction",
+    "my main job is {} on nights",
+)
+
+# Lookups of the worker process, set by `_init_process`
+_lookups: Optional[tuple] = None
+
+
+def _load_resources(artefact: Optional[str]):
+    if artefact is not None:
+        return load_soc_artefact(artefact)
+    return load_soc_resources()
+
+
+def _variant(title: str, rng: random.Random) -> str:
+    """Changes the case and punctuation of a title."""
+    words = title.split()
+    case = rng.choice((str.upper, str.title, str.capitalize))
+    separator = rng.choice((" ", "  ", " - ", ", "))
+    return case(separator.join(words)) + rng.choice(("", ".", " "))
+
+
+def make_queries(resources, n_distinct: int, rng: random.Random) -> list[tuple]:
+    """Returns distinct (kind, query) pairs, the same number of each kind."""
+    titles = sorted(resources.lookup.lookup_dict)
+    codes = sorted(resources.rephrase_lookup.lookup_dict)
+    per_kind = n_distinct // len(KINDS)
+    queries = []
+    for title in rng.choices(titles, k=per_kind):
+        queries.append(("exact", title))
+    for title in rng.choices(titles, k=per_kind):
+        queries.append(("variant", _variant(title, rng)))
+    for title in rng.choices(titles, k=per_kind):
+        words = title.split()
+        pos = max(range(len(words)), key=lambda pos: len(words[pos]))
+        words[pos] = misspell(words[pos], rng.randint(1, 2), rng)
+        queries.append(("typo", " ".join(words)))
+    for title in rng.choices(titles, k=per_kind):
+        queries.append(("sentence", rng.choice(SENTENCES).format(title)))
+    for _ in range(per_kind):
+        word = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(5, 12)))
+        queries.append(("unknown", word))
+    for _ in range(per_kind):
+        # One in ten rephrase requests is for a code which does not exist
+        unknown = rng.random() < 0.1  # noqa: PLR2004
+        code = f"{rng.randint(0, 9)}999" if unknown else rng.choice(codes)
+        queries.append(("rephrase", code))
+    # Ranks are shuffled so that every kind has popular queries
+    rng.shuffle(queries)
+    return queries
+
+
+def make_stream(
+    queries: list[tuple],
+    n_requests: int,
+    zipf_s: float,
+    similarity_share: float,
+    rng: random.Random,
+) -> list[tuple]:
+    """Draws (kind, query, similarity) requests with Zipf-like repeats."""
+    weights = np.cumsum(1 / np.arange(1, len(queries) + 1) ** zipf_s).tolist()
+    stream = []
+    for kind, query in rng.choices(queries, cum_weights=weights, k=n_requests):
+        similarity = kind != "rephrase" and rng.random() < similarity_share
+        stream.append((kind, query, similarity))
+    return stream
+
+
+def run_requests(lookups: tuple, requests: list[tuple]) -> list[tuple]:
+    """Runs requests one after the other, returning (kind, seconds, failed)
+    triples; requests raising an exception count as failed.
+    """
+    lookup, rephrase_lookup = lookups
+    timings = []
+    for kind, query, similarity in requests:
+        failed = False
+        start = time.perf_counter()
+        try:
+            if kind == "rephrase":
+                rephrase_lookup.lookup(query)
+            else:
+                lookup.lookup(query, similarity=similarity, limit=20)
+        except Exception:  # pylint: disable=broad-exception-caught
+            failed = True
+        seconds = time.perf_counter() - start
+        timings.append(("similarity" if similarity else kind, seconds, failed))
+    return timings
+
+
+def _init_process(artefact: Optional[str]):
+    global _lookups  # noqa: PLW0603 pylint: disable=global-statement
+    resources = _load_resources(artefact)
+    _lookups = (resources.lookup.freeze(), resources.rephrase_lookup.freeze())
+
+
+def _run_in_process(requests: list[tuple]) -> list[tuple]:
+    return run_requests(_lookups, requests)
+
+
+def _chunks(stream: list[tuple], n_chunks: int) -> list[list[tuple]]:
+    return [stream[pos::n_chunks] for pos in range(n_chunks)]
+
+
+def report(mode: str, workers: int, timings: list[tuple], elapsed: float):
+    """Prints throughput, latency percentiles and failures, overall and per
+    kind.
+    """
+    by_kind = defaultdict(list)
+    failures: Counter = Counter()
+    for kind, seconds, failed in timings:
+        for key in (kind, "all"):
+            by_kind[key].append(seconds)
+            failures[key] += failed
+    print(f"{mode} x{workers}: {len(timings) / elapsed:,.0f} requests/s")
+    for kind in ("all", *KINDS, "similarity"):
+        if kind not in by_kind:
+            continue
+        p50, p95, p99 = np.percentile(by_kind[kind], [50, 95, 99]) * 1e6
+        print(
+            f"  {kind:<11}{len(by_kind[kind]):>9,}{p50:>10,.0f}"
+            f"{p95:>10,.0f}{p99:>10,.0f}{failures[kind]:>9,}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=100_000)
+    parser.add_argument("--distinct", type=int, default=20_000)
+    parser.add_argument("--zipf", type=float, default=1.1)
+    parser.add_argument("--similarity-share", type=float, default=0.01)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        choices=["single", "threads", "processes"],
+        default=["single", "threads", "processes"],
+    )
+    parser.add_argument("--artefact", help="Load resources from an artefact")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    resources = _load_resources(args.artefact)
+    print(f"Loaded resources in {time.perf_counter() - start:.2f} s")
+    lookups = (resources.lookup.freeze(), resources.rephrase_lookup.freeze())
+
+    rng = random.Random(0)  # noqa: S311
+    queries = make_queries(resources, args.distinct, rng)
+    stream = make_stream(queries, args.requests, args.zipf, args.similarity_share, rng)
+    print(
+        f"{len(stream):,} requests over {len(set(stream)):,} distinct, "
+        f"zipf s={args.zipf}, similarity share {args.similarity_share:.0%}"
+    )
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(
+        f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}, "
+        f"{os.cpu_count()} CPUs"
+    )
+    print(
+        f"  {'kind':<11}{'requests':>9}{'p50 us':>10}{'p95 us':>10}{'p99 us':>10}{'failed':>9}"
+    )
+
+    if "single" in args.modes:
+        start = time.perf_counter()
+        timings = run_requests(lookups, stream)
+        report("single", 1, timings, time.perf_counter() - start)
+
+    for workers in args.workers:
+        if "threads" in args.modes:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                start = time.perf_counter()
+                results = executor.map(
+                    lambda chunk: run_requests(lookups, chunk),
+                    _chunks(stream, workers),
+                )
+                timings = [timing for result in results for timing in result]
+                report("threads", workers, timings, time.perf_counter() - start)
+        if "processes" in args.modes:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_process,
+                initargs=(args.artefact,),
+            ) as executor:
+                # Start the processes and warm their caches before timing
+                list(executor.map(_run_in_process, _chunks(stream[:10_000], workers)))
+                start = time.perf_counter()
+                results = executor.map(_run_in_process, _chunks(stream, workers))
+                timings = [timing for result in results for timing in result]
+                report("processes", workers, timings, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
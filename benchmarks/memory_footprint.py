@@ -0,0 +1,31 @@
+"""Report the memory held by the loaded SOC index, metadata and hierarchy.
+
+Loads the resources with `load_soc_resources` and prints `memory_report`,
+with shared objects counted once.
+
+Usage:
+    ```
+    poetry run python benchmarks/memory_footprint.py
+    ```
+"""
+
+import argparse
+
+from occupational_classification.datasets.soc_loader import load_soc_resources
+from occupational_classification.utils.memory import memory_report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.parse_args()
+
+    resources = load_soc_resources()
+    report = memory_report(
+        lookup=resources.lookup, meta=resources.meta, hierarchy=resources.hierarchy
+    )
+    for component, size in report.items():
+        print(f"{component:<12}{size / 2**20:>10.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
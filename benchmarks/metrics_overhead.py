@@ -0,0 +1,58 @@
+"""Measure the cost of recording metrics on exact lookups.
+
+Times `SOCLookup.lookup` over coding index titles with metrics disabled and
+enabled, then prints the recorded latency percentiles and an excerpt of the
+Prometheus export.
+
+Usage:
+    ```
+    poetry run python benchmarks/metrics_overhead.py --lookups 200000
+    ```
+"""
+
+import argparse
+import random
+import time
+
+from occupational_classification.lookup.soc_lookup import SOCLookup
+from occupational_classification.utils.metrics import (
+    OPERATION_SECONDS,
+    disable_metrics,
+    enable_metrics,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lookups", type=int, default=200_000)
+    args = parser.parse_args()
+
+    soc_lookup = SOCLookup()
+    rng = random.Random(0)  # noqa: S311
+    titles = rng.choices(sorted(soc_lookup.lookup_dict), k=args.lookups)
+
+    timings = {}
+    for label in ("disabled", "enabled", "disabled again"):
+        if label == "enabled":
+            metrics = enable_metrics()
+        else:
+            disable_metrics()
+        start = time.perf_counter()
+        for title in titles:
+            soc_lookup.lookup(title)
+        timings[label] = (time.perf_counter() - start) / args.lookups
+        print(f"metrics {label:<15}{timings[label] * 1e6:8.2f} µs per lookup")
+    disabled = (timings["disabled"] + timings["disabled again"]) / 2
+    print(f"overhead {(timings['enabled'] - disabled) * 1e6:.2f} µs per lookup")
+
+    series = metrics.to_dict()[OPERATION_SECONDS]["series"][0]
+    print(
+        f"recorded {series['count']:,} lookups: p50 {series['p50'] * 1e6:.1f} µs, "
+        f"p95 {series['p95'] * 1e6:.1f} µs, p99 {series['p99'] * 1e6:.1f} µs"
+    )
+    lines = metrics.to_prometheus().splitlines()
+    print("\n".join([*lines[:3], "...", *lines[-4:]]))
+
+
+if __name__ == "__main__":
+    main()
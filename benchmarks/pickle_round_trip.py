@@ -0,0 +1,65 @@
+"""Measure the pickled size and round trip time of the SOC objects.
+
+Pickles the lookups, the metadata and the hierarchy (after building its
+leaf group views, as searches do), their frozen snapshots and the whole
+`SocResources`, as when sending them to worker processes or broadcasting
+them to a cluster, and reports the bytes and the best dump and load times.
+Objects which cannot be pickled are reported with their error.
+
+Usage:
+    ```
+    poetry run python benchmarks/pickle_round_trip.py --repeat 5
+    ```
+"""
+
+import argparse
+import pickle
+import time
+
+from occupational_classification.datasets.soc_loader import load_soc_resources
+
+
+def round_trip(value, repeat: int) -> tuple[int, float, float]:
+    """Returns the pickled size and the best dump and load seconds."""
+    dumps = loads = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        dumped = time.perf_counter()
+        pickle.loads(data)  # noqa: S301
+        dumps = min(dumps, dumped - start)
+        loads = min(loads, time.perf_counter() - dumped)
+    return len(data), dumps, loads
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    resources = load_soc_resources()
+    resources.hierarchy.all_leaf_text()
+    corrected = load_soc_resources().lookup
+    corrected.enable_spelling_correction()
+    objects = {
+        "SOCLookup": resources.lookup,
+        "SOCLookup + spelling": corrected,
+        "FrozenSOCLookup": resources.lookup.freeze(),
+        "SOCRephraseLookup": resources.rephrase_lookup,
+        "SocMeta": resources.meta,
+        "SOC": resources.hierarchy,
+        "FrozenSOC": resources.hierarchy.freeze(),
+        "SocResources": resources,
+    }
+    print(f"{'object':<22}{'MB':>8}{'dump ms':>10}{'load ms':>10}")
+    for name, value in objects.items():
+        try:
+            size, dumps, loads = round_trip(value, args.repeat)
+        except (pickle.PicklingError, TypeError, AttributeError) as error:
+            print(f"{name:<22}  {type(error).__name__}: {error}")
+            continue
+        print(f"{name:<22}{size / 1e6:>8.2f}{dumps * 1000:>10.1f}{loads * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Compare full and paged similarity lookups.
+
+Times `SOCLookup.lookup(..., similarity=True)` for short, broad queries with
+every match returned and with a first page of `--limit` descriptions.
+
+Usage:
+    ```
+    poetry run python benchmarks/similarity_pagination.py --limit 20
+    ```
+"""
+
+import argparse
+import json
+import time
+
+from occupational_classification.lookup.soc_lookup import SOCLookup
+
+
+def _time(function, repeat: int) -> tuple[float, dict]:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = function()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--queries", nargs="+", default=["a", "er", "manager"])
+    args = parser.parse_args()
+
+    soc_lookup = SOCLookup()
+    print(
+        f"{'query':<10}{'full ms':>10}{'full KB':>10}{'paged ms':>10}{'paged KB':>10}"
+    )
+    for query in args.queries:
+        full_time, full = _time(
+            lambda query=query: soc_lookup.lookup(query, similarity=True), args.repeat
+        )
+        paged_time, paged = _time(
+            lambda query=query: soc_lookup.lookup(
+                query, similarity=True, limit=args.limit
+            ),
+            args.repeat,
+        )
+        print(
+            f"{query:<10}{full_time * 1000:>10.2f}"
+            f"{len(json.dumps(full)) / 1024:>10.1f}"
+            f"{paged_time * 1000:>10.2f}"
+            f"{len(json.dumps(paged)) / 1024:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Measure spelling correction speed and how many misspelt titles it rescues.
+
+Builds a `SpellingCorrector` over the words of the coding index, misspells
+index words and titles with one or two random edits (deletion, insertion,
+substitution or transposition), then reports corrections per second, the
+share of words corrected back to the original and the exact hit rate of
+misspelt titles with and without correction.
+
+Usage:
+    ```
+    poetry run python benchmarks/spelling_correction.py --words 20000
+    ```
+"""
+
+import argparse
+import random
+import string
+import time
+
+from occupational_classification.lookup.soc_lookup import SOCLookup
+from occupational_classification.utils.spelling import SpellingCorrector
+
+
+def misspell(word: str, edits: int, rng: random.Random) -> str:
+    """Applies random single character edits to a word."""
+    for _ in range(edits):
+        pos = rng.randrange(len(word))
+        kind = rng.randrange(4)
+        letter = rng.choice(string.ascii_lowercase)
+        if kind == 0 and len(word) > 1:
+            word = word[:pos] + word[pos + 1 :]
+        elif kind == 1:
+            word = word[:pos] + letter + word[pos:]
+        elif kind == 2:  # noqa: PLR2004
+            word = word[:pos] + letter + word[pos + 1 :]
+        elif pos + 1 < len(word):
+            word = word[:pos] + word[pos + 1] + word[pos] + word[pos + 2 :]
+    return word
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, default=20_000)
+    parser.add_argument("--titles", type=int, default=5_000)
+    parser.add_argument("--max-edits", type=int, default=2)
+    args = parser.parse_args()
+
+    soc_lookup = SOCLookup()
+    start = time.perf_counter()
+    corrector = SpellingCorrector.from_lookup(soc_lookup)
+    build_time = time.perf_counter() - start
+    print(
+        f"{len(corrector):,} words, {len(corrector.deletes):,} deletions, "
+        f"built in {build_time:.2f} s"
+    )
+
+    rng = random.Random(0)  # noqa: S311
+    vocabulary = sorted(
+        word for word in corrector.frequencies if len(word) >= corrector.min_length
+    )
+    originals = rng.choices(vocabulary, k=args.words)
+    misspelt = [
+        misspell(word, rng.randint(1, args.max_edits), rng) for word in originals
+    ]
+    start = time.perf_counter()
+    corrected = [corrector.correct_word(word) for word in misspelt]
+    elapsed = time.perf_counter() - start
+    fixed = sum(
+        fix == original for fix, original in zip(corrected, originals, strict=True)
+    )
+    print(
+        f"{args.words / elapsed:,.0f} corrections/s, "
+        f"{fixed / args.words:.1%} back to the original word"
+    )
+    for word in ("acountant", "electrican"):
+        print(f"  {word} -> {corrector.correct_word(word)}")
+
+    titles = rng.sample(sorted(soc_lookup.lookup_dict), args.titles)
+    queries = []
+    for title in titles:
+        words = title.split()
+        pos = rng.randrange(len(words))
+        if len(words[pos]) >= corrector.min_length:
+            words[pos] = misspell(words[pos], 1, rng)
+        queries.append(" ".join(words))
+    without = sum(soc_lookup.match_code(query) is not None for query in queries)
+    soc_lookup.enable_spelling_correction(corrector)
+    start = time.perf_counter()
+    with_correction = sum(soc_lookup.match_code(query) is not None for query in queries)
+    elapsed = time.perf_counter() - start
+    print(
+        f"misspelt titles matched: {without / args.titles:.1%} without, "
+        f"{with_correction / args.titles:.1%} with correction "
+        f"({args.titles / elapsed:,.0f} lookups/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Compare start up time of the SOC lookups and hierarchy.
+
+"separate" builds each object on its own, as services did before
+`load_soc_resources` (each reads the workbooks it needs). The other rows use
+`load_soc_resources` with each executor. Every run is in a fresh process so
+that imports and caches do not carry over.
+
+Usage:
+    ```
+    poetry run python benchmarks/startup_time.py --engine openpyxl --repeats 3
+    ```
+"""
+
+import argparse
+import multiprocessing
+import time
+
+from occupational_classification._config.main import get_config
+from occupational_classification.data_access.soc_data_access import (
+    load_soc_index,
+    load_soc_structure,
+)
+from occupational_classification.datasets.soc_loader import (
+    EXECUTORS,
+    load_soc_resources,
+)
+from occupational_classification.hierarchy.soc_hierarchy import load_hierarchy
+from occupational_classification.lookup.soc_lookup import SOCLookup, SOCRephraseLookup
+from occupational_classification.meta.soc_meta import SocDB
+
+
+def _separate(engine):
+    """Builds each object independently, as in notebooks/soc_2025_05_01.py."""
+    data_source = get_config()["data_source"]
+    SOCLookup(soc_index=load_soc_index(data_source["soc_index"], engine=engine))
+    SOCRephraseLookup()
+    soc_df = SocDB.create_soc_dataframe(
+        load_soc_structure(data_source["soc_structure"], engine=engine)
+    )
+    load_hierarchy(soc_df, load_soc_index(data_source["soc_index"], engine=engine))
+
+
+def _run(mode, engine, queue):
+    start = time.perf_counter()
+    if mode == "separate":
+        _separate(engine)
+    else:
+        load_soc_resources(executor=mode, engine=engine)
+    queue.put(time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--engine", default=None)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    print(f"{'mode':<12}{'best s':>10}{'mean s':>10}")
+    for mode in ("separate", *EXECUTORS):
+        timings = []
+        for _ in range(args.repeats):
+            queue = context.Queue()
+            process = context.Process(target=_run, args=(mode, args.engine, queue))
+            process.start()
+            timings.append(queue.get())
+            process.join()
+        print(f"{mode:<12}{min(timings):>10.3f}{sum(timings) / len(timings):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Compare the similarity scan with the suffix array substring index.
+
+Draws random queries, mostly substrings of coding index descriptions plus
+some random letters which match nothing, then times
+`SOCLookup.similar_descriptions` scanning the index with
+`pd.Series.str.contains` against the same searches answered by the
+`SubstringIndex`, and checks that both return the same output.
+
+Usage:
+    ```
+    poetry run python benchmarks/substring_search.py --queries 10000
+    ```
+"""
+
+import argparse
+import random
+import string
+import time
+
+from occupational_classification.lookup.soc_lookup import SOCLookup
+from occupational_classification.lookup.soc_substring import is_literal
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queries", type=int, default=10_000)
+    args = parser.parse_args()
+
+    soc_lookup = SOCLookup()
+    rng = random.Random(0)  # noqa: S311
+    descriptions = [
+        description
+        for description in soc_lookup.data["description"].tolist()
+        if isinstance(description, str) and description
+    ]
+    queries = []
+    while len(queries) < args.queries:
+        if rng.random() < 0.9:  # noqa: PLR2004
+            description = rng.choice(descriptions)
+            start = rng.randrange(len(description))
+            query = description[start : start + rng.randint(3, 15)]
+        else:
+            query = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 8)))
+        if is_literal(query):
+            queries.append(query)
+
+    start = time.perf_counter()
+    scanned = [soc_lookup.similar_descriptions(query) for query in queries]
+    scan_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = soc_lookup.enable_substring_index()
+    build_time = time.perf_counter() - start
+    start = time.perf_counter()
+    indexed = [soc_lookup.similar_descriptions(query) for query in queries]
+    index_time = time.perf_counter() - start
+
+    same = sum(a == b for a, b in zip(scanned, indexed, strict=True))
+    print(
+        f"{len(index):,} descriptions, {len(index.text):,} characters, "
+        f"index built in {build_time:.2f} s"
+    )
+    print(
+        f"{args.queries:,} queries: scan {scan_time / args.queries * 1e3:.2f} ms, "
+        f"index {index_time / args.queries * 1e3:.2f} ms per query "
+        f"({scan_time / index_time:.1f}x)"
+    )
+    print(f"same output for {same / args.queries:.2%} of queries")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Measure lookup throughput of a frozen SOCLookup across threads.
+
+Runs `FrozenSOCLookup.lookup_many` with 1, 2, 4 and 8 threads, for exact
+lookups and for paged similarity lookups, on titles drawn from the index.
+Threads only scale on free-threaded CPython builds (or where the work
+releases the GIL); the GIL state is printed.
+
+Usage:
+    ```
+    poetry run python benchmarks/thread_scaling.py --exact 200000 --similar 2000
+    ```
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from occupational_classification.lookup.soc_lookup import SOCLookup
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--exact", type=int, default=200_000)
+    parser.add_argument("--similar", type=int, default=2_000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    frozen = SOCLookup().freeze()
+    titles = list(frozen.lookup_dict)
+    random.seed(0)
+    exact = random.choices(titles, k=args.exact)  # noqa: S311
+    sample = random.choices(titles, k=args.similar)  # noqa: S311
+    # Short fragments of titles, which match many rows
+    similar = [title[:4] for title in sample]
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    print(f"{'threads':>8}{'exact/s':>12}{'similar/s':>12}")
+    for threads in args.threads:
+        start = time.perf_counter()
+        frozen.lookup_many(exact, max_workers=threads, chunk_size=1024)
+        exact_rate = len(exact) / (time.perf_counter() - start)
+        start = time.perf_counter()
+        frozen.lookup_many(similar, similarity=True, limit=20, max_workers=threads)
+        similar_rate = len(similar) / (time.perf_counter() - start)
+        print(f"{threads:>8}{exact_rate:>12,.0f}{similar_rate:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
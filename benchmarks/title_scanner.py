@@ -0,0 +1,90 @@
+"""Time the title scanner on long free-text answers.
+
+Builds sentences which embed one or two coding index titles among filler
+words, then times `TitleScanner.scan` against probing every run of words
+(up to the longest title) in the normalised lookup dictionary, and checks
+that the scanner finds the embedded titles.
+
+Usage:
+    ```
+    poetry run python benchmarks/title_scanner.py --answers 10000
+    ```
+"""
+
+import argparse
+import random
+import time
+
+from occupational_classification.lookup.soc_lookup import SOCLookup
+from occupational_classification.lookup.soc_scanner import TitleScanner
+
+FILLER = [
+    "i", "have", "been", "working", "as", "a", "for", "the", "last", "few",
+    "years", "at", "our", "local", "in", "the", "city", "mainly", "on",
+    "shifts", "and", "before", "that", "was", "part", "time", "while",
+]  # fmt: skip
+
+
+def probe_ngrams(soc_lookup: SOCLookup, text: str, max_words: int) -> list[str]:
+    """Looks up every run of up to `max_words` normalised words."""
+    words = soc_lookup.normaliser(text).split()
+    return [
+        code
+        for first in range(len(words))
+        for end in range(first + 1, min(first + max_words, len(words)) + 1)
+        if (code := soc_lookup.normalised_lookup_dict.get(" ".join(words[first:end])))
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--answers", type=int, default=10_000)
+    parser.add_argument("--filler-words", type=int, default=20)
+    args = parser.parse_args()
+
+    soc_lookup = SOCLookup()
+    start = time.perf_counter()
+    scanner = TitleScanner.from_lookup(soc_lookup)
+    print(f"{len(scanner):,} titles compiled in {time.perf_counter() - start:.2f} s")
+
+    rng = random.Random(0)  # noqa: S311
+    titles = sorted(soc_lookup.lookup_dict)
+    answers = []
+    embedded = []
+    for _ in range(args.answers):
+        chosen = rng.sample(titles, rng.randint(1, 2))
+        words = rng.choices(FILLER, k=args.filler_words)
+        for title in chosen:
+            words.insert(rng.randrange(len(words) + 1), title)
+        answers.append(" ".join(words))
+        embedded.append(chosen)
+    n_chars = sum(map(len, answers))
+
+    start = time.perf_counter()
+    scanned = [scanner.scan(answer) for answer in answers]
+    scan_time = time.perf_counter() - start
+    max_words = max(len(title.split()) for title in scanner.titles)
+    start = time.perf_counter()
+    for answer in answers:
+        probe_ngrams(soc_lookup, answer, max_words)
+    probe_time = time.perf_counter() - start
+
+    found = sum(
+        {soc_lookup.lookup_dict[title] for title in chosen}
+        <= {match["code"] for match in matches}
+        for chosen, matches in zip(embedded, scanned, strict=True)
+    )
+    print(f"{args.answers:,} answers, {n_chars / args.answers:.0f} characters each")
+    print(
+        f"scanner {args.answers / scan_time:,.0f} answers/s "
+        f"({n_chars / scan_time / 1e6:.1f} M characters/s)"
+    )
+    print(
+        f"n-gram probing (up to {max_words} words) "
+        f"{args.answers / probe_time:,.0f} answers/s"
+    )
+    print(f"embedded titles found in {found / args.answers:.1%} of answers")
+
+
+if __name__ == "__main__":
+    main()
@@ -68,10 +68,51 @@ def check_file_exists(  # noqa: PLR0911
     return None
 
 
+def load_config(config_name: Optional[Union[Path, str]] = "config.toml") -> dict:
+    """Loads a configuration file, without caching it.
+
+    Data source paths are resolved with `check_file_exists`. Use this to load
+    the configuration of another dataset side by side with the one returned
+    by `get_config`.
+
+    Args:
+        config_name (Path or str, optional): The name of the config file to load.
+            Defaults to relative path "config.toml", looked up as in
+            `check_file_exists`.
+
+    Returns:
+        dict: Configuration for the system.
+
+    Raises:
+        FileNotFoundError: If the config file or required data not found.
+    """
+    config_filepath = check_file_exists(config_name)
+
+    if config_filepath is None:
+        raise FileNotFoundError("Config file not found.")
+    with open(config_filepath) as f:
+        logger.info(f"Loading config from {config_filepath}")
+        in_config = toml.load(f)
+    for key, soc_data in in_config["data_source"].items():
+        soc_data_path = check_file_exists(soc_data)
+        if soc_data_path is None:
+            if key in ["soc_index", "soc_structure"]:
+                raise FileNotFoundError(
+                    f"Required soc_data file {key}: {soc_data} not found."
+                )
+            else:
+                logger.warning(f"Optional lookup file {key}: {soc_data} not found.")
+        else:
+            in_config["data_source"][key] = soc_data_path
+    logger.debug(f"Config values: {in_config}")
+    return in_config
+
+
 def get_config(config_name: Optional[Union[Path, str]] = "config.toml") -> dict:
     """Fetch the configuration.
 
-    Loads config from the filepath defined in `CONFIG_FILEPATH`.
+    Loads config from the filepath defined in `CONFIG_FILEPATH` once, then
+    returns the same configuration on every call (see `load_config`).
 
     Args:
         config_name (Path or str, optional): The name of the config file to load.
@@ -88,28 +129,6 @@ def get_config(config_name: Optional[Union[Path, str]] = "config.toml") -> dict:
     global _config  # noqa: PLW0603
 
     if _config is None:
-        config_filepath = check_file_exists(config_name)
-
-        if config_filepath is None:
-            raise FileNotFoundError("Config file not found.")
-        else:
-            with open(config_filepath) as f:
-                logger.info(f"Loading config from {config_filepath}")
-                in_config = toml.load(f)
-            for key, soc_data in in_config["data_source"].items():
-                soc_data_path = check_file_exists(soc_data)
-                if soc_data_path is None:
-                    if key in ["soc_index", "soc_structure"]:
-                        raise FileNotFoundError(
-                            f"Required soc_data file {key}: {soc_data} not found."
-                        )
-                    else:
-                        logger.warning(
-                            f"Optional lookup file {key}: {soc_data} not found."
-                        )
-                else:
-                    in_config["data_source"][key] = soc_data_path
-            _config = in_config
-            logger.debug(f"Config values: {_config}")
+        _config = load_config(config_name)
 
     return _config
@@ -0,0 +1,50 @@
+"""Provide data access for condensed classification files.
+
+A condensed file lists one group per line as "code: title", for example the
+packaged `example_data/soc_4d_condensed.txt` and
+`example_data/coicop_5d_condensed.txt`. Reading them needs neither pandas nor
+openpyxl.
+"""
+
+from pathlib import Path
+from typing import Union
+
+
+def parse_condensed_lines(lines: list[str]) -> dict[str, str]:
+    """Parses "code: title" lines into a dictionary.
+
+    Blank lines are skipped. Leading and trailing whitespace is removed from
+    both the code and the title.
+
+    Args:
+        lines (list[str]): Lines of a condensed classification file.
+
+    Returns:
+        dict[str, str]: A dictionary mapping codes to titles, in file order.
+
+    Raises:
+        ValueError: If a line has no ":" separator, or an empty code.
+    """
+    code_titles: dict[str, str] = {}
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        code, separator, title = line.partition(":")
+        code = code.strip()
+        if not separator or not code:
+            raise ValueError(f"Line {line_number} is not in 'code: title' format.")
+        code_titles[code] = title.strip()
+    return code_titles
+
+
+def load_condensed_classification(filepath: Union[Path, str]) -> dict[str, str]:
+    """Load a condensed classification file.
+
+    Args:
+        filepath (Path or str): A path to the file with "code: title" lines.
+
+    Returns:
+        dict[str, str]: A dictionary mapping codes to titles, in file order.
+    """
+    text = Path(filepath).read_text(encoding="utf-8")
+    return parse_condensed_lines(text.splitlines())
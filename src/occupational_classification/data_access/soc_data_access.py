@@ -1,10 +1,120 @@
 """Provide data access for key files.
 
 Filepaths are provided in config: "src.occupational_classification._config".
+
+Workbooks are read with `read_excel_columns`, which only materialises the
+columns that are needed. The fastest available engine is used:
+    - "calamine": pandas with the Rust based python-calamine reader, when
+      installed (`pip install python-calamine`),
+    - "openpyxl": openpyxl in read-only mode, streaming the sheet row by row.
+calamine is by far the fastest but holds the whole sheet while parsing; pass
+`engine="openpyxl"` where the lowest peak memory matters more than time.
 """
 
+import importlib.util
+from typing import Optional
+
 import pandas as pd
 
+EXCEL_ENGINES = ("calamine", "openpyxl", "pandas")
+
+
+def default_excel_engine() -> str:
+    """Returns the fastest Excel engine available.
+
+    Returns:
+        str: "calamine" if python-calamine is installed, else "openpyxl".
+    """
+    if importlib.util.find_spec("python_calamine") is not None:
+        return "calamine"
+    return "openpyxl"
+
+
+def _stream_excel_columns(
+    filepath: str, sheet_name: str, usecols: list[str]
+) -> pd.DataFrame:
+    """Streams the selected columns of a sheet using openpyxl in read-only mode.
+
+    Only the values of the selected columns are kept, converted to strings.
+    Empty cells become missing values and trailing empty rows are dropped,
+    as with `pd.read_excel`.
+    """
+    # Imported here so that modules which never read Excel do not load openpyxl
+    import openpyxl  # noqa: PLC0415 pylint: disable=import-outside-toplevel
+
+    workbook = openpyxl.load_workbook(filepath, read_only=True, data_only=True)
+    try:
+        rows = workbook[sheet_name].iter_rows(values_only=True)
+        header = list(next(rows, ()))
+        missing = [col for col in usecols if col not in header]
+        if missing:
+            raise ValueError(
+                f"Usecols do not match columns, columns expected but not found: {missing}"
+            )
+        positions = [header.index(col) for col in usecols]
+        last_position = max(positions, default=-1)
+
+        columns: list[list[Optional[str]]] = [[] for _ in usecols]
+        n_rows = 0
+        for row in rows:
+            if len(row) > last_position:
+                values = [row[pos] for pos in positions]
+            else:
+                values = [row[pos] if pos < len(row) else None for pos in positions]
+            for column, value in zip(columns, values, strict=True):
+                column.append(None if value is None else str(value))
+            if any(value is not None for value in values):
+                n_rows = len(columns[0])
+    finally:
+        workbook.close()
+
+    return pd.DataFrame(
+        {col: column[:n_rows] for col, column in zip(usecols, columns, strict=True)},
+        dtype=str,
+    )
+
+
+def read_excel_columns(
+    filepath: str,
+    sheet_name: str,
+    usecols: list[str],
+    engine: Optional[str] = None,
+) -> pd.DataFrame:
+    """Read the selected columns of a sheet as strings.
+
+    Args:
+        filepath (str): A path to the workbook.
+        sheet_name (str): Name of the sheet to read.
+        usecols (list[str]): Header names of the columns to read.
+        engine (str, optional): One of "calamine", "openpyxl" (read-only
+            streaming) or "pandas" (`pd.read_excel` defaults, which builds
+            the whole sheet before selecting columns). Defaults to
+            `default_excel_engine()`.
+
+    Returns:
+        pd.DataFrame: A DataFrame with the selected columns, in `usecols` order.
+
+    Raises:
+        ValueError: If the engine is not known, or the columns are not found.
+    """
+    if engine is None:
+        engine = default_excel_engine()
+    if engine == "openpyxl":
+        return _stream_excel_columns(filepath, sheet_name, usecols)
+    if engine == "calamine":
+        df = pd.read_excel(
+            filepath,
+            sheet_name=sheet_name,
+            usecols=usecols,
+            dtype=str,
+            engine="calamine",
+        )
+    elif engine == "pandas":
+        df = pd.read_excel(filepath, sheet_name=sheet_name, usecols=usecols, dtype=str)
+    else:
+        raise ValueError(f"Excel engine must be one of {EXCEL_ENGINES}, not {engine}.")
+    return df[usecols]
+
 
 def combine_job_title(row: pd.Series) -> str:
     """Produces full job title wih IND and ADD qualifiers.
@@ -24,21 +134,22 @@ def combine_job_title(row: pd.Series) -> str:
     return job_title
 
 
-def load_soc_index(filepath: str) -> pd.DataFrame:
+def load_soc_index(filepath: str, engine: Optional[str] = None) -> pd.DataFrame:
     """Load SOC index.
     Provides a list of over 32,000 titles associated with employment.
 
     Args:
         filepath (str): A path to the file containing SOC Index.
+        engine (str, optional): Excel engine, see `read_excel_columns`.
 
     Returns:
         pd.DataFrame: A DataFrame with transformed job titles.
     """
-    soc_index_df = pd.read_excel(
+    soc_index_df = read_excel_columns(
         filepath,
         sheet_name="SOC2020 coding index",
         usecols=["SOC_2020", "INDEXOCC_-_natural_word_order", "ADD", "IND"],
-        dtype=str,
+        engine=engine,
     )
 
     soc_index_df.columns = [col.lower() for col in soc_index_df.columns]
@@ -49,27 +160,33 @@ def load_soc_index(filepath: str) -> pd.DataFrame:
 
     soc_index_df = soc_index_df[soc_index_df["code"] != "}}}}"]
     soc_index_df = soc_index_df.dropna(subset=["code", "natural_word"])
-    soc_index_df["title"] = soc_index_df.apply(combine_job_title, axis=1)
+    # Vectorised equivalent of combine_job_title
+    title = soc_index_df["natural_word"]
+    add, ind = soc_index_df["add"], soc_index_df["ind"]
+    title = title.where(add.isna(), add + " " + title)
+    title = title.where(ind.isna(), title + " (" + ind + ")")
+    soc_index_df["title"] = title
     soc_index_df = soc_index_df[["code", "title"]]
     soc_index_df["title"] = soc_index_df["title"].str.capitalize()
 
     return soc_index_df
 
 
-def load_soc_structure(filepath: str) -> pd.DataFrame:
+def load_soc_structure(filepath: str, engine: Optional[str] = None) -> pd.DataFrame:
     """Load SOC structure.
 
     Provides structure with all levels and names of the SOC 2020.
 
     Args:
         filepath (str): A path to the file containing SOC Structure.
+        engine (str, optional): Excel engine, see `read_excel_columns`.
 
     Returns:
         pd.DataFrame: A DataFrame containing group code, group title,
         group description, typical entry routes and associated qualifications,
         and list of tasks.
     """
-    soc_df = pd.read_excel(
+    soc_df = read_excel_columns(
         filepath,
         sheet_name="SOC2020 descriptions",
         usecols=[
@@ -82,7 +199,7 @@ def load_soc_structure(filepath: str) -> pd.DataFrame:
             "Group  Description",
             "Tasks",
         ],
-        dtype=str,
+        engine=engine,
     )
     soc_df.columns = [
         col.lower().replace(" ", "_").replace("__", "_").replace("\n", "")
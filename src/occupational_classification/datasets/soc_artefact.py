@@ -0,0 +1,223 @@
+"""Artefacts of fully built SOC resources, for a fast cold start.
+
+`load_soc_resources` reads two workbooks, validates every SOC structure
+record and normalises the whole coding index before the first lookup. An
+artefact stores the result once: the SOC index, the cleaned SOC structure
+records, the hierarchy (nodes with their parent and children, tasks,
+qualifications and job titles) and the normalised lookup table, so short
+lived processes such as serverless functions and batch jobs only read it
+back.
+
+Artefacts are gzip compressed JSON with a format version; they hold data
+only, so loading one never runs code from the file (unlike pickle). Codes
+are stored once and referred to by position, and job titles by their row in
+the index. Spelling correction and the substring index are not stored, they
+are enabled again on the loaded lookup when needed.
+
+Usage:
+    ```
+    from occupational_classification.datasets.soc_artefact import (
+        load_soc_artefact,
+        save_soc_artefact,
+    )
+    save_soc_artefact(load_soc_resources(), "soc_resources.json.gz")
+    resources = load_soc_artefact("soc_resources.json.gz")
+    resources.lookup.lookup("zoologist")
+    ```
+"""
+
+import gzip
+import json
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Union
+
+import pandas as pd
+
+from occupational_classification.datasets.soc_loader import SocResources
+from occupational_classification.hierarchy.soc_hierarchy import SOC, SocNode
+from occupational_classification.lookup.soc_lookup import SOCLookup, SOCRephraseLookup
+from occupational_classification.meta.soc_meta import SocMeta
+from occupational_classification.utils.memory import intern_strings
+from occupational_classification.utils.metrics import LOAD_SECONDS, observe
+from occupational_classification.utils.normalisation import TextNormaliser
+
+logger = logging.getLogger(__name__)
+
+ARTEFACT_FORMAT = "soc-resources"
+ARTEFACT_VERSION = 1
+
+
+def _encode_index(soc_index: pd.DataFrame) -> dict[str, Any]:
+    keys, codes = pd.factorize(soc_index["code"])
+    return {
+        "index": soc_index.index.tolist(),
+        "codes": codes.tolist(),
+        "code_keys": keys.tolist(),
+        "titles": soc_index["title"].tolist(),
+    }
+
+
+def _decode_index(encoded: dict[str, Any]) -> pd.DataFrame:
+    codes = list(map(sys.intern, encoded["codes"]))
+    return pd.DataFrame(
+        {
+            "code": [codes[key] for key in encoded["code_keys"]],
+            "title": encoded["titles"],
+        },
+        index=encoded["index"],
+    )
+
+
+def _encode_hierarchy(hierarchy: SOC, soc_index: pd.DataFrame) -> list[dict]:
+    rows_by_title: dict[tuple[str, str], list[int]] = {}
+    for row, (code, title) in enumerate(
+        zip(soc_index["code"], soc_index["title"], strict=True)
+    ):
+        rows_by_title.setdefault((code, title), []).append(row)
+
+    nodes = []
+    for node in hierarchy.nodes:
+        # Repeated titles of a code take its rows in order
+        seen: dict[str, int] = {}
+        job_title_rows = []
+        for title in node.job_titles:
+            rows = rows_by_title[(node.soc_code, title)]
+            job_title_rows.append(rows[seen.get(title, 0)])
+            seen[title] = seen.get(title, 0) + 1
+        nodes.append(
+            {
+                "code": node.soc_code,
+                "group_title": node.group_title,
+                "group_description": node.group_description,
+                "parent": None if node.parent is None else node.parent.soc_code,
+                "children": [child.soc_code for child in node.children],
+                "tasks": list(node.tasks),
+                "qualifications": node.qualifications,
+                "job_title_rows": job_title_rows,
+            }
+        )
+    return nodes
+
+
+def _decode_hierarchy(encoded: list[dict], titles: list[str]) -> SOC:
+    nodes = []
+    lookup: dict[str, SocNode] = {}
+    for record in encoded:
+        node = SocNode(
+            sys.intern(record["code"]),
+            group_title=sys.intern(record["group_title"]),
+            group_description=sys.intern(record["group_description"]),
+        )
+        node.tasks = intern_strings(record["tasks"])
+        node.qualifications = intern_strings(record["qualifications"])
+        node.job_titles = [titles[row] for row in record["job_title_rows"]]
+        nodes.append(node)
+        lookup[node.soc_code] = node
+    for record, node in zip(encoded, nodes, strict=True):
+        if record["parent"] is not None:
+            node.parent = lookup[record["parent"]]
+        node.children = [lookup[code] for code in record["children"]]
+    return SOC(nodes, lookup)
+
+
+def _normaliser_settings(normaliser: TextNormaliser) -> dict[str, Any]:
+    return {
+        "casefold": normaliser.casefold,
+        "expand_ampersand": normaliser.expand_ampersand,
+        "strip_punctuation": normaliser.strip_punctuation,
+        "fold_plurals": normaliser.fold_plurals,
+        "abbreviations": normaliser.abbreviations,
+    }
+
+
+def save_soc_artefact(resources: SocResources, path: Union[Path, str]):
+    """Writes built SOC resources to an artefact.
+
+    The file is written next to `path` first and then moved into place, so
+    readers never see a partly written artefact.
+
+    Args:
+        resources (SocResources): Resources to store, e.g. from
+            `load_soc_resources`.
+        path (Path or str): The artefact file, conventionally `*.json.gz`.
+    """
+    meta = resources.meta
+    artefact = {
+        "format": ARTEFACT_FORMAT,
+        "version": ARTEFACT_VERSION,
+        "soc_index": _encode_index(resources.soc_index),
+        "structure": meta.df.to_dict(orient="list"),
+        "meta": meta.soc_meta,
+        "hierarchy": _encode_hierarchy(resources.hierarchy, resources.soc_index),
+        "normaliser": _normaliser_settings(resources.lookup.normaliser),
+        "normalised_lookup": resources.lookup.normalised_lookup_dict,
+    }
+    partial_path = f"{path}.partial"
+    with gzip.open(partial_path, "wt", encoding="utf-8") as file:
+        json.dump(artefact, file, ensure_ascii=False, separators=(",", ":"))
+    os.replace(partial_path, path)
+
+
+def load_soc_artefact(path: Union[Path, str]) -> SocResources:
+    """Reads SOC resources back from an artefact written by
+    `save_soc_artefact`.
+
+    Args:
+        path (Path or str): The artefact file.
+
+    Returns:
+        SocResources: The data, lookups and hierarchy, with timings.
+
+    Raises:
+        ValueError: If the file is not an artefact of a supported version.
+    """
+    timings: dict[str, float] = {}
+    start = time.perf_counter()
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        artefact = json.load(file)
+    if not isinstance(artefact, dict) or artefact.get("format") != ARTEFACT_FORMAT:
+        raise ValueError(f"{path} is not a SOC resources artefact.")
+    if artefact.get("version") != ARTEFACT_VERSION:
+        raise ValueError(
+            f"{path} is artefact version {artefact.get('version')}, "
+            f"only version {ARTEFACT_VERSION} is supported."
+        )
+    timings["read_artefact"] = time.perf_counter() - start
+
+    stage_start = time.perf_counter()
+    soc_index = _decode_index(artefact["soc_index"])
+    meta = SocMeta.from_records(pd.DataFrame(artefact["structure"]), artefact["meta"])
+    timings["build_meta"] = time.perf_counter() - stage_start
+
+    stage_start = time.perf_counter()
+    lookup = SOCLookup.from_tables(
+        soc_index,
+        {
+            sys.intern(description): sys.intern(code)
+            for description, code in artefact["normalised_lookup"].items()
+        },
+        TextNormaliser(**artefact["normaliser"]),
+        meta,
+    )
+    rephrase_lookup = SOCRephraseLookup(meta=meta)
+    timings["build_lookup"] = time.perf_counter() - stage_start
+
+    stage_start = time.perf_counter()
+    hierarchy = _decode_hierarchy(
+        artefact["hierarchy"], artefact["soc_index"]["titles"]
+    )
+    timings["build_hierarchy"] = time.perf_counter() - stage_start
+
+    timings["total"] = time.perf_counter() - start
+    for stage, seconds in timings.items():
+        observe(LOAD_SECONDS, seconds, stage=stage)
+    logger.info(
+        "Loaded SOC resources from %s: %s",
+        path,
+        ", ".join(f"{stage} {seconds:.3f}s" for stage, seconds in timings.items()),
+    )
+    return SocResources(soc_index, meta, lookup, rephrase_lookup, hierarchy, timings)
@@ -0,0 +1,185 @@
+"""Start up loading of all SOC resources.
+
+The SOC index and SOC structure workbooks are independent, so they are read
+and cleaned at the same time, then the lookups and the hierarchy are built
+from the loaded data. The SOC structure is read once and its `SocMeta` is
+shared by every object.
+
+Usage:
+    ```
+    from occupational_classification.datasets.soc_loader import load_soc_resources
+    resources = load_soc_resources()
+    resources.lookup.lookup("zoologist")
+    resources.hierarchy["2112"]
+    ```
+
+Threads are the default: the calamine engine parses outside the GIL, so the
+two workbooks load in parallel, while worker processes cost more to start and
+to pickle the loaded data back than they save. With the openpyxl engine,
+which holds the GIL, threads and sequential loading take about the same time.
+"""
+
+import logging
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Optional
+
+import pandas as pd
+
+from occupational_classification._config.main import get_config
+from occupational_classification.data_access.soc_data_access import (
+    load_soc_index,
+    load_soc_structure,
+)
+from occupational_classification.hierarchy.soc_hierarchy import SOC, load_hierarchy
+from occupational_classification.lookup.soc_lookup import SOCLookup, SOCRephraseLookup
+from occupational_classification.meta.soc_meta import SocMeta
+from occupational_classification.utils.metrics import LOAD_SECONDS, observe
+
+logger = logging.getLogger(__name__)
+
+EXECUTORS = ("process", "thread", "sequential")
+
+
+class SocResources:
+    """All SOC objects needed by a service, sharing one SocMeta.
+
+    Attributes:
+        soc_index (pd.DataFrame): SOC index, as returned by `load_soc_index`.
+        meta (SocMeta): SOC metadata loaded from the SOC structure.
+        lookup (SOCLookup): Lookup of SOC codes by description.
+        rephrase_lookup (SOCRephraseLookup): Lookup of descriptions by SOC code.
+        hierarchy (SOC): SOC hierarchy.
+        timings (dict[str, float]): Seconds taken by each start up stage.
+    """
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        soc_index: pd.DataFrame,
+        meta: SocMeta,
+        lookup: SOCLookup,
+        rephrase_lookup: SOCRephraseLookup,
+        hierarchy: SOC,
+        timings: dict[str, float],
+    ):
+        self.soc_index = soc_index
+        self.meta = meta
+        self.lookup = lookup
+        self.rephrase_lookup = rephrase_lookup
+        self.hierarchy = hierarchy
+        self.timings = timings
+
+
+def load_soc_meta(structure_data_path: str, engine: Optional[str] = None) -> SocMeta:
+    """Loads and cleans the SOC structure."""
+    return SocMeta(df=load_soc_structure(structure_data_path, engine=engine))
+
+
+def _create_executor(executor: str) -> Optional[Executor]:
+    if executor == "process":
+        return ProcessPoolExecutor(max_workers=2)
+    if executor == "thread":
+        return ThreadPoolExecutor(max_workers=2)
+    if executor == "sequential":
+        return None
+    raise ValueError(f"Executor must be one of {EXECUTORS}, not {executor}.")
+
+
+def _timed(timings: dict[str, float], stage: str, func: Callable, *args) -> Any:
+    start = time.perf_counter()
+    result = func(*args)
+    timings[stage] = time.perf_counter() - start
+    return result
+
+
+def load_soc_resources(
+    index_data_path: Optional[str] = None,
+    structure_data_path: Optional[str] = None,
+    executor: str = "thread",
+    engine: Optional[str] = None,
+) -> SocResources:
+    """Loads the SOC index and structure concurrently and builds all objects.
+
+    Args:
+        index_data_path (str, optional): The path to the SOC index workbook.
+            Defaults to `soc_index` from the config.
+        structure_data_path (str, optional): The path to the SOC structure
+            workbook. Defaults to `soc_structure` from the config.
+        executor (str, optional): How the workbooks are loaded: "process"
+            (in two worker processes), "thread" (in two threads) or
+            "sequential". Defaults to "thread".
+        engine (str, optional): Excel engine, see `read_excel_columns`.
+
+    Returns:
+        SocResources: The loaded data, lookups and hierarchy, with timings.
+
+    Raises:
+        ValueError: If the executor is not known.
+    """
+    if index_data_path is None:
+        index_data_path = get_config()["data_source"]["soc_index"]
+    if structure_data_path is None:
+        structure_data_path = get_config()["data_source"]["soc_structure"]
+
+    timings: dict[str, float] = {}
+    start = time.perf_counter()
+    pool = _create_executor(executor)
+    if pool is None:
+        soc_index = _timed(
+            timings, "load_soc_index", load_soc_index, index_data_path, engine
+        )
+        meta = _timed(
+            timings, "load_soc_meta", load_soc_meta, structure_data_path, engine
+        )
+    else:
+        with pool:
+            index_future = pool.submit(load_soc_index, index_data_path, engine)
+            meta_future = pool.submit(load_soc_meta, structure_data_path, engine)
+            soc_index = index_future.result()
+            meta = meta_future.result()
+    timings["load"] = time.perf_counter() - start
+
+    resources = build_soc_resources(soc_index, meta, timings=timings)
+    timings["total"] = time.perf_counter() - start
+    for stage, seconds in timings.items():
+        observe(LOAD_SECONDS, seconds, stage=stage)
+    logger.info(
+        "Loaded SOC resources (%s): %s",
+        executor,
+        ", ".join(f"{stage} {seconds:.3f}s" for stage, seconds in timings.items()),
+    )
+    return resources
+
+
+def build_soc_resources(
+    soc_index: pd.DataFrame,
+    meta: SocMeta,
+    timings: Optional[dict[str, float]] = None,
+) -> SocResources:
+    """Builds the lookups and the hierarchy from already loaded data.
+
+    Args:
+        soc_index (pd.DataFrame): SOC index, as returned by `load_soc_index`.
+        meta (SocMeta): SOC metadata, shared by every object.
+        timings (dict[str, float], optional): Seconds taken by each stage are
+            added to it. Defaults to a new dictionary.
+
+    Returns:
+        SocResources: The data, lookups and hierarchy, with timings.
+    """
+    timings = {} if timings is None else timings
+    lookup = _timed(
+        timings,
+        "build_lookup",
+        lambda: SOCLookup(meta=meta, soc_index=soc_index),
+    )
+    rephrase_lookup = _timed(
+        timings, "build_rephrase_lookup", lambda: SOCRephraseLookup(meta=meta)
+    )
+    hierarchy = _timed(
+        timings,
+        "build_hierarchy",
+        lambda: load_hierarchy(pd.DataFrame(meta.soc_meta), soc_index, soc_meta=meta),
+    )
+    return SocResources(soc_index, meta, lookup, rephrase_lookup, hierarchy, timings)
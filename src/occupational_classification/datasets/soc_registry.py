@@ -0,0 +1,257 @@
+"""Registry of named SOC datasets served side by side in one process, such
+as the current and the previous release of the SOC index for recoding.
+
+Each dataset has its own index and structure paths, given directly or read
+from its own config file (see `load_config`), and is loaded on first use.
+Loaded data is shared between datasets wherever it is identical: a file
+already loaded by another dataset is not read again, files with the same
+content share one DataFrame or `SocMeta`, and datasets made of the same
+index and structure share all their objects. Codes, titles and tasks are
+interned when loaded (see `intern_strings`), so strings which are identical
+across releases are held once by the lookup dictionaries, metadata and
+hierarchies.
+
+Sharing is by whole file, though: two index releases which differ in a
+single row share no DataFrame, lookup dictionary or search structure, only
+the interned strings those dictionaries hold. The DataFrames keep their
+text in Arrow buffers, which cannot refer to Python strings, so each index
+release holds its own copy there.
+
+Datasets already loaded are returned without locking, and each dataset is
+loaded under a lock of its own, so requests for a loaded release are not
+held up while another release loads.
+
+Usage:
+    ```
+    registry = DatasetRegistry()
+    registry.register("current")  # paths from the default config
+    registry.register("previous", config_name="config_previous.toml")
+    registry["previous"].lookup.lookup("zoologist")
+    ```
+"""
+
+import hashlib
+import logging
+import threading
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import pandas as pd
+
+from occupational_classification._config.main import get_config, load_config
+from occupational_classification.data_access.soc_data_access import load_soc_index
+from occupational_classification.datasets.soc_loader import (
+    SocResources,
+    build_soc_resources,
+    load_soc_meta,
+)
+from occupational_classification.meta.soc_meta import SocMeta
+
+logger = logging.getLogger(__name__)
+
+
+def frame_digest(df: pd.DataFrame) -> str:
+    """Returns a digest of the content of a DataFrame, columns included."""
+    digest = hashlib.sha256(repr(list(df.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class DatasetRegistry:
+    """Named SOC datasets, loaded on first use and sharing identical data.
+
+    Attributes:
+        engine (Optional[str]): Excel engine, see `read_excel_columns`.
+
+    Methods:
+        register(name: str, ...) -> None:
+            Adds a dataset, to be loaded when first used.
+        get(name: str) -> SocResources:
+            Returns the loaded dataset.
+    """
+
+    def __init__(self, engine: Optional[str] = None):
+        """Creates an empty registry.
+
+        Args:
+            engine (str, optional): Excel engine, see `read_excel_columns`.
+        """
+        self.engine = engine
+        self._paths: dict[str, tuple[str, str]] = {}
+        self._datasets: dict[str, SocResources] = {}
+        # Loaded data by file path and by content digest
+        self._file_digests: dict[str, str] = {}
+        self._indexes: dict[str, pd.DataFrame] = {}
+        self._metas: dict[str, SocMeta] = {}
+        self._resources: dict[tuple[str, str], SocResources] = {}
+        # Guards the dictionaries above, and is not held while loading
+        self._lock = threading.RLock()
+        # Held while loading a dataset, a file or resources, by key
+        self._load_locks: dict[Any, threading.Lock] = {}
+
+    def register(
+        self,
+        name: str,
+        index_data_path: Optional[Union[Path, str]] = None,
+        structure_data_path: Optional[Union[Path, str]] = None,
+        config_name: Optional[Union[Path, str]] = None,
+    ):
+        """Adds a dataset, to be loaded when first used.
+
+        Args:
+            name (str): Name of the dataset.
+            index_data_path (Path or str, optional): The path to the SOC index
+                workbook. Defaults to `soc_index` of the config.
+            structure_data_path (Path or str, optional): The path to the SOC
+                structure workbook. Defaults to `soc_structure` of the config.
+            config_name (Path or str, optional): Config file of the dataset,
+                loaded with `load_config`. Defaults to the process wide config
+                of `get_config`.
+
+        Raises:
+            ValueError: If a dataset with the name is already registered.
+        """
+        with self._lock:
+            if name in self._paths:
+                raise ValueError(f"Dataset {name!r} is already registered.")
+            if index_data_path is None or structure_data_path is None:
+                config = (
+                    get_config() if config_name is None else load_config(config_name)
+                )
+                data_source = config["data_source"]
+                if index_data_path is None:
+                    index_data_path = data_source["soc_index"]
+                if structure_data_path is None:
+                    structure_data_path = data_source["soc_structure"]
+            self._paths[name] = (str(index_data_path), str(structure_data_path))
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._paths
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._paths))
+
+    def __len__(self):
+        return len(self._paths)
+
+    def __getitem__(self, name: str) -> SocResources:
+        return self.get(name)
+
+    def paths(self, name: str) -> tuple[str, str]:
+        """Returns the index and structure paths of a dataset.
+
+        Raises:
+            KeyError: If no dataset has the name.
+        """
+        if name not in self._paths:
+            raise KeyError(f"Dataset {name!r} is not registered.")
+        return self._paths[name]
+
+    def is_loaded(self, name: str) -> bool:
+        """Returns whether a dataset has been loaded."""
+        return name in self._datasets
+
+    def _load_lock(self, key: Any) -> threading.Lock:
+        """Returns the lock held while loading what the key names."""
+        with self._lock:
+            return self._load_locks.setdefault(key, threading.Lock())
+
+    def _load_shared(
+        self, path: str, load: Callable[[str], Any], cache: dict[str, Any]
+    ) -> tuple[str, Any]:
+        """Loads a file once, returning the content digest and the object
+        shared by every file with the same content.
+        """
+        with self._load_lock(("file", path)):
+            with self._lock:
+                digest = self._file_digests.get(path)
+                if digest in cache:
+                    return digest, cache[digest]
+            loaded = load(path)
+            df = loaded.df if isinstance(loaded, SocMeta) else loaded
+            digest = frame_digest(df)
+            with self._lock:
+                self._file_digests[path] = digest
+                if digest in cache:
+                    logger.info(
+                        "%s has the same content as a loaded file, shared", path
+                    )
+                return digest, cache.setdefault(digest, loaded)
+
+    def get(self, name: str) -> SocResources:
+        """Returns a dataset, loading it (or the data it does not share with
+        already loaded datasets) on first use.
+
+        A loaded dataset is returned without locking. Otherwise the dataset
+        is loaded under its own lock, so other datasets can be read and
+        loaded meanwhile, and concurrent requests for it wait for one load.
+
+        Args:
+            name (str): Name of the dataset.
+
+        Returns:
+            SocResources: The lookups and hierarchy of the dataset.
+
+        Raises:
+            KeyError: If no dataset has the name.
+        """
+        resources = self._datasets.get(name)
+        if resources is not None:
+            return resources
+        index_data_path, structure_data_path = self.paths(name)
+        with self._load_lock(("dataset", name)):
+            resources = self._datasets.get(name)
+            if resources is not None:
+                return resources
+            index_digest, soc_index = self._load_shared(
+                index_data_path,
+                lambda path: load_soc_index(path, engine=self.engine),
+                self._indexes,
+            )
+            meta_digest, meta = self._load_shared(
+                structure_data_path,
+                lambda path: load_soc_meta(path, engine=self.engine),
+                self._metas,
+            )
+            key = (index_digest, meta_digest)
+            with self._load_lock(("resources", key)):
+                with self._lock:
+                    resources = self._resources.get(key)
+                if resources is None:
+                    resources = build_soc_resources(soc_index, meta)
+                with self._lock:
+                    resources = self._resources.setdefault(key, resources)
+                    self._datasets[name] = resources
+            return resources
+
+    def unload(self, name: str):
+        """Forgets the loaded data of a dataset, which stays registered.
+
+        Data still used by another loaded dataset is kept.
+        """
+        with self._load_lock(("dataset", name)), self._lock:
+            self._datasets.pop(name, None)
+            used = {id(resources) for resources in self._datasets.values()}
+            self._resources = {
+                key: resources
+                for key, resources in self._resources.items()
+                if id(resources) in used
+            }
+            index_digests = {key[0] for key in self._resources}
+            meta_digests = {key[1] for key in self._resources}
+            self._indexes = {
+                digest: df
+                for digest, df in self._indexes.items()
+                if digest in index_digests
+            }
+            self._metas = {
+                digest: meta
+                for digest, meta in self._metas.items()
+                if digest in meta_digests
+            }
+            self._file_digests = {
+                path: digest
+                for path, digest in self._file_digests.items()
+                if digest in index_digests or digest in meta_digests
+            }
@@ -2,14 +2,29 @@
 Usage: provides information regarding the specified code.
     soc = load_hierarchy(soc_df, soc_index_df)
     soc["1"].
+
+`soc.freeze()` returns a read-only `FrozenSOC`, safe to share between threads.
+
+A hierarchy pickles as a flat list of node records, with parents and
+children by position, rather than as the linked graph of nodes; the links
+are restored and the leaf group views rebuilt when it is unpickled.
 """
 
-from typing import Union, Optional
+import sys
+from collections.abc import Callable, Container, Iterable, Iterator, Sequence
+from typing import Any, Union, Optional
 
+import numpy as np
 import pandas as pd
 
 from occupational_classification._config.main import get_config
 from occupational_classification.meta.soc_meta import SocMeta
+from occupational_classification.utils.frozen import (
+    FrozenMixin,
+    freeze_mapping,
+    unpickle_frozen,
+)
+from occupational_classification.utils.metrics import timed
 
 _LEVEL_DICT = {1: "Major", 2: "Sub-Major", 3: "Minor", 4: "Unit"}
 _SOC_CODE_LENGTH = 4
@@ -50,15 +65,10 @@ class SocCode:
             ValueError: If code contains other characters than digits.
             ValueError: If code length is too long.
         """
-        if not isinstance(code, str):
-            raise TypeError("SOC code must be a string")
-        if code == "":
-            raise ValueError("Cannot be empty string.")
-        if not code.isdigit():
-            raise ValueError("Code must consist of digits only.")
-        n_digits = len(code)
-        if n_digits > _SOC_CODE_LENGTH:
-            raise ValueError("Code length needs to be between 1 and 4 digits.")
+        error = _code_error(code)
+        if error is not None:
+            error_type, message = error
+            raise error_type(message)
 
     def group_classification(self):
         """Assigns the group level based on the length of the code.
@@ -66,10 +76,91 @@ class SocCode:
         Returns:
             str: Name of the group level (Major/Sub-Major/Minor/Unit)
         """
-        code = self.code
-        n_digits = SocCode(code).code_length()
-        group = _LEVEL_DICT[n_digits]
-        return group
+        return _LEVEL_DICT[self.code_length()]
+
+
+def _code_error(code) -> Optional[tuple[type[Exception], str]]:
+    """Returns the exception type and message for an invalid code, else None."""
+    if not isinstance(code, str):
+        return TypeError, "SOC code must be a string"
+    if code == "":
+        return ValueError, "Cannot be empty string."
+    if not code.isdigit():
+        return ValueError, "Code must consist of digits only."
+    if len(code) > _SOC_CODE_LENGTH:
+        return ValueError, "Code length needs to be between 1 and 4 digits."
+    return None
+
+
+def validate_codes(
+    codes: Iterable, known_codes: Optional[Container[str]] = None
+) -> pd.DataFrame:
+    """Validates many SOC codes at once.
+
+    Applies the checks of `SocCode` to each distinct value only, then spreads
+    the results back to all rows, so repeated codes cost nothing extra.
+
+    Args:
+        codes (Iterable): SOC codes, e.g. a list, NumPy string array or
+            pd.Series. Missing values are invalid, as they are not strings.
+        known_codes (Container[str], optional): Codes which exist, e.g. the
+            codes of a `SOC` hierarchy. When given, an `in_hierarchy` column
+            is added.
+
+    Returns:
+        pd.DataFrame: One row per code with columns `code`, `is_valid`,
+        `error` (the message `SocCode` would raise, None when valid), `level`
+        (Major/Sub-Major/Minor/Unit, None when invalid) and, optionally,
+        `in_hierarchy`. `error` and `level` are categorical.
+    """
+    values = (
+        codes
+        if isinstance(codes, pd.Series)
+        else pd.Series(np.asarray(codes, dtype=object), dtype=object)
+    )
+    keys, uniques = pd.factorize(values)
+    # Position -1 (missing values) takes the result of the extra last entry
+    uniques = [*uniques, None]
+
+    errors = [_code_error(code) for code in uniques]
+    unique_valid = np.array([error is None for error in errors], dtype=bool)
+    error_messages = list(dict.fromkeys(error[1] for error in errors if error))
+    error_codes = np.array(
+        [-1 if error is None else error_messages.index(error[1]) for error in errors],
+        dtype=np.int8,
+    )
+    level_names = list(_LEVEL_DICT.values())
+    level_codes = np.array(
+        [
+            len(code) - 1 if valid else -1
+            for code, valid in zip(uniques, unique_valid, strict=True)
+        ],
+        dtype=np.int8,
+    )
+
+    result = pd.DataFrame(
+        {
+            "code": values,
+            "is_valid": unique_valid[keys],
+            "error": pd.Categorical.from_codes(
+                error_codes[keys], categories=error_messages
+            ),
+            "level": pd.Categorical.from_codes(
+                level_codes[keys], categories=level_names
+            ),
+        },
+        index=values.index,
+    )
+    if known_codes is not None:
+        unique_known = np.array(
+            [
+                valid and code in known_codes
+                for code, valid in zip(uniques, unique_valid, strict=True)
+            ],
+            dtype=bool,
+        )
+        result["in_hierarchy"] = unique_known[keys]
+    return result
 
 
 class SocNode:
@@ -140,10 +231,25 @@ class SocNode:
         print(f"\nExample Job Titles: {self.job_titles}")
 
 
+# Text of each leaf group view, as a sequence per node
+_GROUP_FIELDS: dict[str, Callable[[SocNode], Sequence]] = {
+    "descriptions": lambda node: (node.group_description,),
+    "titles": lambda node: (node.group_title,),
+    "qualifications": lambda node: (node.qualifications,),
+    "job_titles": lambda node: node.job_titles,
+    "tasks": lambda node: ("Tasks: " + ", ".join(node.tasks),),
+}
+
+
 class SOC:
     """Provides lookup functionality, based on the SocNode object and related
     to them information.
 
+    The leaf group views (`all_group_*`, `group_columns` and `all_leaf_text`)
+    are built once, when first used, and reused until the hierarchy changes:
+    assigning `nodes`, or adding or removing nodes, rebuilds them. Call
+    `invalidate_views` after editing nodes in place.
+
     Usage:
         soc = load_hierarchy(soc_df, soc_index_df)
         soc["1"]
@@ -160,53 +266,145 @@ class SOC:
         self.lookup = lookup
 
     def __getitem__(self, key):
-        return self.lookup[key]
+        with timed("hierarchy_access"):
+            return self.lookup[key]
 
-    def all_group_descriptions(self):
-        """All group descriptions. Only returns for leaf nodes."""
+    def __getstate__(self) -> dict[str, Any]:
+        """Returns the state pickled: a record per node, with its parent and
+        children by position in `nodes`, and the position of each node in
+        `lookup`. Cached views are not pickled.
+        """
+        positions = {id(node): pos for pos, node in enumerate(self.nodes)}
+        return {
+            "nodes": [
+                (
+                    node.soc_code,
+                    node.group_title,
+                    node.group_description,
+                    node.tasks,
+                    node.qualifications,
+                    node.job_titles,
+                    None if node.parent is None else positions[id(node.parent)],
+                    [positions[id(child)] for child in node.children],
+                )
+                for node in self.nodes
+            ],
+            "lookup": {code: positions[id(node)] for code, node in self.lookup.items()},
+        }
+
+    def __setstate__(self, state: dict[str, Any]):
+        records = state["nodes"]
+        nodes = []
+        for code, title, description, tasks, quals, job_titles, *_ in records:
+            node = SocNode(
+                sys.intern(code), group_title=title, group_description=description
+            )
+            node.tasks = list(tasks)
+            node.qualifications = quals
+            node.job_titles = list(job_titles)
+            nodes.append(node)
+        for node, (*_, parent, children) in zip(nodes, records, strict=True):
+            if parent is not None:
+                node.parent = nodes[parent]
+            node.children = [nodes[child] for child in children]
+        self.nodes = nodes
+        self.lookup = {code: nodes[pos] for code, pos in state["lookup"].items()}
+
+    @property
+    def nodes(self) -> list:
+        """SocNode objects of the hierarchy."""
+        return self._nodes
+
+    @nodes.setter
+    def nodes(self, nodes: list):
+        self._nodes = nodes
+        self.invalidate_views()
+
+    def invalidate_views(self):
+        """Discards the cached leaf group views, rebuilt when next used."""
+        self._views: dict[str, Any] = {}
+        self._views_key = (id(self._nodes), len(self._nodes))
+
+    def _cached_views(self) -> dict[str, Any]:
+        """Returns the cache of views, emptied if nodes were added or removed."""
+        if self._views_key != (id(self._nodes), len(self._nodes)):
+            self.invalidate_views()
+        return self._views
+
+    def _group_lists(self, field: str) -> tuple[list[str], list[Any]]:
+        """Returns the codes and texts of a leaf group view, built once."""
+        if field not in _GROUP_FIELDS:
+            raise ValueError(f"Unknown field {field!r}, use {list(_GROUP_FIELDS)}.")
+        views = self._cached_views()
+        key = f"{field}_lists"
+        if key not in views:
+            texts = _GROUP_FIELDS[field]
+            codes: list[str] = []
+            values: list[Any] = []
+            for node in self._nodes:
+                if node.is_leaf():
+                    for text in texts(node):
+                        codes.append(node.soc_code)
+                        values.append(text)
+            views[key] = (codes, values)
+        return views[key]
+
+    def group_columns(self, field: str) -> dict[str, np.ndarray]:
+        """Returns the text of leaf groups as columns, built once.
+
+        Args:
+            field (str): One of "descriptions", "titles", "qualifications",
+                "job_titles" and "tasks" (tasks joined into one text per
+                group, as in `all_group_tasks`).
+
+        Returns:
+            dict[str, np.ndarray]: Read-only object arrays `code` and `text`,
+            one entry per leaf group (per job title for "job_titles"). The
+            same arrays are returned on every call.
+
+        Raises:
+            ValueError: If the field is not known.
+        """
+        codes, texts = self._group_lists(field)
+        views = self._cached_views()
+        if field not in views:
+            columns = {}
+            for name, values in (("code", codes), ("text", texts)):
+                column = np.empty(len(values), dtype=object)
+                column[:] = values
+                column.flags.writeable = False
+                columns[name] = column
+            views[field] = columns
+        return views[field]
+
+    def _group_records(self, field: str) -> Iterator[dict[str, Any]]:
+        codes, texts = self._group_lists(field)
         return (
-            {"code": node.soc_code, "text": node.group_description}
-            for node in self.nodes
-            if node.is_leaf()
+            {"code": code, "text": text}
+            for code, text in zip(codes, texts, strict=True)
         )
 
+    def all_group_descriptions(self):
+        """All group descriptions. Only returns for leaf nodes."""
+        return self._group_records("descriptions")
+
     def all_group_titles(self):
         """All group titles. Only returns for leaf nodes."""
-        return (
-            {"code": node.soc_code, "text": node.group_title}
-            for node in self.nodes
-            if node.is_leaf()
-        )
+        return self._group_records("titles")
 
     def all_group_qualifications(self):
         """All group entry routes and associated qualifications.
         Only returns for leaf nodes.
         """
-        return (
-            {
-                "code": node.soc_code,
-                "text": node.qualifications,
-            }
-            for node in self.nodes
-            if node.is_leaf()
-        )
+        return self._group_records("qualifications")
 
     def all_group_job_titles(self):
         """All group job titles. Only returns for leaf nodes."""
-        return (
-            {"code": node.soc_code, "text": title}
-            for node in self.nodes
-            if node.is_leaf()
-            for title in node.job_titles
-        )
+        return self._group_records("job_titles")
 
     def all_group_tasks(self):
         """All group tasks. Only returns for leaf nodes."""
-        return (
-            {"code": node.soc_code, "text": "Tasks: " + ", ".join(node.tasks)}
-            for node in self.nodes
-            if node.is_leaf()
-        )
+        return self._group_records("tasks")
 
     def all_leaf_text(self):
         """Returns all short text descriptions of 4-digit level SOC.
@@ -215,33 +413,268 @@ class SOC:
             - Group titles,
             - Group job titles.
 
+        The table is built once and each call returns a copy of it, which
+        shares the cached string data with pandas' string dtype.
+
         Returns:
             pd.DataFrame
                 Two columns `code`, `text`
         """
-        gr_title = pd.DataFrame(self.all_group_titles())
-        job_titles = pd.DataFrame(self.all_group_job_titles())
+        views = self._cached_views()
+        if "leaf_text" not in views:
+            gr_title = pd.DataFrame(self.group_columns("titles"))
+            job_titles = pd.DataFrame(self.group_columns("job_titles"))
+
+            df = pd.concat([gr_title, job_titles], ignore_index=True)
+
+            df = df.drop_duplicates()
+            df = df.sort_values("code")
+            views["leaf_text"] = df.reset_index(drop=True).copy()
+
+        return views["leaf_text"].copy()
+
+    def validate_codes(self, codes: Iterable) -> pd.DataFrame:
+        """Validates many SOC codes and checks they exist in the hierarchy.
+
+        See `validate_codes`.
+
+        Args:
+            codes (Iterable): SOC codes, e.g. a list, NumPy string array or
+                pd.Series.
+
+        Returns:
+            pd.DataFrame: Validation results, including `in_hierarchy`.
+        """
+        return validate_codes(codes, known_codes=self.lookup)
+
+    def contains_codes(self, codes: Iterable) -> np.ndarray:
+        """Checks which codes exist in the hierarchy.
+
+        Args:
+            codes (Iterable): SOC codes, e.g. a list, NumPy string array or
+                pd.Series.
+
+        Returns:
+            np.ndarray: Boolean mask, True where the code is in the hierarchy.
+        """
+        keys, uniques = pd.factorize(
+            codes if isinstance(codes, pd.Series) else np.asarray(codes, dtype=object)
+        )
+        unique_known = np.array(
+            [isinstance(code, str) and code in self.lookup for code in uniques]
+            + [False],
+            dtype=bool,
+        )
+        return unique_known[keys]
+
+    def rollup(
+        self,
+        codes: Iterable,
+        weights: Optional[Iterable] = None,
+        aggfunc: Union[str, Callable] = "sum",
+        levels: Sequence[str] = ("Major", "Sub-Major", "Minor", "Unit"),
+    ) -> pd.DataFrame:
+        """Aggregates coded records to every level of the hierarchy at once.
+
+        Records are factorised once into their distinct codes, so the work per
+        level only depends on the number of distinct codes, not of records
+        (for "sum" weights, or counts only). Categorical input is factorised
+        without looking at the strings at all.
+
+        Missing codes, and codes which are not strings of 1 to 4 digits (as
+        `validate_codes` requires, so integers are not codes), are ignored.
+        A code only contributes to levels at or above its own, e.g. "21"
+        counts towards Major group "2" and Sub-Major group "21".
+
+        Args:
+            codes (Iterable): SOC codes of the records, e.g. a list, NumPy
+                array or pd.Series of strings.
+            weights (Iterable, optional): Weight of each record, aggregated
+                into a `weight` column.
+            aggfunc (str or Callable, optional): Aggregation applied to the
+                weights, any accepted by `pd.core.groupby.SeriesGroupBy.agg`.
+                Defaults to "sum".
+            levels (Sequence[str], optional): Group levels to return. Defaults
+                to all levels.
+
+        Returns:
+            pd.DataFrame: Columns `level`, `code`, `group_title` and `count`
+            (plus `weight` when weights are given), ordered by level and code.
+
+        Raises:
+            ValueError: If `weights` and `codes` differ in length, or a level
+                is not known.
+        """
+        n_digits_by_level = {level: n for n, level in _LEVEL_DICT.items()}
+        unknown = [level for level in levels if level not in n_digits_by_level]
+        if unknown:
+            raise ValueError(
+                f"Unknown levels {unknown}, use {list(_LEVEL_DICT.values())}."
+            )
+
+        record_keys, uniques = pd.factorize(
+            codes if isinstance(codes, pd.Series) else np.asarray(codes, dtype=object)
+        )
+        # As in `validate_codes`, codes must be strings: 2112 is not "2112"
+        is_string = np.array([isinstance(code, str) for code in uniques], dtype=bool)
+        uniques = pd.Index(uniques, dtype=object).astype(str)
+        valid_unique = is_string & np.asarray(
+            uniques.str.fullmatch(r"\d{1,4}"), dtype=bool
+        )
+        record_valid = record_keys >= 0
+        record_valid[record_valid] = valid_unique[record_keys[record_valid]]
+        record_keys = record_keys[record_valid]
+
+        unique_counts = np.bincount(record_keys, minlength=len(uniques))
+        weight_values: Optional[np.ndarray] = None
+        unique_weights: Optional[np.ndarray] = None
+        if weights is not None:
+            weight_values = np.asarray(weights, dtype=float)
+            if len(weight_values) != len(record_valid):
+                raise ValueError("weights must have the same length as codes.")
+            weight_values = weight_values[record_valid]
+            if aggfunc == "sum":
+                unique_weights = np.bincount(
+                    record_keys, weights=weight_values, minlength=len(uniques)
+                )
+
+        frames = []
+        code_lengths = np.asarray(uniques.str.len())
+        for level in levels:
+            n_digits = n_digits_by_level[level]
+            # Distinct codes below this level map to -1 and are left out
+            in_level = valid_unique & (code_lengths >= n_digits)
+            level_keys, level_codes = pd.factorize(
+                uniques.str[:n_digits].where(in_level, None)
+            )
+            in_level_keys = level_keys >= 0
+            n_groups = len(level_codes)
+            frame = pd.DataFrame(
+                {
+                    "level": level,
+                    "code": level_codes.astype(str),
+                    "group_title": [
+                        self.lookup[code].group_title if code in self.lookup else None
+                        for code in level_codes
+                    ],
+                    "count": np.bincount(
+                        level_keys[in_level_keys],
+                        weights=unique_counts[in_level_keys],
+                        minlength=n_groups,
+                    ).astype(np.int64),
+                }
+            )
+            if unique_weights is not None:
+                frame["weight"] = np.bincount(
+                    level_keys[in_level_keys],
+                    weights=unique_weights[in_level_keys],
+                    minlength=n_groups,
+                )
+            elif weight_values is not None:
+                record_level_keys = level_keys[record_keys]
+                in_level_records = record_level_keys >= 0
+                frame["weight"] = (
+                    pd.Series(weight_values[in_level_records])
+                    .groupby(record_level_keys[in_level_records])
+                    .agg(aggfunc)
+                    .reindex(range(n_groups))
+                    .to_numpy()
+                )
+            frames.append(frame.sort_values("code"))
+
+        columns = ["level", "code", "group_title", "count"]
+        if weight_values is not None:
+            columns.append("weight")
+        if not frames:
+            return pd.DataFrame(columns=columns)
+        return pd.concat(frames, ignore_index=True)[columns]
+
+    def freeze(self) -> "FrozenSOC":
+        """Returns a read-only snapshot, safe to share between threads."""
+        return FrozenSOC(self)
+
+
+class FrozenSocNode(FrozenMixin, SocNode):
+    """Read-only copy of a `SocNode`, with tuples in place of lists.
+
+    Created by `FrozenSOC`, which links parents and children between the
+    copies before freezing them.
+    """
+
+    def __init__(self, node: SocNode):
+        """Copies the node, without its parent and children.
+
+        Args:
+            node (SocNode): Node to copy.
+        """
+        self.soc_code = node.soc_code
+        self.group_title = node.group_title
+        self.group_description = node.group_description
+        self.group_level = node.group_level
+        self.tasks = tuple(node.tasks)
+        self.parent = None
+        self.children = ()
+        self.qualifications = node.qualifications
+        self.job_titles = tuple(node.job_titles)
 
-        df = pd.concat([gr_title, job_titles], ignore_index=True)
 
-        df = df.drop_duplicates()
-        df = df.sort_values("code")
-        df = df.reset_index(drop=True).copy()
+class FrozenSOC(FrozenMixin, SOC):
+    """Read-only snapshot of a `SOC` hierarchy, safe for concurrent reads.
 
-        return df
+    Nodes are copied to `FrozenSocNode` and held in a tuple and a read-only
+    mapping; later changes to the original hierarchy do not reach the
+    snapshot.
+    """
+
+    def __init__(self, soc: SOC):
+        """Creates the snapshot.
 
+        Args:
+            soc (SOC): Hierarchy to copy.
+        """
+        copies = {id(node): FrozenSocNode(node) for node in soc.nodes}
+        for node in soc.nodes:
+            frozen_node = copies[id(node)]
+            if node.parent is not None:
+                frozen_node.parent = copies[id(node.parent)]
+            frozen_node.children = tuple(copies[id(child)] for child in node.children)
+        for frozen_node in copies.values():
+            frozen_node._freeze()
+        self.nodes = tuple(copies[id(node)] for node in soc.nodes)
+        self.lookup = freeze_mapping(
+            {code: copies[id(node)] for code, node in soc.lookup.items()}
+        )
+        # Views are built now, so reads never write to the snapshot
+        for field in _GROUP_FIELDS:
+            self.group_columns(field)
+        self.all_leaf_text()
+        self._freeze()
 
-def _define_codes_and_nodes(soc_df: pd.DataFrame, structure_data_path: str):
+    def __reduce__(self):
+        return unpickle_frozen, (SOC, self.__getstate__())
+
+    def freeze(self) -> "FrozenSOC":
+        """Returns the snapshot itself."""
+        return self
+
+
+def _define_codes_and_nodes(
+    soc_df: pd.DataFrame,
+    structure_data_path: Optional[str] = None,
+    soc_meta: Optional[SocMeta] = None,
+):
     """Creates codes list, nodes list and code_node_dict dictionary,
     later used for SOC.
     """
-    soc_meta = SocMeta(structure_data_path=structure_data_path)
+    if soc_meta is None:
+        soc_meta = SocMeta(structure_data_path=structure_data_path)
     codes = []
     nodes = []
 
     code_node_dict = {}
 
-    for code in soc_df["code"]:
+    # Interned to share the code strings with the metadata and the index.
+    for code in map(sys.intern, soc_df["code"]):
         group_description = soc_meta.get_meta_by_code(code)["group_description"]
         group_title = soc_meta.get_meta_by_code(code)["group_title"]
         soc_node = SocNode(
@@ -263,9 +696,14 @@ def _populate_parent_child_relationships(nodes: list, code_node_dict: dict):
             code_node_dict[node.soc_code].parent = code_node_dict[parent_code]
 
 
-def _populate_tasks_and_quals(nodes: list, structure_data_path: str):
+def _populate_tasks_and_quals(
+    nodes: list,
+    structure_data_path: Optional[str] = None,
+    soc_meta: Optional[SocMeta] = None,
+):
     """Populate tasks and qualifications. Modifies nodes in places."""
-    soc_meta = SocMeta(structure_data_path=structure_data_path)
+    if soc_meta is None:
+        soc_meta = SocMeta(structure_data_path=structure_data_path)
     for node in nodes:
         code = node.soc_code
         if SocCode(code).code_length() == _SOC_CODE_LENGTH:
@@ -278,12 +716,15 @@ def _populate_tasks_and_quals(nodes: list, structure_data_path: str):
 
 def _populate_job_titles(nodes: list, soc_index: pd.DataFrame):
     """Populate job titles. Modifies nodes in places."""
+    titles_by_code: dict[str, list[str]] = {}
+    for code, title in zip(
+        soc_index["code"].astype(str), soc_index["title"], strict=True
+    ):
+        titles_by_code.setdefault(sys.intern(code), []).append(sys.intern(title))
+
     for node in nodes:
         if SocCode(node.soc_code).code_length() == _SOC_CODE_LENGTH:
-            filtered_index = soc_index[soc_index["code"] == str(node.soc_code)]
-
-            for _index, row in filtered_index.iterrows():
-                node.job_titles.append(row["title"])
+            node.job_titles.extend(titles_by_code.get(str(node.soc_code), []))
 
 
 def is_leaf_code(code) -> bool:
@@ -304,7 +745,8 @@ def find_parent(code) -> Union[str, None]:
 def load_hierarchy(
     soc_df: pd.DataFrame,
     soc_index: pd.DataFrame,
-    structure_data_path: Optional[str] = None
+    structure_data_path: Optional[str] = None,
+    soc_meta: Optional[SocMeta] = None,
 ):
     """Create the SOC lookups from all supporting data.
 
@@ -312,18 +754,21 @@ def load_hierarchy(
         - SOC structure
         - SOC index
 
+    The SOC structure is read from `structure_data_path` once, unless an
+    already loaded `soc_meta` is provided.
+
     Once created this provides a single point of access for all
     data associated with a SOC definition.
     """
-    if structure_data_path is None:
-        structure_data_path = get_config()["data_source"]["soc_structure"]
-    codes, nodes, code_node_dict = _define_codes_and_nodes(
-        soc_df, structure_data_path=structure_data_path
-    )
+    if soc_meta is None:
+        if structure_data_path is None:
+            structure_data_path = get_config()["data_source"]["soc_structure"]
+        soc_meta = SocMeta(structure_data_path=structure_data_path)
+    codes, nodes, code_node_dict = _define_codes_and_nodes(soc_df, soc_meta=soc_meta)
 
     _populate_parent_child_relationships(nodes, code_node_dict)
 
-    _populate_tasks_and_quals(nodes, structure_data_path=structure_data_path)
+    _populate_tasks_and_quals(nodes, soc_meta=soc_meta)
 
     _populate_job_titles(nodes, soc_index)
 
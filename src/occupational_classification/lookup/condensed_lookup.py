@@ -0,0 +1,107 @@
+"""This module provides the `CondensedLookup` class, a lightweight code to
+title lookup backed by a condensed classification file ("code: title" lines).
+
+It loads in milliseconds and does not depend on pandas or openpyxl, so it
+suits services which only need to map between codes and titles. Any
+classification in the condensed format can be served, e.g. SOC or COICOP:
+    ```
+    soc = CondensedLookup()  # `soc_condensed` from the config
+    soc.lookup("1111")
+    coicop = CondensedLookup("coicop_5d_condensed.txt")
+    coicop.lookup_title("Rice")
+    ```
+Relative paths are resolved as for the config, which includes the packaged
+example data.
+"""
+
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from occupational_classification._config.main import check_file_exists, get_config
+from occupational_classification.data_access.condensed_data_access import (
+    load_condensed_classification,
+)
+from occupational_classification.utils.normalisation import (
+    TextNormaliser,
+    build_normalised_lookup,
+)
+
+
+class CondensedLookup:
+    """A class for looking up codes and titles from a condensed file.
+
+    Attributes:
+        code_titles (dict[str, str]): A dictionary mapping codes to titles.
+        title_codes (dict[str, str]): A dictionary mapping normalised titles
+            to codes. Normalised titles of more than one code are ambiguous
+            and left out.
+        normaliser (TextNormaliser): Normalisation applied to titles.
+
+    Methods:
+        lookup(code: str) -> dict[str, str]:
+            Retrieves the title for a code.
+        lookup_title(title: str) -> dict[str, Optional[str]]:
+            Retrieves the code for a title.
+    """
+
+    def __init__(
+        self,
+        data_path: Optional[Union[Path, str]] = None,
+        normaliser: Optional[TextNormaliser] = None,
+    ):
+        """Initialises the CondensedLookup class by loading the condensed file.
+
+        Args:
+            data_path (Path or str, optional): The path to the condensed file.
+                Defaults to `soc_condensed` from the config.
+            normaliser (TextNormaliser, optional): Normalisation applied to
+                titles. Defaults to `TextNormaliser()`.
+
+        Raises:
+            FileNotFoundError: If the condensed file is not found.
+        """
+        if data_path is None:
+            data_path = get_config()["data_source"].get("soc_condensed")
+            if data_path is None:
+                raise FileNotFoundError("No soc_condensed file in the config.")
+        filepath = check_file_exists(data_path)
+        if filepath is None:
+            raise FileNotFoundError(f"Condensed file {data_path} not found.")
+        self.code_titles: dict[str, str] = load_condensed_classification(filepath)
+        self.normaliser = normaliser if normaliser is not None else TextNormaliser()
+        self.title_codes: dict[str, str] = build_normalised_lookup(
+            ((title, code) for code, title in self.code_titles.items()),
+            self.normaliser,
+        )
+
+    def __len__(self):
+        return len(self.code_titles)
+
+    def __contains__(self, code: Any):
+        return code in self.code_titles
+
+    def lookup(self, code: str) -> dict[str, str]:
+        """Retrieves the title for the given code.
+
+        Args:
+            code (str): The code to look up.
+
+        Returns:
+            dict[str, str]: The code and its title, or an error message.
+        """
+        title = self.code_titles.get(code)
+        if title is None:
+            return {"code": code, "error": "Code not found"}
+        return {"code": code, "title": title}
+
+    def lookup_title(self, title: str) -> dict[str, Optional[str]]:
+        """Retrieves the code for the given title, after normalisation.
+
+        Args:
+            title (str): The title to look up.
+
+        Returns:
+            dict[str, Optional[str]]: The title and its code, None if not found
+            or if the normalised title is shared by several codes.
+        """
+        return {"title": title, "code": self.title_codes.get(self.normaliser(title))}
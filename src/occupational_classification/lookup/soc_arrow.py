@@ -0,0 +1,257 @@
+"""This module provides `ArrowBatchLookup`, batch lookups of SOC codes which
+read and write Arrow arrays, tables and Parquet files (requires pyarrow,
+`pip install pyarrow`).
+
+Descriptions are dictionary encoded (dictionary columns, e.g. read from
+Parquet with `read_dictionary`, are used as they are), so `match_code` only
+runs once per distinct description of each chunk. The results of the
+distinct descriptions are then spread to the rows by an Arrow `take` of the
+dictionary indices, without a Python object per row. Matches are remembered across
+the chunks of a table and the batches of a stream. Results are dictionary
+columns over the fixed unit and major groups of
+`SOCLookup.output_categories`, which convert to the same categorical
+columns as `SOCLookup.lookup_batch` with `to_pandas()`.
+
+Usage:
+    ```
+    batch_lookup = ArrowBatchLookup(soc_lookup)
+    table = batch_lookup.lookup(pa.table({"description": descriptions}))
+    batch_lookup.lookup_parquet("responses.parquet", "coded.parquet")
+    ```
+"""
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Union
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+if TYPE_CHECKING:
+    from occupational_classification.lookup.soc_lookup import SOCLookup
+
+RESULT_COLUMNS = ("code", "code_title", "code_major_group", "code_major_group_title")
+
+ArrowData = Union[pa.Array, pa.ChunkedArray, pa.RecordBatch, pa.Table]
+
+
+def _dictionary_array(
+    keys: np.ndarray, dictionary: pa.Array, valid: Optional[np.ndarray] = None
+) -> pa.DictionaryArray:
+    """Builds a dictionary array from positions, null where not valid."""
+    mask = keys < 0 if valid is None else ~valid
+    indices = pa.array(np.maximum(keys, 0).astype(np.int32, copy=False), mask=mask)
+    return pa.DictionaryArray.from_arrays(indices, dictionary)
+
+
+class ArrowBatchLookup:
+    """Looks up SOC codes for Arrow arrays, tables and Parquet files.
+
+    Attributes:
+        soc_lookup (SOCLookup): Lookup matching each distinct description.
+        codes (pa.Array): Unit group codes, the dictionary of `code`.
+        major_groups (pa.Array): Major group codes, the dictionary of
+            `code_major_group`.
+
+    Methods:
+        lookup(descriptions: ArrowData, column: str = "description") -> ArrowData:
+            Adds the result columns to Arrow data.
+        lookup_parquet(source, destination, ...) -> int:
+            Codes a Parquet file into another, batch by batch.
+    """
+
+    def __init__(self, soc_lookup: "SOCLookup"):
+        """Prepares the result dictionaries of a lookup.
+
+        Args:
+            soc_lookup (SOCLookup): Lookup matching each distinct description.
+        """
+        self.soc_lookup = soc_lookup
+        categories = soc_lookup.output_categories()
+        unit_codes = categories["code"].tolist()
+        major_codes = categories["code_major_group"].tolist()
+        self._unit_positions = {code: pos for pos, code in enumerate(unit_codes)}
+        self.codes = pa.array(unit_codes, type=pa.string())
+        self.major_groups = pa.array(major_codes, type=pa.string())
+        self._unit_to_major = np.array(
+            [major_codes.index(code[:1]) for code in unit_codes], dtype=np.int32
+        )
+        self._unit_titles = self._titles(unit_codes)
+        self._major_titles = self._titles(major_codes)
+
+    def _titles(self, codes: list[str]) -> tuple[np.ndarray, pa.Array]:
+        """Returns the position of the group title of each code among the
+        distinct titles, -1 without a title, and the distinct titles.
+        """
+        titles = [
+            self.soc_lookup.meta.get_meta_by_code(code).get("group_title")
+            for code in codes
+        ]
+        distinct = list(dict.fromkeys(title for title in titles if title is not None))
+        positions = {title: pos for pos, title in enumerate(distinct)}
+        keys = np.array(
+            [-1 if title is None else positions[title] for title in titles],
+            dtype=np.int32,
+        )
+        return keys, pa.array(distinct, type=pa.string())
+
+    def _match_dictionary(
+        self, dictionary: pa.Array, matches: dict[str, int]
+    ) -> np.ndarray:
+        """Returns the unit group position of each distinct description, -1
+        where there is no match, adding new descriptions to `matches`.
+        """
+        match_code = self.soc_lookup.match_code
+        positions = []
+        for description in dictionary.to_pylist():
+            position = matches.get(description)
+            if position is None:
+                position = (
+                    -1
+                    if description is None
+                    else self._unit_positions.get(match_code(description), -1)
+                )
+                matches[description] = position
+            positions.append(position)
+        return np.array(positions, dtype=np.int32)
+
+    def _lookup_chunk(
+        self, descriptions: pa.Array, matches: dict[str, int]
+    ) -> list[pa.DictionaryArray]:
+        """Returns the result columns of one chunk of descriptions."""
+        if not pa.types.is_dictionary(descriptions.type):
+            descriptions = pc.dictionary_encode(descriptions)
+        units = self._match_dictionary(descriptions.dictionary, matches)
+        matched = units >= 0
+        unit_keys = np.maximum(units, 0)
+        major_keys = self._unit_to_major[unit_keys]
+        unit_title_keys = self._unit_titles[0][unit_keys]
+        major_title_keys = self._major_titles[0][major_keys]
+        unique_results = [
+            _dictionary_array(units, self.codes),
+            _dictionary_array(
+                unit_title_keys, self._unit_titles[1], matched & (unit_title_keys >= 0)
+            ),
+            _dictionary_array(major_keys, self.major_groups, matched),
+            _dictionary_array(
+                major_title_keys,
+                self._major_titles[1],
+                matched & (major_title_keys >= 0),
+            ),
+        ]
+        # Rows take the results of their distinct description, nulls stay null
+        return [result.take(descriptions.indices) for result in unique_results]
+
+    def lookup(
+        self,
+        descriptions: ArrowData,
+        column: str = "description",
+        matches: Optional[dict[str, int]] = None,
+    ):
+        """Looks up SOC codes for Arrow data.
+
+        Args:
+            descriptions (ArrowData): A string (or dictionary of strings)
+                array or chunked array of descriptions, or a record batch or
+                table with a `column` of descriptions. Nulls have no match.
+            column (str, optional): Column of descriptions in a record batch
+                or table, and name of the descriptions in the result of an
+                array. Defaults to "description".
+            matches (dict[str, int], optional): Unit group positions of
+                descriptions already matched, extended with the new ones.
+                Defaults to a new dictionary.
+
+        Returns:
+            pa.Table or pa.RecordBatch: A record batch or table is returned
+            with the result columns `code`, `code_title`, `code_major_group`
+            and `code_major_group_title` appended; an array gives a table of
+            the descriptions and the result columns. Result columns are
+            dictionary encoded and null where there is no match.
+
+        Raises:
+            ValueError: If the data already has a result column.
+        """
+        if isinstance(descriptions, (pa.Array, pa.ChunkedArray)):
+            data = pa.table({column: descriptions})
+        else:
+            data = descriptions
+        existing = [name for name in RESULT_COLUMNS if name in data.column_names]
+        if existing:
+            raise ValueError(f"Data already has result columns {existing}.")
+
+        matches = {} if matches is None else matches
+        values = data.column(column)
+        if isinstance(values, pa.ChunkedArray):
+            chunks = [self._lookup_chunk(chunk, matches) for chunk in values.chunks]
+            results = [
+                pa.chunked_array(
+                    [chunk[pos] for chunk in chunks],
+                    type=pa.dictionary(pa.int32(), pa.string()),
+                )
+                for pos in range(len(RESULT_COLUMNS))
+            ]
+        else:
+            results = self._lookup_chunk(values, matches)
+        for name, result in zip(RESULT_COLUMNS, results, strict=True):
+            data = data.append_column(name, result)
+        return data
+
+    def lookup_batches(
+        self, batches: Iterator[pa.RecordBatch], column: str = "description"
+    ) -> Iterator[pa.RecordBatch]:
+        """Looks up SOC codes for a stream of record batches.
+
+        Args:
+            batches (Iterator[pa.RecordBatch]): Record batches with a `column`
+                of descriptions.
+            column (str, optional): Column of descriptions. Defaults to
+                "description".
+
+        Yields:
+            pa.RecordBatch: Each batch with the result columns appended.
+        """
+        matches: dict[str, int] = {}
+        for batch in batches:
+            yield self.lookup(batch, column=column, matches=matches)
+
+    def lookup_parquet(
+        self,
+        source: Union[Path, str],
+        destination: Union[Path, str],
+        column: str = "description",
+        batch_size: int = 1_000_000,
+    ) -> int:
+        """Codes a Parquet file into another, one batch of rows at a time.
+
+        The descriptions are read dictionary encoded, as stored by Parquet,
+        and the result columns are written dictionary encoded.
+
+        Args:
+            source (Path or str): Parquet file with a `column` of descriptions.
+            destination (Path or str): Parquet file written with every column
+                of the source and the result columns.
+            column (str, optional): Column of descriptions. Defaults to
+                "description".
+            batch_size (int, optional): Rows read at a time. Defaults to
+                1,000,000.
+
+        Returns:
+            int: Number of rows written.
+        """
+        parquet_file = pq.ParquetFile(source, read_dictionary=[column])
+        n_rows = 0
+        writer: Optional[pq.ParquetWriter] = None
+        try:
+            for batch in self.lookup_batches(
+                parquet_file.iter_batches(batch_size=batch_size), column=column
+            ):
+                if writer is None:
+                    writer = pq.ParquetWriter(destination, batch.schema)
+                writer.write_batch(batch)
+                n_rows += batch.num_rows
+        finally:
+            if writer is not None:
+                writer.close()
+        return n_rows
@@ -0,0 +1,198 @@
+"""This module provides the `SOCAutocomplete` class, a prefix search over the
+job titles of the SOC coding index, for type-ahead in interviewer facing tools.
+
+Titles are held in a sorted array, so all titles starting with a prefix form
+one contiguous slice which is found with two binary searches.
+
+Usage:
+    ```
+    soc_lookup = SOCLookup()
+    autocomplete = SOCAutocomplete.from_lookup(soc_lookup)
+    autocomplete.complete("zoo", top_n=5)
+    ```
+"""
+
+import heapq
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from occupational_classification.lookup.soc_lookup import SOCLookup
+
+# Largest code point, used to find the end of the slice sharing a prefix.
+_MAX_CHAR = "\U0010ffff"
+
+
+def normalise_prefix(prefix: str) -> str:
+    """Casefolds the prefix and collapses whitespace.
+
+    A single trailing space is kept, so "head " completes to "head teacher"
+    but not to "headteacher".
+
+    Args:
+        prefix (str): Text typed so far.
+
+    Returns:
+        str: Prefix in the same form as the indexed titles.
+    """
+    collapsed = " ".join(prefix.casefold().split())
+    if collapsed and prefix[-1:].isspace():
+        collapsed += " "
+    return collapsed
+
+
+class SOCAutocomplete:
+    """Prefix search over job titles with their SOC codes.
+
+    Attributes:
+        titles (list[str]): Sorted, casefolded job titles.
+        codes (list[str]): SOC code for each entry of `titles`.
+        frequencies (list[int]): Frequency for each entry of `titles`, used
+            for ranking.
+
+    Methods:
+        complete(prefix: str, top_n: int = 10, rank_by_frequency: bool = False)
+            -> list[dict[str, Any]]:
+            Returns completions for the prefix.
+    """
+
+    def __init__(
+        self,
+        entries: Iterable[tuple[str, str]],
+        frequencies: Optional[Mapping[str, int]] = None,
+        precompute_threshold: int = 256,
+        precompute_top_n: int = 20,
+    ):
+        """Initialises the SOCAutocomplete class.
+
+        Args:
+            entries (Iterable[tuple[str, str]]): Pairs of job title and SOC code.
+                Repeated pairs are counted, the count is the default frequency.
+            frequencies (Mapping[str, int], optional): Frequency of each job
+                title, for example from previous survey responses. Titles not
+                in the mapping have frequency 0. Defaults to the number of
+                times each title occurs in `entries`.
+            precompute_threshold (int, optional): Ranked completions are
+                precomputed for every prefix matching more titles than this,
+                so ranking at query time never scans more titles than this.
+                Defaults to 256.
+            precompute_top_n (int, optional): Number of ranked completions
+                precomputed for each short prefix. Defaults to 20.
+        """
+        counts = Counter((title.casefold(), code) for title, code in entries)
+        ordered = sorted(counts)
+        self.titles: list[str] = [title for title, _code in ordered]
+        self.codes: list[str] = [code for _title, code in ordered]
+        if frequencies is None:
+            self.frequencies: list[int] = [counts[entry] for entry in ordered]
+        else:
+            casefolded = {
+                title.casefold(): frequency for title, frequency in frequencies.items()
+            }
+            self.frequencies = [casefolded.get(title, 0) for title in self.titles]
+
+        self.precompute_top_n = precompute_top_n
+        self._ranked: dict[str, list[int]] = self._precompute_ranked(
+            precompute_threshold
+        )
+
+    @classmethod
+    def from_lookup(
+        cls, soc_lookup: "SOCLookup", frequencies: Optional[Mapping[str, int]] = None
+    ) -> "SOCAutocomplete":
+        """Builds the prefix search from the data of a `SOCLookup`.
+
+        Args:
+            soc_lookup (SOCLookup): Lookup providing `data` with `description`
+                and `label` columns.
+            frequencies (Mapping[str, int], optional): Frequency of each job
+                title. Defaults to the number of occurrences in the index.
+
+        Returns:
+            SOCAutocomplete: Prefix search over the coding index.
+        """
+        data = soc_lookup.data
+        return cls(
+            zip(data["description"].tolist(), data["label"].tolist(), strict=True),
+            frequencies=frequencies,
+        )
+
+    def __len__(self):
+        return len(self.titles)
+
+    def _span(self, prefix: str) -> tuple[int, int]:
+        """Returns the slice of `titles` starting with the prefix."""
+        start = bisect_left(self.titles, prefix)
+        end = bisect_right(self.titles, prefix + _MAX_CHAR, lo=start)
+        return start, end
+
+    def _top_positions(self, start: int, end: int, top_n: int) -> list[int]:
+        """Returns positions in the slice with the highest frequency.
+
+        Ties are broken alphabetically, i.e. by position.
+        """
+        return heapq.nsmallest(
+            top_n, range(start, end), key=lambda pos: (-self.frequencies[pos], pos)
+        )
+
+    def _precompute_ranked(self, threshold: int) -> dict[str, list[int]]:
+        """Precomputes ranked completions for prefixes matching many titles.
+
+        Prefixes are extended one character at a time, only below prefixes
+        which themselves match more than `threshold` titles.
+        """
+        ranked: dict[str, list[int]] = {}
+        prefixes = {""}
+        length = 0
+        while prefixes:
+            longer_prefixes = set()
+            for prefix in prefixes:
+                start, end = self._span(prefix)
+                if end - start <= threshold:
+                    continue
+                ranked[prefix] = self._top_positions(start, end, self.precompute_top_n)
+                longer_prefixes.update(
+                    title[: length + 1]
+                    for title in self.titles[start:end]
+                    if len(title) > length
+                )
+            prefixes = longer_prefixes
+            length += 1
+        return ranked
+
+    def complete(
+        self, prefix: str, top_n: int = 10, rank_by_frequency: bool = False
+    ) -> list[dict[str, Any]]:
+        """Returns job titles starting with the prefix, with their SOC codes.
+
+        Args:
+            prefix (str): Text typed so far, matched case insensitively.
+            top_n (int, optional): Maximum number of completions. Defaults to 10.
+            rank_by_frequency (bool, optional): Order by frequency (highest
+                first) instead of alphabetically. Defaults to False.
+
+        Returns:
+            list[dict[str, Any]]: Completions, each with `description`, `code`
+            and `frequency`.
+        """
+        prefix = normalise_prefix(prefix)
+        if top_n <= 0:
+            return []
+        if rank_by_frequency:
+            positions = self._ranked.get(prefix)
+            if positions is None or top_n > self.precompute_top_n:
+                positions = self._top_positions(*self._span(prefix), top_n)
+            positions = positions[:top_n]
+        else:
+            start, end = self._span(prefix)
+            positions = list(range(start, min(end, start + top_n)))
+        return [
+            {
+                "description": self.titles[pos],
+                "code": self.codes[pos],
+                "frequency": self.frequencies[pos],
+            }
+            for pos in positions
+        ]
@@ -0,0 +1,132 @@
+"""This module provides `DeduplicatedBatch`, a batch stage which normalises
+and deduplicates survey responses so that each distinct response is
+classified once and the results are scattered back to the original rows.
+
+Raw values are deduplicated first (in pandas), so the normaliser only runs
+once per distinct raw value, then again after normalisation.
+
+Usage:
+    ```
+    batch = DeduplicatedBatch(responses, normaliser=TextNormaliser())
+    results = batch.map(soc_lookup.lookup)
+    batch.dedup_ratio
+    ```
+"""
+
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+
+class DeduplicatedBatch:
+    """Distinct normalised values of a batch and the row each maps to.
+
+    Attributes:
+        values (list): One representative input value (the first seen) for
+            each distinct normalised value.
+        normalised (list): The distinct normalised values.
+        keys (np.ndarray): Position in `values` of each input row, -1 for
+            missing values.
+        index (pd.Index): Index of the input (a RangeIndex for non-Series).
+        n_inputs (int): Number of input rows.
+    """
+
+    def __init__(
+        self, values: Iterable, normaliser: Optional[Callable[[str], str]] = None
+    ):
+        """Normalises and deduplicates the values.
+
+        Args:
+            values (Iterable): Input values, e.g. a list or pd.Series of
+                strings. Missing values are not classified.
+            normaliser (Callable[[str], str], optional): Applied to string
+                values before deduplication, e.g. `TextNormaliser()`. Defaults
+                to deduplicating the raw values.
+        """
+        series = (
+            values
+            if isinstance(values, pd.Series)
+            else pd.Series(list(values), dtype=object)
+        )
+        raw_keys, raw_uniques = pd.factorize(series)
+        raw_uniques = list(raw_uniques)
+        if normaliser is None:
+            normalised_keys = np.arange(len(raw_uniques))
+            self.normalised: list = raw_uniques
+            self.values: list = raw_uniques
+        else:
+            normalised_keys, normalised = pd.factorize(
+                pd.Series(
+                    [
+                        normaliser(value) if isinstance(value, str) else value
+                        for value in raw_uniques
+                    ],
+                    dtype=object,
+                )
+            )
+            self.normalised = list(normalised)
+            self.values = [None] * len(self.normalised)
+            # Walk backwards, so the first raw value seen is kept
+            for raw_value, key in zip(
+                reversed(raw_uniques), reversed(normalised_keys.tolist()), strict=True
+            ):
+                self.values[key] = raw_value
+
+        self.keys = np.append(normalised_keys, -1)[raw_keys]
+        self.index = series.index
+        self.n_inputs = len(series)
+
+    def __len__(self):
+        return self.n_inputs
+
+    @property
+    def n_unique(self) -> int:
+        """Number of distinct normalised values, i.e. of classifications."""
+        return len(self.values)
+
+    @property
+    def dedup_ratio(self) -> float:
+        """Share of the input rows which need no classification of their own."""
+        if not self.n_inputs:
+            return 0.0
+        return 1 - self.n_unique / self.n_inputs
+
+    def scatter(self, unique_results: Sequence, missing: Any = None) -> pd.Series:
+        """Maps one result per distinct value back to the input rows.
+
+        Args:
+            unique_results (Sequence): Result for each entry of `values`.
+            missing (Any, optional): Result for missing values. Defaults to
+                None.
+
+        Returns:
+            pd.Series: Result of each input row, with the input index. Rows
+            sharing a normalised value share the same result object.
+
+        Raises:
+            ValueError: If there is not one result per distinct value.
+        """
+        if len(unique_results) != self.n_unique:
+            raise ValueError(
+                f"Expected {self.n_unique} results, got {len(unique_results)}."
+            )
+        results = np.empty(self.n_unique + 1, dtype=object)
+        # Filled one by one, so that sequences are not unpacked into arrays
+        for pos, result in enumerate([*unique_results, missing]):
+            results[pos] = result
+        return pd.Series(results[self.keys], index=self.index, dtype=object)
+
+    def map(self, function: Callable[[Any], Any], missing: Any = None) -> pd.Series:
+        """Applies the function once per distinct value and scatters results.
+
+        Args:
+            function (Callable): Classifier applied to each of `values`.
+            missing (Any, optional): Result for missing values. Defaults to
+                None.
+
+        Returns:
+            pd.Series: Result of each input row, see `scatter`.
+        """
+        return self.scatter([function(value) for value in self.values], missing)
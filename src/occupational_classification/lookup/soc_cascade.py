@@ -0,0 +1,326 @@
+"""This module provides `CascadeLookup`, which matches a description through
+a sequence of increasingly expensive and less certain stages and stops at
+the first answer that is confident enough.
+
+The stages, in their default order, are:
+
+    - "exact": the lower case description is an index title,
+    - "normalised": the normalised description is an index title,
+    - "token": index titles mentioned in the description, as whole words
+      (see `TitleScanner`),
+    - "fuzzy": the normalised description after spelling correction (see
+      `SpellingCorrector`),
+    - "free_text": BM25 ranking of unit groups (see `BM25Index`).
+
+Each stage proposes at most one code with a confidence between 0 and 1. The
+confidences are heuristics, comparable between requests rather than
+calibrated probabilities:
+
+    - exact 1.0 and normalised 0.95,
+    - token: the share of the description's title words (words found in
+      some index title) covered by titles of the proposed code, so other
+      words do not count and titles of other codes count against it,
+    - fuzzy: 1 minus the edits made per character of the description,
+    - free_text: the relative margin of the best score over the second,
+      times the share of the description's words known to the index.
+
+A request may have a deadline; stages which would start after it are
+skipped, while a stage already running is not interrupted. The response
+reports the stage which answered and the time taken by every stage run, so
+each endpoint can choose its stages, threshold and deadline to trade
+accuracy for latency.
+
+Usage:
+    ```
+    cascade = CascadeLookup.from_lookup(soc_lookup, hierarchy=soc)
+    cascade.lookup("I look after the animals at a zoo", deadline=0.005)
+    ```
+"""
+
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, Optional
+
+from occupational_classification.lookup.soc_scanner import TitleScanner
+from occupational_classification.search.soc_bm25 import BM25Index
+from occupational_classification.utils.metrics import OPERATION_SECONDS, observe
+from occupational_classification.utils.spelling import SpellingCorrector
+
+if TYPE_CHECKING:
+    from occupational_classification.hierarchy.soc_hierarchy import SOC
+    from occupational_classification.lookup.soc_lookup import SOCLookup
+
+STAGES = ("exact", "normalised", "token", "fuzzy", "free_text")
+NORMALISED_CONFIDENCE = 0.95
+
+
+class CascadeStage(ABC):
+    """A stage of `CascadeLookup`, proposing a code for a description.
+
+    Subclasses implement `match`, and cannot be created otherwise.
+
+    Attributes:
+        name (str): Name reported in responses.
+    """
+
+    name = "stage"
+
+    @abstractmethod
+    def match(
+        self, description: str, normalised: str
+    ) -> Optional[tuple[str, float, str]]:
+        """Proposes a code for a description.
+
+        Args:
+            description (str): The description, in lower case.
+            normalised (str): The description normalised by the lookup.
+
+        Returns:
+            Optional[tuple[str, float, str]]: The code, the confidence and
+            the index text matched; None without a proposal.
+        """
+
+
+class ExactStage(CascadeStage):
+    """Matches descriptions which are index titles."""
+
+    name = "exact"
+
+    def __init__(self, soc_lookup: "SOCLookup"):
+        self.lookup_dict = soc_lookup.lookup_dict
+
+    def match(self, description, normalised):
+        code = self.lookup_dict.get(description)
+        return None if code is None else (code, 1.0, description)
+
+
+class NormalisedStage(CascadeStage):
+    """Matches descriptions which are index titles once normalised."""
+
+    name = "normalised"
+
+    def __init__(self, soc_lookup: "SOCLookup"):
+        self.normalised_lookup_dict = soc_lookup.normalised_lookup_dict
+
+    def match(self, description, normalised):
+        code = self.normalised_lookup_dict.get(normalised)
+        return None if code is None else (code, NORMALISED_CONFIDENCE, normalised)
+
+
+class TokenStage(CascadeStage):
+    """Finds index titles mentioned as whole words in the description."""
+
+    name = "token"
+
+    def __init__(self, scanner: TitleScanner):
+        self.scanner = scanner
+        self.title_words = {word for title in scanner.titles for word in title.split()}
+
+    def match(self, description, normalised):
+        matches = self.scanner.scan(description)
+        if not matches:
+            return None
+        n_words = sum(word in self.title_words for word in normalised.split())
+        covered: dict[str, int] = {}
+        titles: dict[str, str] = {}
+        for found in matches:
+            covered[found["code"]] = covered.get(found["code"], 0) + len(
+                found["title"].split()
+            )
+            titles.setdefault(found["code"], found["title"])
+        code = max(covered, key=covered.__getitem__)
+        return code, min(covered[code] / max(n_words, 1), 1.0), titles[code]
+
+
+class FuzzyStage(CascadeStage):
+    """Matches descriptions which are index titles after spelling correction."""
+
+    name = "fuzzy"
+
+    def __init__(self, soc_lookup: "SOCLookup", corrector: SpellingCorrector):
+        self.normalised_lookup_dict = soc_lookup.normalised_lookup_dict
+        self.corrector = corrector
+
+    def match(self, description, normalised):
+        corrected, distance = self.corrector.correct_with_distance(normalised)
+        code = self.normalised_lookup_dict.get(corrected)
+        if code is None:
+            return None
+        n_characters = max(len(normalised.replace(" ", "")), 1)
+        return code, max(1 - distance / n_characters, 0.0), corrected
+
+
+class FreeTextStage(CascadeStage):
+    """Ranks unit groups for the description with BM25."""
+
+    name = "free_text"
+
+    def __init__(self, bm25: BM25Index):
+        self.bm25 = bm25
+
+    def match(self, description, normalised):
+        results = self.bm25.search(description, top_k=2)
+        n_words = len(normalised.split())
+        if not results or not n_words:
+            return None
+        best = results[0]
+        runner_up = results[1]["score"] if len(results) > 1 else 0.0
+        margin = 1 - runner_up / best["score"]
+        known = len(self.bm25.query_terms(description)) / n_words
+        return best["code"], margin * min(known, 1.0), best["title"]
+
+
+class CascadeLookup:
+    """Matches descriptions through stages, stopping at a confident answer.
+
+    Attributes:
+        soc_lookup (SOCLookup): Lookup whose normaliser prepares descriptions.
+        stages (list[CascadeStage]): Stages, in the order they are tried.
+        threshold (float): Lowest confidence accepted.
+
+    Methods:
+        lookup(description: str, ...) -> dict[str, Any]:
+            Matches a description, reporting the stages run.
+    """
+
+    def __init__(
+        self,
+        soc_lookup: "SOCLookup",
+        stages: Sequence[CascadeStage],
+        threshold: float = 0.75,
+    ):
+        """Creates the cascade.
+
+        Args:
+            soc_lookup (SOCLookup): Lookup whose normaliser prepares
+                descriptions.
+            stages (Sequence[CascadeStage]): Stages, in the order they are
+                tried.
+            threshold (float, optional): Lowest confidence accepted, from 0
+                to 1. Defaults to 0.75.
+
+        Raises:
+            ValueError: If the threshold is not between 0 and 1.
+        """
+        if not 0 <= threshold <= 1:
+            raise ValueError("threshold must be between 0 and 1.")
+        self.soc_lookup = soc_lookup
+        self.stages = list(stages)
+        self.threshold = threshold
+
+    @classmethod
+    def from_lookup(
+        cls,
+        soc_lookup: "SOCLookup",
+        hierarchy: Optional["SOC"] = None,
+        stages: Optional[Sequence[str]] = None,
+        threshold: float = 0.75,
+    ) -> "CascadeLookup":
+        """Builds the named stages over a lookup.
+
+        The fuzzy stage uses the lookup's spelling corrector when enabled
+        (see `SOCLookup.enable_spelling_correction`), else builds one.
+
+        Args:
+            soc_lookup (SOCLookup): Lookup providing the index.
+            hierarchy (SOC, optional): Hierarchy for the "free_text" stage.
+                Defaults to None, for cascades without that stage.
+            stages (Sequence[str], optional): Names of the stages, in the
+                order they are tried. Defaults to `STAGES`, without
+                "free_text" when no hierarchy is given.
+            threshold (float, optional): Lowest confidence accepted. Defaults
+                to 0.75.
+
+        Returns:
+            CascadeLookup: The cascade.
+
+        Raises:
+            ValueError: If a stage name is not known, or "free_text" is
+                asked for without a hierarchy.
+        """
+        if stages is None:
+            stages = [
+                name for name in STAGES if name != "free_text" or hierarchy is not None
+            ]
+        unknown = [name for name in stages if name not in STAGES]
+        if unknown:
+            raise ValueError(f"Unknown stages {unknown}, use {list(STAGES)}.")
+        if "free_text" in stages and hierarchy is None:
+            raise ValueError('The "free_text" stage needs a hierarchy.')
+        built: list[CascadeStage] = []
+        for name in stages:
+            if name == "exact":
+                built.append(ExactStage(soc_lookup))
+            elif name == "normalised":
+                built.append(NormalisedStage(soc_lookup))
+            elif name == "token":
+                built.append(TokenStage(TitleScanner.from_lookup(soc_lookup)))
+            elif name == "fuzzy":
+                corrector = soc_lookup.spelling_corrector
+                if corrector is None:
+                    corrector = SpellingCorrector.from_lookup(soc_lookup)
+                built.append(FuzzyStage(soc_lookup, corrector))
+            else:
+                built.append(FreeTextStage(BM25Index.from_hierarchy(hierarchy)))
+        return cls(soc_lookup, built, threshold=threshold)
+
+    def lookup(
+        self,
+        description: str,
+        deadline: Optional[float] = None,
+        threshold: Optional[float] = None,
+    ) -> dict[str, Any]:
+        """Matches a description, trying the stages in order.
+
+        Args:
+            description (str): The description to look up.
+            deadline (float, optional): Seconds the request may take. Stages
+                are not started once it has passed. Defaults to no deadline.
+            threshold (float, optional): Lowest confidence accepted for this
+                request. Defaults to `threshold`.
+
+        Returns:
+            dict[str, Any]: `description` (lower case), `code`, `confidence`,
+            `stage` (the stage which answered) and `match` (the index text
+            matched), all None when no stage was confident enough;
+            `deadline_exceeded`, whether stages were skipped for the
+            deadline; and `stages`, the `stage`, `seconds`, `code` and
+            `confidence` of each stage run, in order.
+        """
+        start = time.perf_counter()
+        threshold = self.threshold if threshold is None else threshold
+        description = description.lower()
+        normalised = self.soc_lookup.normaliser(description)
+        response: dict[str, Any] = {
+            "description": description,
+            "code": None,
+            "confidence": None,
+            "stage": None,
+            "match": None,
+            "deadline_exceeded": False,
+            "stages": [],
+        }
+        for stage in self.stages:
+            stage_start = time.perf_counter()
+            if deadline is not None and stage_start - start >= deadline:
+                response["deadline_exceeded"] = True
+                break
+            proposal = stage.match(description, normalised)
+            seconds = time.perf_counter() - stage_start
+            observe(OPERATION_SECONDS, seconds, operation=f"cascade_{stage.name}")
+            code, confidence, match = proposal or (None, None, None)
+            response["stages"].append(
+                {
+                    "stage": stage.name,
+                    "seconds": seconds,
+                    "code": code,
+                    "confidence": confidence,
+                }
+            )
+            if confidence is not None and confidence >= threshold:
+                response.update(
+                    code=code, confidence=confidence, stage=stage.name, match=match
+                )
+                break
+        return response
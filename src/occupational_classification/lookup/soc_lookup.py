@@ -13,25 +13,104 @@ To access data:
 Classes:
     SOCLookup: A class for loading SOC data, performing lookups, and managing metadata.
     SOCRephraseLookup: A class for performing rephrased lookups of SOC codes.
+    FrozenSOCLookup, FrozenSOCRephraseLookup: Read-only snapshots of the above,
+        safe to share between threads (see `freeze`).
+
+Lookups pickle compactly, e.g. to send them to worker processes: the index is
+sent once, with codes by position, and the exact lookup dictionary is rebuilt
+from it when unpickled.
 """
 
+import copy
+import re
+import sys
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
 from typing import Any, Optional, Union
 
-from occupational_classification._config.main import get_config
+import numpy as np
+import pandas as pd
+
+from occupational_classification._config.main import check_file_exists, get_config
 from occupational_classification.data_access.soc_data_access import (
     load_soc_index,
 )
+from occupational_classification.lookup.condensed_lookup import CondensedLookup
+from occupational_classification.lookup.soc_batch import DeduplicatedBatch
+from occupational_classification.lookup.soc_substring import (
+    SubstringIndex,
+    is_literal,
+)
 from occupational_classification.meta.soc_meta import SocMeta
+from occupational_classification.utils.frozen import (
+    FrozenMixin,
+    freeze_mapping,
+    unpickle_frozen,
+)
+from occupational_classification.utils.memory import intern_strings
+from occupational_classification.utils.metrics import (
+    CACHE_REQUESTS_TOTAL,
+    ERRORS_TOTAL,
+    count,
+    timed,
+)
+from occupational_classification.utils.normalisation import (
+    TextNormaliser,
+    build_normalised_lookup,
+)
+from occupational_classification.utils.spelling import SpellingCorrector
 
 UNIT_CODE_LEN = 4
 
 
+def _is_configured_index(data_path: str) -> bool:
+    """Whether a path is the SOC index of the config, whose structure is the
+    config's `soc_structure`.
+    """
+    return check_file_exists(data_path) == Path(
+        get_config()["data_source"]["soc_index"]
+    )
+
+
+def _compact_index(index: pd.Index) -> Any:
+    """Returns a non-negative integer index as the smallest integer array
+    holding it, with its dtype, for pickling; other indexes as they are.
+    """
+    if (
+        pd.api.types.is_integer_dtype(index.dtype)
+        and not isinstance(index, pd.RangeIndex)
+        and len(index)
+        and index.min() >= 0
+    ):
+        return index.to_numpy().astype(np.min_scalar_type(index.max())), index.dtype
+    return index
+
+
+def _restore_index(index: Any) -> pd.Index:
+    """Reverses `_compact_index`."""
+    if isinstance(index, tuple):
+        values, dtype = index
+        return pd.Index(values, dtype=dtype)
+    return index
+
+
 class SOCLookup:
     """A class for performing lookups of SOC codes based on descriptions.
 
     Attributes:
         data (pd.DataFrame): The SOC data loaded from a CSV file.
         lookup_dict (dict[str, str]): A dictionary mapping descriptions to SOC codes.
+        normaliser (TextNormaliser): Normalisation applied to the index and queries.
+        normalised_lookup_dict (dict[str, str]): A dictionary mapping normalised
+            descriptions to SOC codes, used when there is no exact match.
+        spelling_corrector (Optional[SpellingCorrector]): Correction applied to
+            normalised queries which still have no match, None (the default)
+            to disable it, see `enable_spelling_correction`.
+        substring_index (Optional[SubstringIndex]): Suffix array answering
+            literal similarity searches without a scan, None (the default) to
+            scan, see `enable_substring_index`.
         meta (SocDB): Metadata for SOC classifications.
 
     Methods:
@@ -39,106 +118,607 @@ class SOCLookup:
             Looks up an SOC code based on the given description.
     """
 
+    # Rows scanned at a time by paged similarity searches.
+    SIMILARITY_CHUNK_SIZE = 2048
+
     def __init__(
         self,
-        data_path: str = get_config()["data_source"]["soc_index"],
+        data_path: Optional[str] = None,
+        normaliser: Optional[TextNormaliser] = None,
+        meta: Optional[SocMeta] = None,
+        soc_index: Optional[pd.DataFrame] = None,
+        structure_data_path: Optional[str] = None,
     ):
         """Initialises the SOCLookup class by loading SOC data from a CSV file.
 
         Args:
-            data_path (str): The path to the CSV file containing SOC data.
+            data_path (str, optional): The path to the SOC index. Defaults to
+                `soc_index` from the config, read when the lookup is created.
+            normaliser (TextNormaliser, optional): Normalisation applied to the
+                index and to queries without an exact match. Defaults to
+                `TextNormaliser()`.
+            meta (SocMeta, optional): Already loaded SOC metadata, shared
+                instead of loading the SOC structure again.
+            soc_index (pd.DataFrame, optional): SOC index already loaded with
+                `load_soc_index`, used instead of reading `data_path`.
+            structure_data_path (str, optional): The path to the SOC structure
+                of the index, read when `meta` is not given. Defaults to
+                `soc_structure` from the config, which is only assumed for
+                the config's own `soc_index`.
+
+        Raises:
+            ValueError: If `data_path` is not the config's `soc_index` and
+                neither `meta` nor `structure_data_path` is given, as the
+                index would otherwise be paired with another release's
+                structure.
         """
-        self.data = self.data_preparation(data_path)
-        self.lookup_dict: dict[str, str] = self.data.set_index("description").to_dict()[
-            "label"
-        ]
-        self.meta: SocMeta = SocMeta(get_config()["data_source"]["soc_structure"])
+        if (
+            meta is None
+            and structure_data_path is None
+            and data_path is not None
+            and not _is_configured_index(data_path)
+        ):
+            raise ValueError(
+                f"SOC index {data_path} is not the configured soc_index, give its "
+                "meta or structure_data_path."
+            )
+        self.data = self.data_preparation(data_path, soc_index=soc_index)
+        self.lookup_dict: dict[str, str] = self.build_lookup()
+        self.normaliser = normaliser if normaliser is not None else TextNormaliser()
+        self.normalised_lookup_dict = self.build_normalised_lookup()
+        self.spelling_corrector: Optional[SpellingCorrector] = None
+        self.substring_index: Optional[SubstringIndex] = None
+        if meta is None:
+            if structure_data_path is None:
+                structure_data_path = get_config()["data_source"]["soc_structure"]
+            meta = SocMeta(structure_data_path)
+        self.meta: SocMeta = meta
+
+    @classmethod
+    def from_tables(
+        cls,
+        soc_index: pd.DataFrame,
+        normalised_lookup_dict: dict[str, str],
+        normaliser: TextNormaliser,
+        meta: SocMeta,
+    ) -> "SOCLookup":
+        """Creates a lookup from an already built normalised lookup table,
+        e.g. read back from an artefact, without normalising the index again.
+
+        Args:
+            soc_index (pd.DataFrame): SOC index, as returned by `load_soc_index`.
+            normalised_lookup_dict (dict[str, str]): Normalised descriptions to
+                SOC codes, built by `build_normalised_lookup` with `normaliser`.
+            normaliser (TextNormaliser): Normalisation applied to queries.
+            meta (SocMeta): Already loaded SOC metadata.
+
+        Returns:
+            SOCLookup: The lookup.
+        """
+        soc_lookup = cls.__new__(cls)
+        soc_lookup.data = soc_lookup.data_preparation(None, soc_index=soc_index)
+        soc_lookup.lookup_dict = soc_lookup.build_lookup()
+        soc_lookup.normaliser = normaliser
+        soc_lookup.normalised_lookup_dict = normalised_lookup_dict
+        soc_lookup.spelling_corrector = None
+        soc_lookup.substring_index = None
+        soc_lookup.meta = meta
+        return soc_lookup
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Returns the state pickled: the descriptions of the index, the
+        position of each row's code among the distinct codes, the normalised
+        lookup table by code position, and the other components. The exact
+        lookup dictionary is rebuilt from the index.
+        """
+        data = self.data
+        keys, codes = pd.factorize(data["label"])
+        positions = {code: pos for pos, code in enumerate(codes.tolist())}
+        key_type = np.min_scalar_type(max(len(codes) - 1, 0))
+        return {
+            "index": _compact_index(data.index),
+            "descriptions": data["description"].tolist(),
+            "codes": codes.tolist(),
+            "code_keys": keys.astype(key_type),
+            "normalised_descriptions": list(self.normalised_lookup_dict),
+            "normalised_code_keys": np.array(
+                [positions[code] for code in self.normalised_lookup_dict.values()],
+                dtype=key_type,
+            ),
+            "normaliser": self.normaliser,
+            "spelling_corrector": self.spelling_corrector,
+            "substring_index": self.substring_index,
+            "meta": self.meta,
+        }
 
-    def data_preparation(self, data_path):
+    def __setstate__(self, state: dict[str, Any]):
+        codes = list(map(sys.intern, state["codes"]))
+        labels = [codes[key] for key in state["code_keys"].tolist()]
+        descriptions = state["descriptions"]
+        self.data = pd.DataFrame(
+            {"label": labels, "description": descriptions},
+            index=_restore_index(state["index"]),
+        )
+        # As `build_lookup`, sharing the interned codes
+        self.lookup_dict = dict(zip(descriptions, labels, strict=True))
+        self.normaliser = state["normaliser"]
+        self.normalised_lookup_dict = dict(
+            zip(
+                state["normalised_descriptions"],
+                [codes[key] for key in state["normalised_code_keys"].tolist()],
+                strict=True,
+            )
+        )
+        self.spelling_corrector = state["spelling_corrector"]
+        self.substring_index = state["substring_index"]
+        self.meta = state["meta"]
+
+    def data_preparation(
+        self, data_path: Optional[str], soc_index: Optional[pd.DataFrame] = None
+    ):
         """Converts the data for useful format for lookup method.
 
+        Args:
+            data_path (str, optional): The path to the file containing SOC
+                data. Defaults to `soc_index` from the config.
+            soc_index (pd.DataFrame, optional): SOC index already loaded with
+                `load_soc_index`, used instead of reading `data_path`.
+
         Returns:
             pd.DataFrame: A DataFrame containing data useful for lookups.
         """
-        data = load_soc_index(data_path)
+        if soc_index is None:
+            if data_path is None:
+                data_path = get_config()["data_source"]["soc_index"]
+            data = load_soc_index(data_path)
+        else:
+            data = soc_index.copy()
         data["label"] = data["code"]
         data["description"] = data["title"].str.lower()
         data = data.drop(["title", "code"], axis=1)
         return data
 
-    def lookup(self, description: str, similarity: bool = False) -> dict[str, Any]:
-        """Looks up an SOC code based on the given description.
+    def build_lookup(self) -> dict[str, str]:
+        """Builds the lookup dictionary for descriptions, from `data`.
+
+        Returns:
+            dict[str, str]: A dictionary mapping descriptions to SOC codes; a
+            description listed more than once takes its last code.
+        """
+        # Interned, so the ~400 codes are shared rather than copied per title.
+        return intern_strings(
+            dict(
+                zip(
+                    self.data["description"].tolist(),
+                    self.data["label"].tolist(),
+                    strict=True,
+                )
+            )
+        )
+
+    def build_normalised_lookup(self) -> dict[str, str]:
+        """Builds the lookup dictionary for normalised descriptions.
+
+        Normalised descriptions which map to more than one SOC code are
+        ambiguous and are left out, so they can only be matched exactly.
+
+        Returns:
+            dict[str, str]: A dictionary mapping normalised descriptions to SOC codes.
+        """
+        return build_normalised_lookup(self.lookup_dict.items(), self.normaliser)
+
+    def enable_spelling_correction(
+        self, corrector: Optional[SpellingCorrector] = None, **kwargs
+    ) -> SpellingCorrector:
+        """Corrects misspelt words of queries which have no match otherwise.
+
+        Args:
+            corrector (SpellingCorrector, optional): Corrector to use. Defaults
+                to one built over the words of the index, see
+                `SpellingCorrector.from_lookup`.
+            **kwargs: Passed to `SpellingCorrector.from_lookup`.
+
+        Returns:
+            SpellingCorrector: The corrector now in use.
+        """
+        if corrector is None:
+            corrector = SpellingCorrector.from_lookup(self, **kwargs)
+        self.spelling_corrector = corrector
+        return corrector
+
+    def enable_substring_index(self) -> SubstringIndex:
+        """Builds a suffix array over the index for similarity searches.
+
+        Similarity searches for literal text (see `is_literal`) then find
+        their matches by binary search instead of scanning every
+        description, with the same results; paged searches report exact
+        counts. Other searches are still read as regular expressions and
+        scanned.
+
+        Returns:
+            SubstringIndex: The index now in use.
+        """
+        self.substring_index = SubstringIndex.from_lookup(self)
+        return self.substring_index
+
+    def match_code(self, description: str) -> Optional[str]:
+        """Finds the SOC code for a description, exactly, after normalisation
+        or, if enabled, after spelling correction of the normalised words.
 
         Args:
             description (str): The description to look up.
-            similarity (bool, optional): Whether to perform a similarity-based lookup.
-                                         Defaults to False.
 
         Returns:
-            dict[str, Any]: A dictionary containing the matching SOC code and metadata.
+            Optional[str]: The matching SOC code, None if there is no match.
         """
         description = description.lower()
+        matching_code = self.lookup_dict.get(description)
+        if matching_code is None:
+            normalised = self.normaliser(description)
+            matching_code = self.normalised_lookup_dict.get(normalised)
+            if matching_code is None and self.spelling_corrector is not None:
+                matching_code = self.normalised_lookup_dict.get(
+                    self.spelling_corrector.correct(normalised)
+                )
+        return matching_code
 
-        matching_code: Optional[str] = self.lookup_dict.get(description)
-        matching_code_meta: Optional[dict[str, Any]] = None
-        major_group_meta: Optional[dict[str, Any]] = None
+    def output_categories(self) -> dict[str, pd.Index]:
+        """Returns the fixed categories used by batch outputs.
 
-        # Extract the first digit of the code as code_major_group
-        matching_code_major_group: Optional[str] = None
-        if matching_code:
-            # Lookup the most aggregated (Major) group
-            matching_code_major_group = matching_code[:1]
-            # Lookup the meta data for the code
-            matching_code_meta = self.meta.get_meta_by_code(matching_code)
-            major_group_meta = self.meta.get_meta_by_code(matching_code_major_group)
+        Returns:
+            dict[str, pd.Index]: `code` holds every unit group code (from the
+            SOC structure and the index) and `code_major_group` every Major
+            group code, both sorted.
+        """
+        unit_codes = {
+            item["code"]
+            for item in self.meta.soc_meta
+            if len(item["code"]) == UNIT_CODE_LEN
+        }
+        unit_codes.update(self.lookup_dict.values())
+        return {
+            "code": pd.Index(sorted(unit_codes), dtype=object),
+            "code_major_group": pd.Index(
+                sorted({code[:1] for code in unit_codes}), dtype=object
+            ),
+        }
 
-        if not matching_code:
-            matching_code = None
+    def _title_categorical(self, codes: pd.Categorical) -> pd.Categorical:
+        """Maps a categorical of SOC codes to a categorical of group titles."""
+        titles = [
+            self.meta.get_meta_by_code(code).get("group_title")
+            for code in codes.categories
+        ]
+        title_keys, title_categories = pd.factorize(pd.Series(titles, dtype=object))
+        # Position -1 (no code) takes the extra last entry
+        title_keys = np.append(title_keys, -1)
+        return pd.Categorical.from_codes(
+            title_keys[codes.codes], categories=title_categories
+        )
 
-        potential_matches: dict[str, Any] = {}
+    def lookup_batch(self, descriptions: Iterable[str]) -> pd.DataFrame:
+        """Looks up SOC codes for many descriptions, with memory-lean output.
 
-        if similarity:
-            # Check if the description is mentioned elsewhere in the dataset
-            matches = self.data[
-                self.data["description"].str.contains(description, na=False)
-            ]
-            potential_codes = matches["label"].unique()
+        Each distinct description is looked up once (see `match_code`). All
+        columns are categorical: codes and titles are stored as small integers
+        referring to the fixed set of unit and major groups (see
+        `output_categories`), so the output stays small for large batches.
 
-            potential_codes = potential_codes.tolist()
-            potential_descriptions = matches["description"].unique().tolist()
+        Args:
+            descriptions (Iterable[str]): Descriptions to look up, e.g. a list
+                or pd.Series. Missing values have no match.
 
-            major_group_codes = list({str(code)[:1] for code in potential_codes})
+        Returns:
+            pd.DataFrame: One row per description (keeping the index of a
+            pd.Series) with columns `description`, `code`, `code_title`,
+            `code_major_group` and `code_major_group_title`; codes and titles
+            are missing where there is no match.
+        """
+        values = (
+            descriptions
+            if isinstance(descriptions, pd.Series)
+            else pd.Series(list(descriptions), dtype=object)
+        )
+        keys, uniques = pd.factorize(values)
+        categories = self.output_categories()
 
-            # Get meta data associated with each major group code
-            major_groups = [
-                {
-                    "code": major_group_code,
-                    "meta": self.meta.get_meta_by_code(major_group_code),
-                }
-                for major_group_code in major_group_codes
+        unit_positions = {code: pos for pos, code in enumerate(categories["code"])}
+        unique_codes = np.array(
+            [
+                (
+                    unit_positions.get(self.match_code(description), -1)
+                    if isinstance(description, str)
+                    else -1
+                )
+                for description in uniques
             ]
+            + [-1],
+            dtype=np.int32,
+        )
+        code = pd.Categorical.from_codes(
+            unique_codes[keys], categories=categories["code"]
+        )
+
+        major_positions = {
+            code: pos for pos, code in enumerate(categories["code_major_group"])
+        }
+        unit_to_major = np.array(
+            [major_positions[unit[:1]] for unit in categories["code"]] + [-1],
+            dtype=np.int32,
+        )
+        major_group = pd.Categorical.from_codes(
+            unit_to_major[code.codes], categories=categories["code_major_group"]
+        )
+
+        return pd.DataFrame(
+            {
+                "description": pd.Categorical.from_codes(keys, categories=uniques),
+                "code": code,
+                "code_title": self._title_categorical(code),
+                "code_major_group": major_group,
+                "code_major_group_title": self._title_categorical(major_group),
+            },
+            index=values.index,
+        )
+
+    def lookup_arrow(self, descriptions: Any, column: str = "description") -> Any:
+        """Looks up SOC codes for Arrow arrays, record batches or tables, see
+        `ArrowBatchLookup.lookup`. Requires pyarrow.
+
+        Args:
+            descriptions (Any): Arrow array, chunked array, record batch or
+                table of descriptions.
+            column (str, optional): Column of descriptions. Defaults to
+                "description".
+
+        Returns:
+            Any: The Arrow data with dictionary encoded `code`, `code_title`,
+            `code_major_group` and `code_major_group_title` columns.
+        """
+        # Imported here so that pyarrow is only needed for Arrow data
+        from occupational_classification.lookup.soc_arrow import (  # noqa: PLC0415 pylint: disable=import-outside-toplevel
+            ArrowBatchLookup,
+        )
+
+        return ArrowBatchLookup(self).lookup(descriptions, column=column)
+
+    def __len__(self):
+        return len(self.data)
+
+    def _iter_matches(
+        self, description: str, chunk_size: int
+    ) -> Iterator[tuple[int, list[str], list[str]]]:
+        """Scans the index in chunks for descriptions containing the text.
+
+        Yields:
+            tuple[int, list[str], list[str]]: Number of rows scanned, and the
+            matching descriptions with their codes, for each chunk.
+        """
+        for start in range(0, len(self.data), chunk_size):
+            chunk = self.data.iloc[start : start + chunk_size]
+            mask = chunk["description"].str.contains(description, na=False)
+            matches = chunk[mask.to_numpy(dtype=bool)]
+            yield (
+                len(chunk),
+                matches["description"].tolist(),
+                matches["label"].tolist(),
+            )
+
+    def _find_matches(
+        self, description: str, chunk_size: int
+    ) -> Iterator[tuple[int, list[str], list[str]]]:
+        """Finds descriptions containing the text with the substring index
+        when possible, otherwise scans in chunks (see `_iter_matches`).
+        """
+        if self.substring_index is not None and is_literal(description):
+            return iter([(len(self), *self.substring_index.search(description))])
+        return self._iter_matches(description, chunk_size)
+
+    def _major_groups(self, codes: Iterable[str]) -> list[dict[str, Any]]:
+        """Returns the Major group codes of the codes, with their metadata."""
+        major_group_codes = list({str(code)[:1] for code in codes})
+        return [
+            {
+                "code": major_group_code,
+                "meta": self.meta.get_meta_by_code(major_group_code),
+            }
+            for major_group_code in major_group_codes
+        ]
+
+    def similar_descriptions(
+        self, description: str, limit: Optional[int] = None, offset: int = 0
+    ) -> dict[str, Any]:
+        """Finds index descriptions containing the description.
 
-            # Return the potential labels
-            potential_matches = {
-                "descriptions_count": len(matches),
-                "descriptions": potential_descriptions,
+        Without `limit` and `offset` every match is returned. Otherwise the
+        index is scanned in chunks of `SIMILARITY_CHUNK_SIZE` rows and the
+        scan stops once the requested page of unique descriptions is filled,
+        so the cost follows the page asked for rather than the number of
+        matches. The total number of matching rows is then extrapolated from
+        the rows scanned.
+
+        Args:
+            description (str): The (lower case) text to search for.
+            limit (int, optional): Maximum number of unique descriptions to
+                return. Defaults to all.
+            offset (int, optional): Number of unique descriptions to skip.
+                Defaults to 0.
+
+        Returns:
+            dict[str, Any]: `descriptions`, `codes` and `major_groups` with
+            their counts. Paged results also hold `offset`, `limit`,
+            `has_more` and `descriptions_count_is_estimate`, their codes and
+            major groups are those of the returned descriptions.
+
+        Raises:
+            ValueError: If `limit` or `offset` is negative.
+        """
+        if (limit is not None and limit < 0) or offset < 0:
+            raise ValueError("limit and offset must not be negative.")
+        if limit is None and offset == 0:
+            # Check if the description is mentioned elsewhere in the dataset
+            _n_scanned, descriptions, labels = next(
+                self._find_matches(description, max(len(self), 1)), (0, [], [])
+            )
+            potential_codes = list(dict.fromkeys(labels))
+            major_groups = self._major_groups(potential_codes)
+            return {
+                "descriptions_count": len(descriptions),
+                "descriptions": list(dict.fromkeys(descriptions)),
                 "codes_count": len(potential_codes),
                 "codes": potential_codes,
-                "major_groups_count": len(major_group_codes),
+                "major_groups_count": len(major_groups),
                 "major_groups": major_groups,
             }
 
-        response: dict[str, Any] = {
-            "description": description,
-            "code": matching_code,
-            "code_meta": matching_code_meta,
-            "code_major_group": matching_code_major_group,
-            "code_major_group_meta": major_group_meta,
+        needed = None if limit is None else offset + limit + 1
+        codes_by_description: dict[str, dict[str, None]] = {}
+        matched_rows = 0
+        scanned_rows = 0
+        n_rows = len(self)
+        for n_scanned, descriptions, labels in self._find_matches(
+            description, self.SIMILARITY_CHUNK_SIZE
+        ):
+            matched_rows += len(descriptions)
+            scanned_rows += n_scanned
+            for matched_description, code in zip(descriptions, labels, strict=True):
+                codes_by_description.setdefault(matched_description, {})[code] = None
+            if needed is not None and len(codes_by_description) >= needed:
+                break
+
+        is_estimate = scanned_rows < n_rows
+        descriptions = list(codes_by_description)
+        end = None if limit is None else offset + limit
+        page = descriptions[offset:end]
+        potential_codes = list(
+            dict.fromkeys(
+                code
+                for matched_description in page
+                for code in codes_by_description[matched_description]
+            )
+        )
+        major_groups = self._major_groups(potential_codes)
+        return {
+            "descriptions_count": (
+                round(matched_rows * n_rows / scanned_rows)
+                if is_estimate
+                else matched_rows
+            ),
+            "descriptions_count_is_estimate": is_estimate,
+            "descriptions": page,
+            "codes_count": len(potential_codes),
+            "codes": potential_codes,
+            "major_groups_count": len(major_groups),
+            "major_groups": major_groups,
+            "offset": offset,
+            "limit": limit,
+            "has_more": end is not None and len(descriptions) > end,
         }
-        if similarity:
-            response["potential_matches"] = potential_matches
 
-        return response
+    def lookup(
+        self,
+        description: str,
+        similarity: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> dict[str, Any]:
+        """Looks up an SOC code based on the given description.
+
+        Descriptions without an exact match are normalised (see `normaliser`)
+        and looked up again before any similarity search.
+
+        Args:
+            description (str): The description to look up.
+            similarity (bool, optional): Whether to perform a similarity-based lookup.
+                                         Defaults to False.
+            limit (int, optional): Maximum number of similar descriptions to
+                return, see `similar_descriptions`. Defaults to all.
+            offset (int, optional): Number of similar descriptions to skip.
+                Defaults to 0.
+
+        Returns:
+            dict[str, Any]: A dictionary containing the matching SOC code and metadata.
+        """
+        with timed("lookup_similarity" if similarity else "lookup_exact"):
+            description = description.lower()
+
+            matching_code: Optional[str] = self.match_code(description)
+            matching_code_meta: Optional[dict[str, Any]] = None
+            major_group_meta: Optional[dict[str, Any]] = None
+
+            # Extract the first digit of the code as code_major_group
+            matching_code_major_group: Optional[str] = None
+            if matching_code:
+                # Lookup the most aggregated (Major) group
+                matching_code_major_group = matching_code[:1]
+                # Lookup the meta data for the code
+                matching_code_meta = self.meta.get_meta_by_code(matching_code)
+                major_group_meta = self.meta.get_meta_by_code(matching_code_major_group)
+
+            if not matching_code:
+                matching_code = None
+            if matching_code is None:
+                count(
+                    ERRORS_TOTAL,
+                    operation="lookup_similarity" if similarity else "lookup_exact",
+                    error="no_match",
+                )
+
+            response: dict[str, Any] = {
+                "description": description,
+                "code": matching_code,
+                "code_meta": matching_code_meta,
+                "code_major_group": matching_code_major_group,
+                "code_major_group_meta": major_group_meta,
+            }
+            if similarity:
+                response["potential_matches"] = self.similar_descriptions(
+                    description, limit=limit, offset=offset
+                )
+
+            return response
+
+    def lookup_deduplicated(
+        self,
+        descriptions: Iterable[str],
+        similarity: bool = False,
+        limit: Optional[int] = None,
+    ) -> tuple[pd.Series, DeduplicatedBatch]:
+        """Looks up many descriptions, each distinct description only once.
+
+        Descriptions are normalised with `normaliser` and deduplicated (see
+        `DeduplicatedBatch`); `lookup` runs on the first description seen for
+        each normalised value and its response is shared by every row with
+        that value.
+
+        Args:
+            descriptions (Iterable[str]): Descriptions to look up, e.g. a list
+                or pd.Series. Missing values have a None response.
+            similarity (bool, optional): Whether to perform a similarity-based
+                lookup. Defaults to False.
+            limit (int, optional): Maximum number of similar descriptions per
+                lookup. Defaults to all.
+
+        Returns:
+            tuple[pd.Series, DeduplicatedBatch]: The `lookup` response of
+            each description (keeping the index of a pd.Series), and the
+            batch, whose `dedup_ratio` is the share of lookups saved.
+        """
+        with timed("lookup_deduplicated"):
+            batch = DeduplicatedBatch(descriptions, normaliser=self.normaliser)
+            responses = batch.map(
+                lambda description: self.lookup(
+                    description, similarity=similarity, limit=limit
+                )
+            )
+        count(CACHE_REQUESTS_TOTAL, batch.n_unique, cache="dedup", result="miss")
+        count(
+            CACHE_REQUESTS_TOTAL,
+            len(batch) - batch.n_unique,
+            cache="dedup",
+            result="hit",
+        )
+        return responses, batch
 
     def lookup_code_major_group(
         self, code: str
@@ -183,6 +763,10 @@ class SOCLookup:
 
         return list(unique_major_group.values())
 
+    def freeze(self) -> "FrozenSOCLookup":
+        """Returns a read-only snapshot, safe to share between threads."""
+        return FrozenSOCLookup(self)
+
 
 class SOCRephraseLookup:
     """A class for performing rephrased lookups of SOC codes based on descriptions.
@@ -193,7 +777,8 @@ class SOCRephraseLookup:
     Attributes:
         rephrase_dict (dict[str, str]): A dictionary mapping rephrased descriptions
             to their corresponding SOC codes.
-        meta (SocMeta): Metadata for SOC classifications.
+        meta (SocMeta): Metadata for SOC classifications, None when the
+            descriptions are loaded from a condensed file.
 
     Methods:
         rephrase_lookup(description: str) -> dict[str, Any]:
@@ -202,22 +787,65 @@ class SOCRephraseLookup:
             Adds a new rephrase mapping to the lookup dictionary.
     """
 
-    def __init__(self):
-        self.meta: SocMeta = SocMeta(structure_data_path = get_config()["data_source"]["soc_structure"])
+    def __init__(
+        self,
+        condensed_data_path: Optional[str] = None,
+        meta: Optional[SocMeta] = None,
+        structure_data_path: Optional[str] = None,
+    ):
+        """Initialises the SOCRephraseLookup class.
+
+        Args:
+            condensed_data_path (str, optional): The path to a condensed file
+                ("code: title" lines), such as `soc_4d_condensed.txt`. When
+                provided, descriptions are read from it instead of the SOC
+                structure workbook, which avoids loading Excel at start up but
+                only covers the codes in the file. Defaults to None.
+            meta (SocMeta, optional): Already loaded SOC metadata, shared
+                instead of loading the SOC structure again.
+            structure_data_path (str, optional): The path to the SOC structure
+                workbook, read when `meta` is not given. Defaults to
+                `soc_structure` from the config.
+        """
+        self.meta: Optional[SocMeta] = None
+        if condensed_data_path is not None:
+            self.lookup_dict: dict[str, str] = CondensedLookup(
+                condensed_data_path
+            ).code_titles
+            return
+
+        if meta is None:
+            if structure_data_path is None:
+                structure_data_path = get_config()["data_source"]["soc_structure"]
+            meta = SocMeta(structure_data_path=structure_data_path)
+        self.meta = meta
 
-        self.lookup_dict: dict[str, str] = {
+        self.lookup_dict = {
             item["code"]: item["soc2020_group_title"] for item in self.meta.soc_meta
         }
 
+    def __getstate__(self) -> dict[str, Any]:
+        return {"lookup_dict": dict(self.lookup_dict), "meta": self.meta}
+
+    def __setstate__(self, state: dict[str, Any]):
+        self.lookup_dict = state["lookup_dict"]
+        self.meta = state["meta"]
+
     def lookup(self, soc_code: str) -> dict[str, Union[str, Any]]:
         """Retrieve reviewed description for the given SOC code."""
-        if soc_code in self.lookup_dict:
-            return {
-                "soc_code": soc_code,
-                "input_description": self.lookup_dict[soc_code],
-            }
+        with timed("rephrase"):
+            if soc_code in self.lookup_dict:
+                return {
+                    "soc_code": soc_code,
+                    "input_description": self.lookup_dict[soc_code],
+                }
 
-        return {"soc_code": soc_code, "error": "SOC code not found"}
+            count(ERRORS_TOTAL, operation="rephrase", error="code_not_found")
+            return {"soc_code": soc_code, "error": "SOC code not found"}
+
+    def freeze(self) -> "FrozenSOCRephraseLookup":
+        """Returns a read-only snapshot, safe to share between threads."""
+        return FrozenSOCRephraseLookup(self)
 
     def process_json(self, input_json: dict[str, Any]) -> dict[str, Any]:
         """Process a JSON response to rephrase SOC descriptions."""
@@ -246,3 +874,165 @@ class SOCRephraseLookup:
                 ]
 
         return input_json
+
+
+class FrozenSOCLookup(FrozenMixin, SOCLookup):
+    """Read-only snapshot of a `SOCLookup`, safe for concurrent reads.
+
+    The snapshot copies the lookup dictionaries into read-only mappings and
+    the index into tuples, and attributes cannot be reassigned. Lookups only
+    read, so one snapshot can serve many threads, including on free-threaded
+    CPython builds. Later changes to the original lookup do not reach it.
+
+    The normaliser, spelling corrector and substring index are shared with the
+    original lookup and must not be reconfigured.
+
+    Attributes:
+        data (pd.DataFrame): A copy of the SOC index.
+        lookup_dict (MappingProxyType): Read-only descriptions to SOC codes.
+        normaliser (TextNormaliser): Normalisation applied to queries.
+        normalised_lookup_dict (MappingProxyType): Read-only normalised
+            descriptions to SOC codes.
+        spelling_corrector (Optional[SpellingCorrector]): Correction of
+            misspelt queries, if enabled on the original lookup.
+        substring_index (Optional[SubstringIndex]): Suffix array for
+            similarity searches, if enabled on the original lookup.
+        meta (FrozenSocMeta): Read-only metadata.
+
+    Methods:
+        lookup_many(descriptions: Iterable[str], ...) -> list[dict[str, Any]]:
+            Looks up many descriptions on a thread pool.
+    """
+
+    def __init__(self, soc_lookup: SOCLookup):
+        """Creates the snapshot.
+
+        Args:
+            soc_lookup (SOCLookup): Lookup to copy.
+        """
+        data = soc_lookup.data
+        self._data = data.copy()
+        self._descriptions = tuple(intern_strings(data["description"].tolist()))
+        self._labels = tuple(intern_strings(data["label"].tolist()))
+        self.lookup_dict = freeze_mapping(soc_lookup.lookup_dict)
+        self.normaliser = soc_lookup.normaliser
+        self.normalised_lookup_dict = freeze_mapping(soc_lookup.normalised_lookup_dict)
+        self.spelling_corrector = soc_lookup.spelling_corrector
+        self.substring_index = soc_lookup.substring_index
+        self.meta = soc_lookup.meta.freeze()
+        self._freeze()
+
+    def __reduce__(self):
+        return unpickle_frozen, (SOCLookup, self.__getstate__())
+
+    @property
+    def data(self) -> pd.DataFrame:
+        """A copy of the SOC index."""
+        return self._data.copy()
+
+    def __len__(self):
+        return len(self._descriptions)
+
+    def _iter_matches(
+        self, description: str, chunk_size: int
+    ) -> Iterator[tuple[int, list[str], list[str]]]:
+        """Scans the index tuples, with the regular expression semantics of
+        `pd.Series.str.contains`.
+        """
+        search = re.compile(description).search
+        descriptions = self._descriptions
+        for start in range(0, len(descriptions), chunk_size):
+            end = min(start + chunk_size, len(descriptions))
+            rows = [
+                row
+                for row in range(start, end)
+                if isinstance(descriptions[row], str) and search(descriptions[row])
+            ]
+            yield (
+                end - start,
+                [descriptions[row] for row in rows],
+                [self._labels[row] for row in rows],
+            )
+
+    def lookup_many(
+        self,
+        descriptions: Iterable[str],
+        similarity: bool = False,
+        limit: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        chunk_size: int = 64,
+    ) -> list[dict[str, Any]]:
+        """Looks up many descriptions on a thread pool.
+
+        Args:
+            descriptions (Iterable[str]): Descriptions to look up.
+            similarity (bool, optional): Whether to perform a similarity-based
+                lookup. Defaults to False.
+            limit (int, optional): Maximum number of similar descriptions per
+                lookup. Defaults to all.
+            max_workers (int, optional): Number of threads. Defaults to the
+                `ThreadPoolExecutor` default.
+            chunk_size (int, optional): Descriptions handed to a thread at a
+                time. Defaults to 64.
+
+        Returns:
+            list[dict[str, Any]]: The `lookup` response for each description,
+            in order.
+        """
+        lookup = partial(self.lookup, similarity=similarity, limit=limit)
+        items = list(descriptions)
+        chunks = [
+            items[pos : pos + chunk_size] for pos in range(0, len(items), chunk_size)
+        ]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return [
+                response
+                for responses in executor.map(
+                    lambda chunk: [lookup(description) for description in chunk],
+                    chunks,
+                )
+                for response in responses
+            ]
+
+    def freeze(self) -> "FrozenSOCLookup":
+        """Returns the snapshot itself."""
+        return self
+
+
+class FrozenSOCRephraseLookup(FrozenMixin, SOCRephraseLookup):
+    """Read-only snapshot of a `SOCRephraseLookup`, safe for concurrent reads.
+
+    Attributes:
+        lookup_dict (MappingProxyType): Read-only SOC codes to descriptions.
+        meta (FrozenSocMeta, optional): Read-only metadata, None when the
+            original lookup was loaded from a condensed file.
+    """
+
+    def __init__(self, rephrase_lookup: SOCRephraseLookup):
+        """Creates the snapshot.
+
+        Args:
+            rephrase_lookup (SOCRephraseLookup): Lookup to copy.
+        """
+        self.meta = (
+            None if rephrase_lookup.meta is None else rephrase_lookup.meta.freeze()
+        )
+        self.lookup_dict = freeze_mapping(rephrase_lookup.lookup_dict)
+        self._freeze()
+
+    def __reduce__(self):
+        return unpickle_frozen, (SOCRephraseLookup, self.__getstate__())
+
+    def process_json(self, input_json: dict[str, Any]) -> dict[str, Any]:
+        """Process a JSON response to rephrase SOC descriptions.
+
+        Unlike `SOCRephraseLookup.process_json`, the input is not modified.
+
+        Returns:
+            dict[str, Any]: A rephrased copy of the input.
+        """
+        return super().process_json(copy.deepcopy(input_json))
+
+    def freeze(self) -> "FrozenSOCRephraseLookup":
+        """Returns the snapshot itself."""
+        return self
@@ -0,0 +1,190 @@
+"""This module provides `TitleScanner`, which finds every coding index title
+mentioned in a long free-text answer, such as "I work as a senior staff
+nurse on a hospital ward".
+
+Titles are normalised and compiled into an Aho-Corasick automaton over
+words, so an answer is read once, one word at a time, whatever the number of
+titles. Matches are reported with their SOC code and their character span in
+the original answer. By default only the longest, most specific, matches are
+kept: "senior staff nurse" rather than "staff nurse" or "nurse".
+
+Usage:
+    ```
+    scanner = TitleScanner.from_lookup(soc_lookup)
+    scanner.scan("I work as a senior staff nurse on a hospital ward")
+    ```
+"""
+
+import re
+import string
+from collections import deque
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING, Any, Optional
+
+from occupational_classification.utils.normalisation import TextNormaliser
+
+if TYPE_CHECKING:
+    from occupational_classification.lookup.soc_lookup import SOCLookup
+
+_WORD = re.compile(r"\S+")
+# Stripped from the ends of a word's span, e.g. "clerk." spans "clerk".
+_EDGE_PUNCTUATION = string.punctuation + "\u2018\u2019\u201c\u201d"
+
+
+class TitleScanner:
+    """Aho-Corasick automaton over the words of normalised titles.
+
+    Attributes:
+        titles (list[str]): Normalised title of each pattern.
+        codes (list[str]): SOC code of each pattern.
+        normaliser (TextNormaliser): Normalisation applied to titles and to
+            each word of scanned answers.
+
+    Methods:
+        scan(text: str, overlapping: bool = False) -> list[dict[str, Any]]:
+            Returns the titles found in the text with codes and spans.
+    """
+
+    def __init__(
+        self,
+        titles: Mapping[str, str],
+        normaliser: Optional[TextNormaliser] = None,
+    ):
+        """Compiles the automaton.
+
+        Args:
+            titles (Mapping[str, str]): Titles to find and their SOC codes.
+                Titles are normalised; the first code is kept when titles
+                normalise to the same words.
+            normaliser (TextNormaliser, optional): Defaults to
+                `TextNormaliser()`.
+        """
+        self.normaliser = normaliser if normaliser is not None else TextNormaliser()
+        self.titles: list[str] = []
+        self.codes: list[str] = []
+        self._lengths: list[int] = []
+        # Trie over words: transitions, failure links and the patterns ending
+        # at each state, including those reached through failure links.
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._outputs: list[tuple[int, ...]] = [()]
+
+        seen: set[str] = set()
+        for title, code in titles.items():
+            words = self.normaliser(title).split()
+            normalised = " ".join(words)
+            if not words or normalised in seen:
+                continue
+            seen.add(normalised)
+            state = 0
+            for word in words:
+                if word not in self._goto[state]:
+                    self._goto[state][word] = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._outputs.append(())
+                state = self._goto[state][word]
+            self._outputs[state] = (len(self.titles),)
+            self.titles.append(normalised)
+            self.codes.append(code)
+            self._lengths.append(len(words))
+        self._link()
+
+    @classmethod
+    def from_lookup(cls, soc_lookup: "SOCLookup") -> "TitleScanner":
+        """Compiles the titles of a `SOCLookup`, with its normaliser.
+
+        Args:
+            soc_lookup (SOCLookup): Lookup providing `lookup_dict` and
+                `normaliser`.
+
+        Returns:
+            TitleScanner: Scanner over the coding index titles.
+        """
+        return cls(soc_lookup.lookup_dict, normaliser=soc_lookup.normaliser)
+
+    def __len__(self):
+        return len(self.titles)
+
+    def _link(self):
+        """Sets failure links breadth first, merging the patterns of the
+        longest proper suffix into each state.
+        """
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for word, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and word not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(word, 0)
+                self._outputs[child] += self._outputs[self._fail[child]]
+
+    def _words(self, text: str) -> tuple[list[str], list[tuple[int, int]]]:
+        """Normalises the text word by word, keeping each word's span."""
+        words: list[str] = []
+        spans: list[tuple[int, int]] = []
+        for match in _WORD.finditer(text):
+            raw = match.group()
+            start = match.start() + len(raw) - len(raw.lstrip(_EDGE_PUNCTUATION))
+            end = match.end() - len(raw) + len(raw.rstrip(_EDGE_PUNCTUATION))
+            span = (start, end) if start < end else match.span()
+            for word in self.normaliser(raw).split():
+                words.append(word)
+                spans.append(span)
+        return words, spans
+
+    def _matches(self, words: Iterable[str]) -> list[tuple[int, int, int]]:
+        """Runs the automaton, returning (first word, end word, pattern)."""
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        matches = []
+        state = 0
+        for pos, word in enumerate(words):
+            while state and word not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(word, 0)
+            for pattern in outputs[state]:
+                matches.append((pos + 1 - self._lengths[pattern], pos + 1, pattern))
+        return matches
+
+    def scan(self, text: str, overlapping: bool = False) -> list[dict[str, Any]]:
+        """Finds the titles mentioned in the text.
+
+        Args:
+            text (str): Free-text answer.
+            overlapping (bool, optional): Whether to return every match, such
+                as "nurse" inside "staff nurse". Defaults to False, keeping
+                the longest matches which do not overlap, leftmost first on
+                ties.
+
+        Returns:
+            list[dict[str, Any]]: Matches in order of position, with `code`,
+            `title` (normalised), `start` and `end` (character offsets in the
+            text) and `text` (the matched part of the text).
+        """
+        words, spans = self._words(text)
+        matches = self._matches(words)
+        if not overlapping:
+            taken = [False] * len(words)
+            kept = []
+            for first, end, pattern in sorted(
+                matches, key=lambda match: (match[0] - match[1], match[0])
+            ):
+                if not any(taken[first:end]):
+                    taken[first:end] = [True] * (end - first)
+                    kept.append((first, end, pattern))
+            matches = sorted(kept)
+        results = []
+        for first, end, pattern in matches:
+            start, stop = spans[first][0], spans[end - 1][1]
+            results.append(
+                {
+                    "code": self.codes[pattern],
+                    "title": self.titles[pattern],
+                    "start": start,
+                    "end": stop,
+                    "text": text[start:stop],
+                }
+            )
+        return results
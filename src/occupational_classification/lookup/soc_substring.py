@@ -0,0 +1,188 @@
+"""This module provides `SubstringIndex`, a suffix array over the coding
+index descriptions which finds every description containing a text without
+scanning them all.
+
+The descriptions are joined, each followed by a separator, and the start of
+every suffix of the joined text is sorted (by prefix doubling in NumPy).
+Suffixes starting with a query are then a contiguous range of the array,
+found by binary search in O(m log n) character comparisons for a query of
+length m, and mapped back to their descriptions.
+
+The similarity search of `SOCLookup` uses `pd.Series.str.contains`, which
+reads queries as regular expressions. The index only answers literal
+queries, see `is_literal`; the others still need a scan.
+
+Usage:
+    ```
+    index = SubstringIndex.from_lookup(soc_lookup)
+    descriptions, codes = index.search("zoo")
+    ```
+"""
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from occupational_classification.lookup.soc_lookup import SOCLookup
+
+# Characters with a meaning in regular expressions (outside a character set)
+_REGEX_SPECIAL = frozenset(".^$*+?{}[]\\|()")
+_SEPARATOR = "\x00"
+
+
+def is_literal(pattern: str) -> bool:
+    """Returns whether a regular expression only matches itself literally."""
+    return _REGEX_SPECIAL.isdisjoint(pattern)
+
+
+def suffix_array(codes: np.ndarray) -> np.ndarray:
+    """Sorts the suffixes of a sequence by prefix doubling.
+
+    Args:
+        codes (np.ndarray): Integer symbols. Every suffix must be unique, e.g.
+            by ending the sequence with a unique symbol, or sorting does not
+            finish before the longest repeat is resolved.
+
+    Returns:
+        np.ndarray: Start of each suffix, in lexicographic order of suffixes.
+    """
+    n = len(codes)
+    if not n:
+        return np.empty(0, dtype=np.int64)
+    _, rank = np.unique(codes, return_inverse=True)
+    rank = rank.astype(np.int64)
+    step = 1
+    while True:
+        # Rank of the suffix `step` further on, -1 past the end
+        following = np.full(n, -1, dtype=np.int64)
+        following[: n - step] = rank[step:]
+        key = rank * (n + 1) + following + 1
+        order = np.argsort(key, kind="stable")
+        sorted_key = key[order]
+        rank = np.empty(n, dtype=np.int64)
+        rank[order] = np.concatenate(
+            ([0], np.cumsum(sorted_key[1:] != sorted_key[:-1]))
+        )
+        if rank[order[-1]] == n - 1 or step >= n:
+            return order
+        step *= 2
+
+
+class SubstringIndex:
+    """Suffix array over descriptions, for literal substring search.
+
+    Attributes:
+        descriptions (tuple[Optional[str], ...]): Indexed descriptions, in
+            order; missing values never match.
+        labels (tuple[str, ...]): Code of each description.
+        text (str): The descriptions joined, each followed by a separator.
+        starts (np.ndarray): Position of each description in `text`.
+        suffixes (np.ndarray): Start of every suffix of `text`, sorted.
+        suffix_rows (np.ndarray): Position in `descriptions` of the
+            description holding each suffix of `suffixes`.
+
+    Methods:
+        search(text: str) -> tuple[list[str], list[str]]:
+            Returns the descriptions containing the text and their codes.
+    """
+
+    def __init__(self, descriptions: Sequence[Optional[str]], labels: Sequence[str]):
+        """Builds the suffix array.
+
+        Args:
+            descriptions (Sequence[Optional[str]]): Descriptions to index,
+                which must not contain the NUL character.
+            labels (Sequence[str]): Code of each description.
+
+        Raises:
+            ValueError: If there is not one label per description.
+        """
+        if len(descriptions) != len(labels):
+            raise ValueError("Expected one label per description.")
+        self.descriptions = tuple(descriptions)
+        self.labels = tuple(labels)
+        parts = [
+            description if isinstance(description, str) else ""
+            for description in self.descriptions
+        ]
+        self._missing = np.array(
+            [not isinstance(description, str) for description in self.descriptions],
+            dtype=bool,
+        )
+        self.text = "".join(part + _SEPARATOR for part in parts)
+        lengths = np.fromiter(map(len, parts), dtype=np.int64, count=len(parts))
+        self.starts = np.concatenate(([0], np.cumsum(lengths + 1)[:-1])).astype(
+            np.int64
+        )
+
+        codes = np.frombuffer(self.text.encode("utf-32-le"), dtype=np.uint32).astype(
+            np.int64
+        )
+        # Each separator is a distinct symbol below every character, so all
+        # suffixes differ and sorting ends within the longest description.
+        codes += len(parts)
+        codes[self.starts + lengths] = np.arange(len(parts))
+        self.suffixes = suffix_array(codes)
+        self.suffix_rows = np.repeat(
+            np.arange(len(parts), dtype=np.int32), lengths + 1
+        )[self.suffixes]
+        for array in (self.starts, self.suffixes, self.suffix_rows, self._missing):
+            array.setflags(write=False)
+
+    @classmethod
+    def from_lookup(cls, soc_lookup: "SOCLookup") -> "SubstringIndex":
+        """Indexes the `description` and `label` columns of a `SOCLookup`."""
+        data = soc_lookup.data
+        return cls(data["description"].tolist(), data["label"].tolist())
+
+    def __len__(self):
+        return len(self.descriptions)
+
+    def rows(self, text: str) -> np.ndarray:
+        """Returns the positions of the descriptions containing the text.
+
+        Args:
+            text (str): Literal text to search for, case sensitive.
+
+        Returns:
+            np.ndarray: Positions in `descriptions`, ascending.
+        """
+        if not text:
+            return np.flatnonzero(~self._missing)
+        if _SEPARATOR in text:
+            return np.empty(0, dtype=np.int64)
+        length = len(text)
+        corpus = self.text
+
+        def prefix(start: int) -> str:
+            return corpus[start : start + length]
+
+        lower = bisect_left(self.suffixes, text, key=prefix)
+        upper = bisect_right(self.suffixes, text, lo=lower, key=prefix)
+        rows = self.suffix_rows[lower:upper]
+        if len(rows) * 8 < len(self):
+            return np.unique(rows)
+        # Many occurrences: marking rows is cheaper than sorting them
+        found = np.zeros(len(self), dtype=bool)
+        found[rows] = True
+        return np.flatnonzero(found)
+
+    def search(self, text: str) -> tuple[list[str], list[str]]:
+        """Returns the descriptions containing the text and their codes.
+
+        Args:
+            text (str): Literal text to search for, case sensitive.
+
+        Returns:
+            tuple[list[str], list[str]]: Matching descriptions and their
+            codes, in index order, as `pd.Series.str.contains` would select
+            them for a literal pattern.
+        """
+        rows = self.rows(text).tolist()
+        return (
+            [self.descriptions[row] for row in rows],
+            [self.labels[row] for row in rows],
+        )
@@ -6,10 +6,19 @@ This module defines the 'SocMeta' class, which retrieves titles and details
 for given SOC codes.
 """
 
+from types import MappingProxyType
+from typing import Any, Optional
+
 import pandas as pd
 
 from occupational_classification.data_access.soc_data_access import load_soc_structure
 from occupational_classification.meta.classification_meta import ClassificationMeta
+from occupational_classification.utils.frozen import (
+    FrozenMixin,
+    freeze_mapping,
+    unpickle_frozen,
+)
+from occupational_classification.utils.memory import intern_strings
 
 
 class SocDB:
@@ -50,6 +59,9 @@ class SocDB:
     def create_soc_dictionary(self) -> list:
         """Iterates through the dataframe with SOC and converts to dictionaries.
 
+        Strings are interned, so repeated titles, descriptions, tasks and
+        qualifications are held once and shared with the lookups and hierarchy.
+
         Returns:
             List of dictionaries, such as:
                 {"code": <code>,
@@ -74,7 +86,7 @@ class SocDB:
                 "\n", " "
             )
             soc_validated = ClassificationMeta.model_validate(soc_dict)
-            soc_list.append(soc_validated.dict())
+            soc_list.append(intern_strings(soc_validated.dict()))
         return soc_list
 
     def create_soc_dataframe(self) -> pd.DataFrame:
@@ -87,17 +99,65 @@ class SocMeta:
     Load and manage data related to SOC codes.
 
     Args:
-        structure_data_path (str): a path to the file containing soc structure
-        data.
+        structure_data_path (str, optional): a path to the file containing soc
+        structure data. Required unless `df` is provided.
+        df (pd.DataFrame, optional): SOC structure already loaded with
+        `load_soc_structure`, used instead of reading the file.
 
     Attributes:
         df (pd.DataFrame): DataFrame containing data for SOC structure.
         soc_meta (List[ClassificationMeta]): List of ClassificationMeta objects
     """
 
-    def __init__(self, structure_data_path: str):
-        self.df = load_soc_structure(structure_data_path)
+    def __init__(
+        self,
+        structure_data_path: Optional[str] = None,
+        df: Optional[pd.DataFrame] = None,
+    ):
+        if df is None:
+            if structure_data_path is None:
+                raise ValueError("Either structure_data_path or df is required.")
+            df = load_soc_structure(structure_data_path)
+        self.df = df
         self.soc_meta = SocDB(self.df).create_soc_dictionary()
+        self._index_by_code()
+
+    @classmethod
+    def from_records(cls, df: pd.DataFrame, soc_meta: list[dict]) -> "SocMeta":
+        """Creates the metadata from records already cleaned by `SocDB`, e.g.
+        read back from an artefact, without validating them again.
+
+        Args:
+            df (pd.DataFrame): The SOC structure the records were created from.
+            soc_meta (list[dict]): Records, as in `soc_meta`.
+
+        Returns:
+            SocMeta: The metadata, with its strings interned.
+        """
+        meta = cls.__new__(cls)
+        meta.df = df
+        meta.soc_meta = intern_strings(soc_meta)
+        meta._index_by_code()
+        return meta
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Records are copied, as snapshots hold them in read-only mappings;
+        # the index by code is rebuilt when unpickled. Strings shared between
+        # records are pickled once, so they stay shared when unpickled.
+        return {
+            "df": self.df,
+            "soc_meta": [dict(element) for element in self.soc_meta],
+        }
+
+    def __setstate__(self, state: dict[str, Any]):
+        self.df = state["df"]
+        self.soc_meta = state["soc_meta"]
+        self._index_by_code()
+
+    def _index_by_code(self):
+        self._meta_by_code: dict[str, dict] = {}
+        for element in self.soc_meta:
+            self._meta_by_code.setdefault(element["code"], element)
 
     def get_meta_by_code(self, code: str) -> dict:
         """Retrieve title and details for a given SOC code.
@@ -108,15 +168,84 @@ class SocMeta:
         Returns:
             dict: Dictionary with title and detail if found, else an error message.
         """
-        for element in self.soc_meta:
-            if element["code"] == code:
-                return {
-                    "code": element.get("code", None),
-                    "group_title": element.get("soc2020_group_title", None),
-                    "group_description": element.get("group_description", None),
-                    "entry_routes_and_quals": element.get("qualifications", []),
-                    "tasks": element.get("tasks"),
-                }
+        element = self._meta_by_code.get(code)
+        if element is not None:
+            return {
+                "code": element.get("code", None),
+                "group_title": element.get("soc2020_group_title", None),
+                "group_description": element.get("group_description", None),
+                "entry_routes_and_quals": element.get("qualifications", []),
+                "tasks": element.get("tasks"),
+            }
 
         # No match found
         return {"error": f"No metadata found for SOC code {code}"}
+
+    def freeze(self) -> "FrozenSocMeta":
+        """Returns a read-only snapshot, safe to share between threads."""
+        return FrozenSocMeta(self)
+
+
+class FrozenSocMeta(FrozenMixin, SocMeta):
+    """Read-only snapshot of `SocMeta`, safe for concurrent reads.
+
+    Records are read-only mappings with tasks held as tuples; later changes
+    to the original `SocMeta` do not reach the snapshot.
+
+    Attributes:
+        df (pd.DataFrame): A copy of the SOC structure.
+        soc_meta (tuple[MappingProxyType, ...]): Read-only SOC records.
+    """
+
+    def __init__(self, meta: SocMeta):
+        """Creates the snapshot.
+
+        Args:
+            meta (SocMeta): Metadata to copy.
+        """
+        self._df = meta.df.copy()
+        self.soc_meta = tuple(
+            MappingProxyType(
+                {
+                    **element,
+                    "tasks": (
+                        tuple(element["tasks"])
+                        if element.get("tasks") is not None
+                        else None
+                    ),
+                }
+            )
+            for element in meta.soc_meta
+        )
+        meta_by_code: dict[str, MappingProxyType] = {}
+        for element in self.soc_meta:
+            meta_by_code.setdefault(element["code"], element)
+        self._meta_by_code = freeze_mapping(meta_by_code)
+        self._freeze()
+
+    def __reduce__(self):
+        return unpickle_frozen, (SocMeta, self.__getstate__())
+
+    @property
+    def df(self) -> pd.DataFrame:
+        """A copy of the SOC structure."""
+        return self._df.copy()
+
+    def get_meta_by_code(self, code: str) -> dict:
+        """Retrieve title and details for a given SOC code.
+
+        Args:
+            code (str): A SOC code to lookup.
+
+        Returns:
+            dict: A new dictionary (tasks as a new list) with title and detail
+            if found, else an error message.
+        """
+        result = super().get_meta_by_code(code)
+        if result.get("tasks") is not None:
+            result["tasks"] = list(result["tasks"])
+        return result
+
+    def freeze(self) -> "FrozenSocMeta":
+        """Returns the snapshot itself."""
+        return self
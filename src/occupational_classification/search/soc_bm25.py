@@ -0,0 +1,250 @@
+"""This module provides `BM25Index`, a BM25 ranking of SOC unit groups for
+free-text job descriptions.
+
+Each unit group is a document made of fields (group title, group
+description, tasks and example job titles). Field term frequencies are
+length normalised per field, weighted and summed before saturation (BM25F),
+so a word in the title can count for more than the same word in the tasks.
+
+The score contribution of every (term, unit group) pair does not depend on
+the query, so it is computed once when the index is built and stored in
+postings. A query then only adds up the postings of its terms.
+
+Usage:
+    ```
+    soc = load_hierarchy(soc_df, soc_index_df)
+    bm25 = BM25Index.from_hierarchy(soc)
+    bm25.search("looks after animals in a zoo", top_k=5)
+    ```
+"""
+
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+import numpy as np
+
+from occupational_classification.utils.normalisation import TextNormaliser
+
+if TYPE_CHECKING:
+    from occupational_classification.hierarchy.soc_hierarchy import SOC
+
+DEFAULT_FIELD_WEIGHTS: dict[str, float] = {
+    "title": 3.0,
+    "job_titles": 2.0,
+    "description": 1.0,
+    "tasks": 1.0,
+}
+
+
+class BM25Index:
+    """BM25F ranking of documents (SOC unit groups) made of weighted fields.
+
+    Attributes:
+        codes (list[str]): Code of each document.
+        titles (list[str]): Title of each document, returned with results.
+        field_weights (dict[str, float]): Weight of each field.
+        k1 (float): Term frequency saturation.
+        b (float): Strength of the length normalisation.
+        normaliser (TextNormaliser): Normalisation applied to documents and
+            queries before splitting into words.
+        postings (dict[str, tuple[np.ndarray, np.ndarray]]): For each term,
+            the positions of the documents containing it (ascending) and its
+            score contribution to each.
+
+    Methods:
+        search(query: str, top_k: int = 10) -> list[dict[str, Any]]:
+            Returns the best scoring documents for the query.
+    """
+
+    def __init__(
+        self,
+        documents: Iterable[tuple[str, Mapping[str, Union[str, Iterable[str]]]]],
+        field_weights: Optional[Mapping[str, float]] = None,
+        k1: float = 1.2,
+        b: float = 0.75,
+        normaliser: Optional[TextNormaliser] = None,
+    ):
+        """Builds the index.
+
+        Args:
+            documents (Iterable[tuple[str, Mapping]]): Pairs of code and
+                fields. A field is a string or a list of strings (e.g. tasks).
+                The `title` field, if any, is returned with results.
+            field_weights (Mapping[str, float], optional): Weight of each
+                field; fields not listed are ignored. Defaults to
+                `DEFAULT_FIELD_WEIGHTS`.
+            k1 (float, optional): Term frequency saturation. Defaults to 1.2.
+            b (float, optional): Length normalisation, between 0 (none) and
+                1 (full). Defaults to 0.75.
+            normaliser (TextNormaliser, optional): Defaults to
+                `TextNormaliser()`.
+        """
+        self.field_weights = dict(
+            DEFAULT_FIELD_WEIGHTS if field_weights is None else field_weights
+        )
+        self.k1 = k1
+        self.b = b
+        self.normaliser = normaliser if normaliser is not None else TextNormaliser()
+
+        self.codes: list[str] = []
+        self.titles: list[str] = []
+        # Term counts and length of every field of every document
+        field_counts: dict[str, list[Counter]] = {
+            field: [] for field in self.field_weights
+        }
+        for code, fields in documents:
+            self.codes.append(code)
+            title = fields.get("title", "")
+            self.titles.append(title if isinstance(title, str) else " ".join(title))
+            for field, counts in field_counts.items():
+                counts.append(Counter(self._field_terms(fields.get(field, ""))))
+
+        self.postings = self._build_postings(field_counts)
+
+    @classmethod
+    def from_hierarchy(
+        cls,
+        soc: "SOC",
+        field_weights: Optional[Mapping[str, float]] = None,
+        k1: float = 1.2,
+        b: float = 0.75,
+        normaliser: Optional[TextNormaliser] = None,
+    ) -> "BM25Index":
+        """Builds the index over the unit groups (leaf nodes) of a hierarchy.
+
+        Args:
+            soc (SOC): The hierarchy, see `load_hierarchy`.
+            field_weights (Mapping[str, float], optional): Weights of the
+                `title`, `description`, `tasks` and `job_titles` fields.
+                Defaults to `DEFAULT_FIELD_WEIGHTS`.
+            k1 (float, optional): Term frequency saturation. Defaults to 1.2.
+            b (float, optional): Length normalisation. Defaults to 0.75.
+            normaliser (TextNormaliser, optional): Defaults to
+                `TextNormaliser()`.
+
+        Returns:
+            BM25Index: Index with one document per unit group.
+        """
+        documents = (
+            (
+                node.soc_code,
+                {
+                    "title": node.group_title or "",
+                    "description": node.group_description or "",
+                    "tasks": node.tasks,
+                    "job_titles": node.job_titles,
+                },
+            )
+            for node in soc.nodes
+            if node.is_leaf()
+        )
+        return cls(
+            documents, field_weights=field_weights, k1=k1, b=b, normaliser=normaliser
+        )
+
+    def __len__(self):
+        return len(self.codes)
+
+    def _field_terms(self, text: Union[str, Iterable[str]]) -> list[str]:
+        """Splits a field (a string or list of strings) into normalised terms."""
+        if isinstance(text, str):
+            return self.normaliser(text).split()
+        return [term for part in text for term in self.normaliser(part).split()]
+
+    def _build_postings(
+        self, field_counts: dict[str, list[Counter]]
+    ) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+        """Computes the score contribution of every term to every document."""
+        n_docs = len(self.codes)
+        weighted_tf: dict[str, dict[int, float]] = {}
+        for field, counts in field_counts.items():
+            weight = self.field_weights[field]
+            lengths = np.array([sum(count.values()) for count in counts], dtype=float)
+            average_length = lengths.mean() if n_docs and lengths.any() else 1.0
+            norms = 1 - self.b + self.b * lengths / average_length
+            for doc, count in enumerate(counts):
+                for term, tf in count.items():
+                    doc_tf = weighted_tf.setdefault(term, {})
+                    doc_tf[doc] = doc_tf.get(doc, 0.0) + weight * tf / norms[doc]
+
+        postings: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        for term, doc_tf in weighted_tf.items():
+            docs = np.fromiter(doc_tf, dtype=np.int32, count=len(doc_tf))
+            tf = np.fromiter(doc_tf.values(), dtype=float, count=len(doc_tf))
+            order = np.argsort(docs, kind="stable")
+            docs, tf = docs[order], tf[order]
+            idf = np.log(1 + (n_docs - len(doc_tf) + 0.5) / (len(doc_tf) + 0.5))
+            impact = idf * tf * (self.k1 + 1) / (tf + self.k1)
+            postings[term] = (docs, impact.astype(np.float32))
+        return postings
+
+    def query_terms(self, query: str) -> list[str]:
+        """Normalises the query and returns its terms found in the index."""
+        return [
+            term for term in self.normaliser(query).split() if term in self.postings
+        ]
+
+    def scores(self, query: str) -> np.ndarray:
+        """Scores every document for the query.
+
+        Args:
+            query (str): Free-text query, such as a job description.
+
+        Returns:
+            np.ndarray: Score of each document, in the order of `codes`.
+        """
+        scores = np.zeros(len(self.codes), dtype=np.float32)
+        for term in self.query_terms(query):
+            docs, impact = self.postings[term]
+            scores[docs] += impact
+        return scores
+
+    def search(self, query: str, top_k: int = 10) -> list[dict[str, Any]]:
+        """Returns the best scoring documents for the query.
+
+        Args:
+            query (str): Free-text query, such as a job description.
+            top_k (int, optional): Maximum number of results. Defaults to 10.
+
+        Returns:
+            list[dict[str, Any]]: Results with `code`, `title` and `score`,
+            best first. Documents sharing no term with the query are left out.
+        """
+        scores = self.scores(query)
+        candidates = np.flatnonzero(scores)
+        return self.top(candidates, scores[candidates], top_k)
+
+    def top(
+        self, candidates: np.ndarray, candidate_scores: np.ndarray, top_k: int
+    ) -> list[dict[str, Any]]:
+        """Returns the best scoring of the candidate documents.
+
+        Args:
+            candidates (np.ndarray): Positions of the documents to rank.
+            candidate_scores (np.ndarray): Score of each candidate.
+            top_k (int): Maximum number of results.
+
+        Returns:
+            list[dict[str, Any]]: Results with `code`, `title` and `score`,
+            best first.
+        """
+        if top_k <= 0 or not len(candidates):
+            return []
+        if len(candidates) > top_k:
+            best = np.argpartition(-candidate_scores, top_k - 1)[:top_k]
+            candidates, candidate_scores = candidates[best], candidate_scores[best]
+        # Best score first, ties in document order
+        order = np.lexsort((candidates, -candidate_scores))
+        return [
+            {
+                "code": self.codes[pos],
+                "title": self.titles[pos],
+                "score": float(score),
+            }
+            for pos, score in zip(
+                candidates[order].tolist(),
+                candidate_scores[order].tolist(),
+                strict=True,
+            )
+        ]
@@ -0,0 +1,274 @@
+"""This module provides `HierarchicalSearch`, a coarse-to-fine BM25 search
+which follows the SOC hierarchy instead of scoring every unit group.
+
+A query is scored against the Major groups first. Only the children of the
+`beam_width` best groups are scored at the next level, and so on down to
+the unit groups. Every group is a document holding its own title and
+description together with the text of all unit groups below it, so a word
+which matches a unit group also matches each of its ancestors.
+
+Groups of a level are ordered by code, so the children of a group are a
+contiguous range of the level below and only the part of each posting list
+inside the ranges being searched is read. Small levels are instead held as
+dense (terms x groups) score matrices, so scoring them is a single NumPy
+operation. The gain is largest when the last
+level is `JOB_TITLE_LEVEL`, the tens of thousands of example job titles,
+where a flat search has to score every title holding a query word.
+
+Usage:
+    ```
+    soc = load_hierarchy(soc_df, soc_index_df)
+    search = HierarchicalSearch(soc, beam_width=3)
+    search.search("looks after animals in a zoo", top_k=5)
+    ```
+"""
+
+from collections.abc import Iterable, Mapping, Sequence
+from typing import TYPE_CHECKING, Any, Optional
+
+import numpy as np
+
+from occupational_classification.search.soc_bm25 import BM25Index
+from occupational_classification.utils.normalisation import TextNormaliser
+
+if TYPE_CHECKING:
+    from occupational_classification.hierarchy.soc_hierarchy import SOC, SocNode
+
+LEVELS = ("Major", "Sub-Major", "Minor", "Unit")
+# Optional last level: each example job title of a unit group is a document.
+JOB_TITLE_LEVEL = "Job title"
+_ALL_LEVELS = (*LEVELS, JOB_TITLE_LEVEL)
+# Levels with at most this many documents are scored with a dense
+# (terms x documents) matrix, one NumPy operation per level.
+DENSE_MAX_DOCS = 1024
+
+
+def _units_below(node: "SocNode") -> list["SocNode"]:
+    """Returns the unit groups (leaves) at or below the node."""
+    units = []
+    pending = [node]
+    while pending:
+        current = pending.pop()
+        if current.is_leaf():
+            units.append(current)
+        else:
+            pending.extend(current.children)
+    return units
+
+
+def _group_document(node: "SocNode") -> dict[str, Any]:
+    """Fields of a group: its own title and description, with the text of
+    every unit group below it.
+    """
+    units = [unit for unit in _units_below(node) if unit is not node]
+    return {
+        "title": node.group_title or "",
+        "description": [node.group_description or ""]
+        + [unit.group_description or "" for unit in units],
+        "tasks": [task for unit in units for task in unit.tasks] + list(node.tasks),
+        "job_titles": [unit.group_title or "" for unit in units]
+        + [title for unit in units for title in unit.job_titles]
+        + list(node.job_titles),
+    }
+
+
+def _merge_ranges(ranges: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Sorts ranges and merges those which touch or overlap."""
+    merged: list[tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(end, merged[-1][1]))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class HierarchicalSearch:
+    """Coarse-to-fine BM25 search over the levels of a SOC hierarchy.
+
+    Attributes:
+        beam_width (int): Number of groups kept at each level above the unit
+            groups.
+        indexes (dict[str, BM25Index]): BM25 index of each level, documents
+            ordered by code.
+        child_ranges (dict[str, dict[str, tuple[int, int]]]): For each level
+            but the last, the positions of each group's children in the index
+            of the level below.
+
+    Methods:
+        search(query: str, top_k: int = 10, beam_width: Optional[int] = None)
+            -> list[dict[str, Any]]:
+            Returns the best unit groups with the path taken to reach them.
+    """
+
+    def __init__(
+        self,
+        soc: "SOC",
+        beam_width: int = 3,
+        field_weights: Optional[Mapping[str, float]] = None,
+        normaliser: Optional[TextNormaliser] = None,
+        levels: Sequence[str] = LEVELS,
+    ):
+        """Builds one BM25 index per level.
+
+        Args:
+            soc (SOC): The hierarchy, see `load_hierarchy`.
+            beam_width (int, optional): Number of groups kept at each level.
+                Defaults to 3.
+            field_weights (Mapping[str, float], optional): Field weights, see
+                `BM25Index`.
+            normaliser (TextNormaliser, optional): Defaults to
+                `TextNormaliser()`.
+            levels (Sequence[str], optional): Levels to descend through, the
+                last one is returned. Defaults to the four group levels; add
+                `JOB_TITLE_LEVEL` to return example job titles.
+
+        Raises:
+            ValueError: If a level is not known, levels are out of order or
+                `beam_width` is below 1.
+        """
+        unknown = [level for level in levels if level not in _ALL_LEVELS]
+        if unknown:
+            raise ValueError(f"Unknown levels {unknown}, use {list(_ALL_LEVELS)}.")
+        if list(levels) != sorted(levels, key=_ALL_LEVELS.index):
+            raise ValueError(f"Levels must be in the order {list(_ALL_LEVELS)}.")
+        if beam_width < 1:
+            raise ValueError("beam_width must be at least 1.")
+        self.beam_width = beam_width
+        self.levels = tuple(levels)
+        normaliser = normaliser if normaliser is not None else TextNormaliser()
+
+        self.indexes: dict[str, BM25Index] = {}
+        for level in self.levels:
+            nodes = sorted(
+                (
+                    node
+                    for node in soc.nodes
+                    if node.group_level
+                    == ("Unit" if level == JOB_TITLE_LEVEL else level)
+                ),
+                key=lambda node: node.soc_code,
+            )
+            documents = (
+                (
+                    (node.soc_code, {"title": title})
+                    for node in nodes
+                    for title in node.job_titles
+                )
+                if level == JOB_TITLE_LEVEL
+                else ((node.soc_code, _group_document(node)) for node in nodes)
+            )
+            self.indexes[level] = BM25Index(
+                documents, field_weights=field_weights, normaliser=normaliser
+            )
+
+        self.child_ranges: dict[str, dict[str, tuple[int, int]]] = {}
+        for level, child_level in zip(self.levels, self.levels[1:], strict=False):
+            code_length = _ALL_LEVELS.index(level) + 1
+            ranges: dict[str, tuple[int, int]] = {}
+            for pos, code in enumerate(self.indexes[child_level].codes):
+                start, _end = ranges.get(code[:code_length], (pos, pos))
+                ranges[code[:code_length]] = (start, pos + 1)
+            self.child_ranges[level] = ranges
+
+        self._dense: dict[str, tuple[dict[str, int], np.ndarray]] = {}
+        for level, index in self.indexes.items():
+            if len(index) <= DENSE_MAX_DOCS:
+                rows = {term: row for row, term in enumerate(index.postings)}
+                matrix = np.zeros((len(rows), len(index)), dtype=np.float32)
+                for term, row in rows.items():
+                    docs, impact = index.postings[term]
+                    matrix[row, docs] = impact
+                self._dense[level] = (rows, matrix)
+
+    def _range_scores(
+        self, level: str, terms: list[str], ranges: list[tuple[int, int]]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Scores the documents of a level inside the ranges only.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Positions of the documents inside
+            the ranges sharing a term with the query, and their scores.
+        """
+        if level in self._dense:
+            rows, matrix = self._dense[level]
+            term_rows = [rows[term] for term in terms if term in rows]
+            positions = np.concatenate(
+                [np.arange(start, end) for start, end in ranges]
+                or [np.empty(0, dtype=np.int64)]
+            )
+            scores = matrix[term_rows].sum(axis=0)[positions]
+            matched = scores > 0
+            return positions[matched], scores[matched]
+
+        index = self.indexes[level]
+        bounds = np.array(ranges, dtype=np.int64).ravel()
+        doc_parts = []
+        impact_parts = []
+        for term in terms:
+            if term not in index.postings:
+                continue
+            docs, impact = index.postings[term]
+            cuts = docs.searchsorted(bounds).tolist()
+            for lower, upper in zip(cuts[::2], cuts[1::2], strict=True):
+                if upper > lower:
+                    doc_parts.append(docs[lower:upper])
+                    impact_parts.append(impact[lower:upper])
+        if not doc_parts:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        positions, inverse = np.unique(np.concatenate(doc_parts), return_inverse=True)
+        return positions, np.bincount(inverse, weights=np.concatenate(impact_parts))
+
+    def search(
+        self, query: str, top_k: int = 10, beam_width: Optional[int] = None
+    ) -> list[dict[str, Any]]:
+        """Returns the best unit groups, descending the hierarchy.
+
+        Args:
+            query (str): Free-text query, such as a job description.
+            top_k (int, optional): Maximum number of results. Defaults to 10.
+            beam_width (int, optional): Groups kept at each level. Defaults to
+                `beam_width` of the instance.
+
+        Returns:
+            list[dict[str, Any]]: Results with `code`, `title`, `score` and
+            `path`, the groups above it with their `level`, `code`, `title`
+            and `score`, best first. For `JOB_TITLE_LEVEL` the title is the
+            job title and the code that of its unit group. Groups sharing no
+            term with the query are never descended into.
+        """
+        beam_width = self.beam_width if beam_width is None else beam_width
+        first = self.indexes[self.levels[0]]
+        terms = first.normaliser(query).split()
+        ranges = [(0, len(first))]
+        path_by_code: dict[str, list[dict[str, Any]]] = {"": []}
+        for depth, level in enumerate(self.levels):
+            index = self.indexes[level]
+            positions, scores = self._range_scores(level, terms, ranges)
+            is_last = depth == len(self.levels) - 1
+            best = index.top(positions, scores, top_k if is_last else beam_width)
+            parent_length = (
+                _ALL_LEVELS.index(self.levels[depth - 1]) + 1 if depth else 0
+            )
+            for result in best:
+                result["path"] = list(path_by_code[result["code"][:parent_length]])
+            if is_last:
+                return best
+            path_by_code = {
+                result["code"]: [
+                    *result["path"],
+                    {
+                        "level": level,
+                        "code": result["code"],
+                        "title": result["title"],
+                        "score": result["score"],
+                    },
+                ]
+                for result in best
+            }
+            ranges = _merge_ranges(
+                self.child_ranges[level][result["code"]]
+                for result in best
+                if result["code"] in self.child_ranges[level]
+            )
+        return []
@@ -0,0 +1,68 @@
+"""Helpers for the frozen, read-only snapshots of the SOC structures.
+
+Snapshots (`FrozenSOCLookup`, `FrozenSOCRephraseLookup`, `FrozenSocMeta` and
+`FrozenSOC`) copy what they need into read-only containers when created and
+refuse attribute assignment afterwards. Nothing is written while they are
+read, so one snapshot can be shared by many threads, including on
+free-threaded CPython builds.
+
+Snapshots pickle as the state of the class they copy and are frozen again
+when unpickled (see `unpickle_frozen`).
+"""
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
+
+class FrozenError(AttributeError):
+    """Raised when a frozen snapshot is modified."""
+
+
+class FrozenMixin:
+    """Makes attributes read only once `_freeze` has been called."""
+
+    _frozen = False
+
+    def _freeze(self):
+        object.__setattr__(self, "_frozen", True)
+
+    def __setattr__(self, name: str, value: Any):
+        if self._frozen:
+            raise FrozenError(f"{type(self).__name__} is frozen, cannot set {name!r}.")
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name: str):
+        if self._frozen:
+            raise FrozenError(
+                f"{type(self).__name__} is frozen, cannot delete {name!r}."
+            )
+        super().__delattr__(name)
+
+
+def freeze_mapping(mapping: Mapping) -> MappingProxyType:
+    """Returns a read-only copy of the mapping.
+
+    Args:
+        mapping (Mapping): Mapping to copy.
+
+    Returns:
+        MappingProxyType: Read-only view of a private copy of the mapping.
+    """
+    return MappingProxyType(dict(mapping))
+
+
+def unpickle_frozen(cls: type, state: Any) -> Any:
+    """Rebuilds a pickled snapshot.
+
+    Args:
+        cls (type): The class the snapshot copies, such as `SOCLookup`, which
+            provides `__setstate__` and `freeze`.
+        state (Any): The state returned by `cls.__getstate__`.
+
+    Returns:
+        Any: The snapshot of the restored object, see `cls.freeze`.
+    """
+    restored = cls.__new__(cls)
+    restored.__setstate__(state)
+    return restored.freeze()
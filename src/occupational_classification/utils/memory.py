@@ -0,0 +1,152 @@
+"""Memory utilities for the loaded SOC structures.
+
+`intern_strings` shares repeated text (titles, descriptions, task lists and
+qualifications) between structures, and `memory_report` breaks down the bytes
+held by the index, metadata and hierarchy.
+
+Usage:
+    ```
+    from occupational_classification.utils.memory import memory_report
+    memory_report(lookup=soc_lookup, meta=soc_lookup.meta, hierarchy=soc)
+    ```
+"""
+
+import sys
+import types
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+# Objects which are shared with the interpreter rather than held by a structure
+_SKIPPED_TYPES = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+)
+_ATOMIC_TYPES = (str, bytes, int, float, bool, type(None))
+
+
+def intern_strings(value: Any) -> Any:
+    """Interns strings, including those inside lists, tuples and dictionaries.
+
+    Equal strings then refer to a single object wherever they are held.
+
+    Args:
+        value (Any): A string, or a list, tuple or dict containing strings.
+
+    Returns:
+        Any: The value with its strings interned. Containers are rebuilt,
+        other values are returned unchanged.
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, list):
+        return [intern_strings(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(intern_strings(item) for item in value)
+    if isinstance(value, dict):
+        return {
+            intern_strings(key): intern_strings(item) for key, item in value.items()
+        }
+    return value
+
+
+def _pandas_sizeof(obj: Any, seen: set[int], pending: list) -> int:
+    """Bytes held by a pandas object; object columns are followed as Python
+    objects so that strings shared with other structures are counted once.
+    """
+    if isinstance(obj, pd.DataFrame):
+        columns = [obj[column] for column in obj.columns]
+        return sum(_pandas_sizeof(column, seen, pending) for column in columns) + int(
+            obj.index.memory_usage(deep=True)
+        )
+    if isinstance(obj, pd.Index):
+        return int(obj.memory_usage(deep=True))
+    if obj.dtype == object:
+        pending.extend(obj.tolist())
+        return int(obj.memory_usage(deep=False, index=False))
+    return int(obj.memory_usage(deep=True, index=False))
+
+
+def _referents(obj: Any) -> list:
+    """Objects held by a container or by the attributes of an object."""
+    if isinstance(obj, _ATOMIC_TYPES):
+        return []
+    if isinstance(obj, dict):
+        return [*obj.keys(), *obj.values()]
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return list(obj)
+    referents = [vars(obj)] if hasattr(obj, "__dict__") else []
+    for slot in getattr(type(obj), "__slots__", ()):
+        if hasattr(obj, slot):
+            referents.append(getattr(obj, slot))
+    return referents
+
+
+def deep_sizeof(obj: Any, seen: Optional[set[int]] = None) -> int:
+    """Returns the bytes held by an object and everything it refers to.
+
+    Objects already in `seen` are not counted again, so passing the same set
+    to several calls attributes each shared object to the first caller.
+
+    Args:
+        obj (Any): The object to measure.
+        seen (set[int], optional): Ids of objects already counted; updated in
+            place. Defaults to a new set.
+
+    Returns:
+        int: Size in bytes.
+    """
+    if seen is None:
+        seen = set()
+    total = 0
+    pending = [obj]
+    while pending:
+        item = pending.pop()
+        if id(item) in seen or isinstance(item, _SKIPPED_TYPES):
+            continue
+        seen.add(id(item))
+        if isinstance(item, (pd.DataFrame, pd.Series, pd.Index)):
+            total += _pandas_sizeof(item, seen, pending)
+            continue
+        if isinstance(item, np.ndarray):
+            total += item.nbytes
+            continue
+        total += sys.getsizeof(item)
+        pending.extend(_referents(item))
+    return total
+
+
+def memory_report(
+    lookup: Optional[Any] = None,
+    meta: Optional[Any] = None,
+    hierarchy: Optional[Any] = None,
+) -> dict[str, int]:
+    """Breaks down the bytes used by the loaded SOC structures.
+
+    Objects shared between structures (for example interned titles) are
+    counted once, against the first structure holding them, in the order
+    metadata, index, hierarchy.
+
+    Args:
+        lookup (SOCLookup, optional): The index; its `meta` is reported as
+            metadata.
+        meta (SocMeta, optional): The metadata, if not held by `lookup`.
+        hierarchy (SOC, optional): The hierarchy.
+
+    Returns:
+        dict[str, int]: Bytes for `metadata`, `index`, `hierarchy` and `total`.
+    """
+    seen: set[int] = set()
+    if meta is None and lookup is not None:
+        meta = getattr(lookup, "meta", None)
+    report = {
+        "metadata": deep_sizeof(meta, seen) if meta is not None else 0,
+        "index": deep_sizeof(lookup, seen) if lookup is not None else 0,
+        "hierarchy": deep_sizeof(hierarchy, seen) if hierarchy is not None else 0,
+    }
+    report["total"] = sum(report.values())
+    return report
@@ -0,0 +1,442 @@
+"""Optional in-process metrics: latency histograms and counters for SOC
+lookups, rephrasing, hierarchy access and loading.
+
+Metrics are off by default and then cost one global check per operation.
+Once enabled, lookups, rephrasing, hierarchy access and the loaders record
+their latency in fixed-bucket histograms, from which percentiles are
+estimated, and count errors and batch cache hits. Metrics are exported as
+Prometheus text, to be served by any HTTP framework, or as a dictionary.
+
+Usage:
+    ```
+    from occupational_classification.utils.metrics import enable_metrics
+    metrics = enable_metrics()
+    soc_lookup.lookup("zoologist")
+    metrics.to_dict()["soc_operation_duration_seconds"]
+    print(metrics.to_prometheus())
+    ```
+"""
+
+import math
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from collections.abc import Sequence
+from typing import Any, Optional
+
+# Bucket upper bounds in seconds, from 1 microsecond to about 16 seconds,
+# each sqrt(2) times the previous one.
+DEFAULT_BUCKETS: tuple[float, ...] = tuple(1e-6 * 2 ** (i / 2) for i in range(49))
+QUANTILES = (0.5, 0.95, 0.99)
+
+OPERATION_SECONDS = "soc_operation_duration_seconds"
+LOAD_SECONDS = "soc_load_duration_seconds"
+ERRORS_TOTAL = "soc_errors_total"
+CACHE_REQUESTS_TOTAL = "soc_cache_requests_total"
+
+_HELP = {
+    OPERATION_SECONDS: "Latency of SOC operations in seconds.",
+    LOAD_SECONDS: "Duration of SOC loading stages in seconds.",
+    ERRORS_TOTAL: "SOC operations which failed or found nothing.",
+    CACHE_REQUESTS_TOTAL: "Results served from a cache or computed.",
+}
+
+
+class Counter:
+    """A value which only goes up.
+
+    Attributes:
+        value (float): Current value.
+    """
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0):
+        """Adds to the counter."""
+        with self._lock:
+            self.value += amount
+
+    def snapshot(self) -> dict[str, float]:
+        """Returns the value."""
+        return {"value": self.value}
+
+
+class _ShardOwner:
+    """Held by a thread while it records into a histogram shard."""
+
+    __slots__ = ("__weakref__",)
+
+
+def _fold_shard(shards: list[list], lock: threading.Lock, shard: list):
+    """Adds the shard of a finished thread to the base shard."""
+    with lock:
+        base = shards[0]
+        for column, value in enumerate(shard):
+            base[column] += value
+        # Shards of other threads may hold equal counts, so match identity
+        del shards[next(pos for pos, other in enumerate(shards) if other is shard)]
+
+
+class Histogram:
+    """Counts of observations in fixed buckets, with their sum.
+
+    Each thread records into its own shard of counts, without locking, and
+    shards are added up when the histogram is read, so threads recording
+    the same operation do not contend. When a thread ends, its shard is
+    folded into a base shard, so short-lived threads do not accumulate.
+
+    Attributes:
+        buckets (tuple[float, ...]): Upper bounds of the buckets, ascending;
+            larger observations fall in a last, unbounded bucket.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """Creates an empty histogram.
+
+        Args:
+            buckets (Sequence[float], optional): Upper bounds of the buckets.
+                Defaults to `DEFAULT_BUCKETS`, suited to latencies in seconds.
+
+        Raises:
+            ValueError: If the bounds are not ascending.
+        """
+        if list(buckets) != sorted(set(buckets)):
+            raise ValueError("Bucket bounds must be ascending and distinct.")
+        self.buckets = tuple(buckets)
+        # The count of each bucket, then the sum of observations: first for
+        # the finished threads, then one shard per live thread
+        self._shards: list[list] = [self._empty_shard()]
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _empty_shard(self) -> list:
+        return [0] * (len(self.buckets) + 1) + [0.0]
+
+    def _new_shard(self) -> list:
+        shard = self._empty_shard()
+        with self._lock:
+            self._shards.append(shard)
+        # The thread-local owner is released when the thread ends
+        owner = _ShardOwner()
+        weakref.finalize(owner, _fold_shard, self._shards, self._lock, shard)
+        self._local.owner = owner
+        self._local.shard = shard
+        return shard
+
+    def _merged(self) -> list:
+        # Under the lock, as a folded shard would otherwise count twice
+        with self._lock:
+            return [sum(column) for column in zip(*self._shards, strict=True)]
+
+    @property
+    def counts(self) -> list[int]:
+        """Observations in each bucket, not cumulative."""
+        return self._merged()[:-1]
+
+    @property
+    def sum(self) -> float:
+        """Sum of the observations."""
+        return self._merged()[-1]
+
+    @property
+    def count(self) -> int:
+        """Number of observations."""
+        return sum(self.counts)
+
+    def observe(self, value: float):
+        """Records an observation."""
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._new_shard()
+        shard[bisect_left(self.buckets, value)] += 1
+        shard[-1] += value
+
+    def quantile(self, q: float) -> float:
+        """Estimates a quantile, interpolating inside its bucket.
+
+        Args:
+            q (float): Quantile, between 0 and 1.
+
+        Returns:
+            float: The estimate, NaN without observations. Quantiles in the
+            unbounded bucket are reported as the largest bound.
+        """
+        return self._quantile(self.counts, q)
+
+    def _quantile(self, counts: list[int], q: float) -> float:
+        total = sum(counts)
+        if not total:
+            return math.nan
+        rank = q * total
+        seen = 0
+        for bucket, bucket_count in enumerate(counts):
+            if bucket_count and seen + bucket_count >= rank:
+                if bucket == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[bucket - 1] if bucket else 0.0
+                upper = self.buckets[bucket]
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return self.buckets[-1]
+
+    def snapshot(self) -> dict[str, Any]:
+        """Returns the count, sum, mean and `QUANTILES` of the observations."""
+        merged = self._merged()
+        counts, total_sum = merged[:-1], merged[-1]
+        total = sum(counts)
+        snapshot = {
+            "count": total,
+            "sum": total_sum,
+            "mean": total_sum / total if total else math.nan,
+        }
+        for q in QUANTILES:
+            snapshot[f"p{round(q * 100)}"] = self._quantile(counts, q)
+        return snapshot
+
+
+class _Timer:
+    """Observes the duration of a block, counting the errors it raises."""
+
+    __slots__ = ("_histogram", "_labels", "_registry", "_start")
+
+    def __init__(
+        self, histogram: Histogram, registry: "MetricsRegistry", labels: dict[str, str]
+    ):
+        self._histogram = histogram
+        self._registry = registry
+        self._labels = labels
+        self._start = time.perf_counter()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self._histogram.observe(time.perf_counter() - self._start)
+        if exc_type is not None:
+            self._registry.counter(
+                ERRORS_TOTAL, **self._labels, error=exc_type.__name__
+            ).inc()
+        return False
+
+
+class _NullTimer:
+    """Does nothing, used while metrics are disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Sequence[tuple[str, str]]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class MetricsRegistry:
+    """Named counters and histograms, with labels.
+
+    Methods:
+        counter(name: str, **labels: str) -> Counter:
+            Returns the counter for the name and labels, created if needed.
+        histogram(name: str, **labels: str) -> Histogram:
+            Returns the histogram for the name and labels, created if needed.
+        time(name: str, **labels: str):
+            Context manager observing the duration of a block.
+        to_dict() -> dict[str, Any]:
+            Returns every metric as a dictionary.
+        to_prometheus() -> str:
+            Returns every metric in the Prometheus text format.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """Creates an empty registry.
+
+        Args:
+            buckets (Sequence[float], optional): Bucket bounds of new
+                histograms. Defaults to `DEFAULT_BUCKETS`.
+        """
+        self.buckets = tuple(buckets)
+        self._metrics: dict[tuple[str, tuple[tuple[str, str], ...]], Any] = {}
+        self._types: dict[str, str] = {}
+        # `OPERATION_SECONDS` histogram of each operation, see `timed`
+        self._operations: dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, kind: str, name: str, labels: dict[str, str]):
+        key = (name, tuple(labels.items()))
+        metric = self._metrics.get(key)
+        if metric is None:
+            with self._lock:
+                if self._types.setdefault(name, kind) != kind:
+                    raise ValueError(f"{name} is a {self._types[name]}, not a {kind}.")
+                metric = self._metrics.get(key)
+                if metric is None:
+                    metric = Counter() if kind == "counter" else Histogram(self.buckets)
+                    self._metrics[key] = metric
+        return metric
+
+    def counter(self, name: str, **labels: str) -> Counter:
+        """Returns the counter for the name and labels, created if needed.
+
+        Raises:
+            ValueError: If the name is used by a histogram.
+        """
+        return self._get("counter", name, labels)
+
+    def histogram(self, name: str, **labels: str) -> Histogram:
+        """Returns the histogram for the name and labels, created if needed.
+
+        Raises:
+            ValueError: If the name is used by a counter.
+        """
+        return self._get("histogram", name, labels)
+
+    def time(self, name: str, **labels: str) -> _Timer:
+        """Observes the duration of a `with` block in a histogram.
+
+        Exceptions raised by the block are counted in `ERRORS_TOTAL` with the
+        same labels and the exception name as `error`.
+        """
+        return _Timer(self.histogram(name, **labels), self, labels)
+
+    def time_operation(self, operation: str) -> _Timer:
+        """Observes the duration of a `with` block in `OPERATION_SECONDS`."""
+        histogram = self._operations.get(operation)
+        if histogram is None:
+            histogram = self.histogram(OPERATION_SECONDS, operation=operation)
+            self._operations[operation] = histogram
+        return _Timer(histogram, self, {"operation": operation})
+
+    def reset(self):
+        """Removes every metric."""
+        with self._lock:
+            self._metrics.clear()
+            self._types.clear()
+            self._operations.clear()
+
+    def _sorted_metrics(self) -> list[tuple[str, tuple[tuple[str, str], ...], Any]]:
+        with self._lock:
+            items = list(self._metrics.items())
+        return sorted(
+            ((name, labels, metric) for (name, labels), metric in items),
+            key=lambda item: (item[0], item[1]),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns every metric as a dictionary.
+
+        Returns:
+            dict[str, Any]: For each metric name, its `type` and `series`, a
+            list of the `labels` of each series with its snapshot (`value`
+            for counters; `count`, `sum`, `mean`, `p50`, `p95` and `p99` for
+            histograms).
+        """
+        exported: dict[str, Any] = {}
+        for name, labels, metric in self._sorted_metrics():
+            family = exported.setdefault(
+                name, {"type": self._types[name], "series": []}
+            )
+            family["series"].append({"labels": dict(labels), **metric.snapshot()})
+        return exported
+
+    def to_prometheus(self) -> str:
+        """Returns every metric in the Prometheus text exposition format."""
+        lines: list[str] = []
+        previous = None
+        for name, labels, metric in self._sorted_metrics():
+            if name != previous:
+                if name in _HELP:
+                    lines.append(f"# HELP {name} {_HELP[name]}")
+                lines.append(f"# TYPE {name} {self._types[name]}")
+                previous = name
+            if isinstance(metric, Counter):
+                lines.append(
+                    f"{name}{_format_labels(labels)} {_format_value(metric.value)}"
+                )
+                continue
+            merged = metric._merged()
+            cumulative = 0
+            bounds = [*metric.buckets, math.inf]
+            for bound, bucket_count in zip(bounds, merged[:-1], strict=True):
+                cumulative += bucket_count
+                bucket_labels = _format_labels([*labels, ("le", _format_value(bound))])
+                lines.append(f"{name}_bucket{bucket_labels} {cumulative}")
+            lines.append(
+                f"{name}_sum{_format_labels(labels)} {_format_value(merged[-1])}"
+            )
+            lines.append(f"{name}_count{_format_labels(labels)} {cumulative}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+_metrics: Optional[MetricsRegistry] = None
+
+
+def enable_metrics(registry: Optional[MetricsRegistry] = None) -> MetricsRegistry:
+    """Starts recording metrics of SOC operations.
+
+    Args:
+        registry (MetricsRegistry, optional): Where metrics are recorded.
+            Defaults to the registry already enabled, or a new one.
+
+    Returns:
+        MetricsRegistry: The registry now recording.
+    """
+    global _metrics  # noqa: PLW0603
+
+    if registry is None:
+        registry = _metrics if _metrics is not None else MetricsRegistry()
+    _metrics = registry
+    return registry
+
+
+def disable_metrics():
+    """Stops recording metrics."""
+    global _metrics  # noqa: PLW0603
+
+    _metrics = None
+
+
+def get_metrics() -> Optional[MetricsRegistry]:
+    """Returns the registry recording metrics, None when disabled."""
+    return _metrics
+
+
+def timed(operation: str):
+    """Times a block as an operation in `OPERATION_SECONDS`, if enabled."""
+    if _metrics is None:
+        return _NULL_TIMER
+    return _metrics.time_operation(operation)
+
+
+def count(name: str, amount: float = 1.0, **labels: str):
+    """Adds to a counter, if metrics are enabled."""
+    if _metrics is not None and amount:
+        _metrics.counter(name, **labels).inc(amount)
+
+
+def observe(name: str, value: float, **labels: str):
+    """Records an observation in a histogram, if metrics are enabled."""
+    if _metrics is not None:
+        _metrics.histogram(name, **labels).observe(value)
@@ -0,0 +1,209 @@
+"""Text normalisation for job title lookups.
+
+The `TextNormaliser` applies the same, pre-compiled sequence of steps to the
+SOC coding index when lookup tables are built and to every incoming query, so
+that trivial differences (case, punctuation, spacing, abbreviations, simple
+plurals) do not prevent an exact dictionary match.
+
+Usage:
+    ```
+    from occupational_classification.utils.normalisation import TextNormaliser
+    normaliser = TextNormaliser()
+    normaliser("Asst. Teachers ")  # "assistant teacher"
+    ```
+"""
+
+import string
+import sys
+from collections.abc import Callable, Iterable
+from functools import lru_cache
+from typing import Optional
+
+DEFAULT_ABBREVIATIONS: dict[str, str] = {
+    "asst": "assistant",
+    "dept": "department",
+    "govt": "government",
+    "jnr": "junior",
+    "jr": "junior",
+    "mgr": "manager",
+    "mngr": "manager",
+    "snr": "senior",
+    "sr": "senior",
+}
+
+# Characters removed outright, so that "driver's mate" becomes "drivers mate".
+_APOSTROPHES = "\u2018\u2019'`"
+# Characters replaced by a space, on top of the ASCII punctuation set.
+_EXTRA_PUNCTUATION = "\u201c\u201d\u2013\u2014\u2026\u00a0"
+# Endings which look plural but are not, e.g. "glass", "bus", "analysis".
+_NON_PLURAL_ENDINGS = ("ss", "us", "is")
+_MIN_PLURAL_LENGTH = 4
+
+
+def fold_plural(token: str) -> str:
+    """Reduces a simple English plural to its singular form.
+
+    Only regular plural endings are handled; the aim is consistency between
+    the index and the queries, not linguistic correctness.
+
+    Args:
+        token (str): A single lower case word.
+
+    Returns:
+        str: The word with a regular plural ending removed.
+    """
+    if len(token) < _MIN_PLURAL_LENGTH or not token.endswith("s"):
+        return token
+    if token.endswith(_NON_PLURAL_ENDINGS):
+        return token
+    if token.endswith("ies") and len(token) > _MIN_PLURAL_LENGTH:
+        return token[:-3] + "y"
+    if token.endswith(("sses", "xes", "ches", "shes")):
+        return token[:-2]
+    return token[:-1]
+
+
+class TextNormaliser:
+    """A configurable text normalisation pipeline.
+
+    The translation table and the per word steps are compiled once, when the
+    object is created, so calling the normaliser is cheap.
+
+    Attributes:
+        casefold (bool): Whether text is casefolded.
+        expand_ampersand (bool): Whether "&" is replaced by "and".
+        strip_punctuation (bool): Whether punctuation is replaced by spaces.
+        fold_plurals (bool): Whether regular plurals are folded to singular.
+        abbreviations (dict[str, str]): Whole word abbreviations to expand.
+    """
+
+    def __init__(
+        self,
+        casefold: bool = True,
+        expand_ampersand: bool = True,
+        strip_punctuation: bool = True,
+        fold_plurals: bool = True,
+        abbreviations: Optional[dict[str, str]] = None,
+    ):
+        """Initialises the TextNormaliser class.
+
+        Args:
+            casefold (bool, optional): Casefold the text. Defaults to True.
+            expand_ampersand (bool, optional): Replace "&" with "and".
+                Defaults to True.
+            strip_punctuation (bool, optional): Remove apostrophes and replace
+                other punctuation with spaces. Defaults to True.
+            fold_plurals (bool, optional): Fold regular plurals to singular.
+                Defaults to True.
+            abbreviations (dict[str, str], optional): Whole word abbreviations
+                to expand. Defaults to `DEFAULT_ABBREVIATIONS`, pass an empty
+                dictionary to disable.
+        """
+        self.casefold = casefold
+        self.expand_ampersand = expand_ampersand
+        self.strip_punctuation = strip_punctuation
+        self.fold_plurals = fold_plurals
+        if abbreviations is None:
+            abbreviations = DEFAULT_ABBREVIATIONS
+        self.abbreviations = {
+            key.casefold() if casefold else key: value
+            for key, value in abbreviations.items()
+        }
+
+        translation: dict[str, Optional[str]] = {}
+        if strip_punctuation:
+            translation.update(
+                dict.fromkeys(string.punctuation + _EXTRA_PUNCTUATION, " ")
+            )
+            translation.update(dict.fromkeys(_APOSTROPHES))
+        if expand_ampersand:
+            translation["&"] = " and "
+        self._translation = str.maketrans(translation)
+
+        token_steps = []
+        if self.abbreviations:
+            token_steps.append(self._expand_abbreviation)
+        if fold_plurals:
+            token_steps.append(fold_plural)
+        self._token_steps = tuple(token_steps)
+        # Vocabulary is small, so per token results are worth memoising.
+        self._normalise_token = lru_cache(maxsize=65536)(self._apply_token_steps)
+
+    def __repr__(self):
+        return (
+            f"TextNormaliser(casefold={self.casefold}, "
+            f"expand_ampersand={self.expand_ampersand}, "
+            f"strip_punctuation={self.strip_punctuation}, "
+            f"fold_plurals={self.fold_plurals}, "
+            f"abbreviations={self.abbreviations!r})"
+        )
+
+    def __reduce__(self):
+        # Pickled as its settings, the memoised words are not sent
+        return (
+            type(self),
+            (
+                self.casefold,
+                self.expand_ampersand,
+                self.strip_punctuation,
+                self.fold_plurals,
+                self.abbreviations,
+            ),
+        )
+
+    def __call__(self, text: str) -> str:
+        return self.normalise(text)
+
+    def _expand_abbreviation(self, token: str) -> str:
+        return self.abbreviations.get(token, token)
+
+    def _apply_token_steps(self, token: str) -> str:
+        for step in self._token_steps:
+            token = step(token)
+        return token
+
+    def normalise(self, text: str) -> str:
+        """Normalises the text.
+
+        Args:
+            text (str): Text to normalise, such as a job title.
+
+        Returns:
+            str: Normalised text, with single spaces between words.
+        """
+        if self.casefold:
+            text = text.casefold()
+        text = text.translate(self._translation)
+        tokens = text.split()
+        if self._token_steps:
+            tokens = [self._normalise_token(token) for token in tokens]
+        return " ".join(tokens)
+
+
+def build_normalised_lookup(
+    pairs: Iterable[tuple[str, str]], normaliser: Callable[[str], str]
+) -> dict[str, str]:
+    """Maps normalised texts to their codes, leaving out ambiguous ones.
+
+    Normalised texts which map to more than one code are ambiguous and are
+    left out, rather than taking whichever code comes last.
+
+    Args:
+        pairs (Iterable[tuple[str, str]]): Texts, such as titles, and their
+            codes.
+        normaliser (Callable[[str], str]): Normalisation applied to the texts,
+            e.g. a `TextNormaliser`.
+
+    Returns:
+        dict[str, str]: A dictionary mapping normalised texts, interned, to
+        codes.
+    """
+    normalised_lookup: dict[str, str] = {}
+    ambiguous: set[str] = set()
+    for text, code in pairs:
+        key = sys.intern(normaliser(text))
+        if normalised_lookup.setdefault(key, code) != code:
+            ambiguous.add(key)
+    for key in ambiguous:
+        del normalised_lookup[key]
+    return normalised_lookup
@@ -0,0 +1,220 @@
+"""Spelling correction for job titles, in the style of SymSpell.
+
+Every word of the vocabulary is indexed under each string obtained by
+deleting up to `max_edit_distance` characters from it. A misspelt word is
+corrected by generating its own deletions and looking them up, so finding
+candidates only takes dictionary lookups, whatever the vocabulary size.
+Candidates are then checked with the (restricted Damerau-) Levenshtein
+distance and the closest, most frequent word wins.
+
+Usage:
+    ```
+    from occupational_classification.utils.spelling import SpellingCorrector
+    corrector = SpellingCorrector.from_lookup(soc_lookup)
+    corrector.correct("acountant")  # "accountant"
+    ```
+"""
+
+from collections import Counter
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from occupational_classification.lookup.soc_lookup import SOCLookup
+
+
+def edit_distance(first: str, second: str, max_distance: int) -> int:
+    """Returns the optimal string alignment distance between two strings.
+
+    Insertions, deletions, substitutions and transpositions of adjacent
+    characters each count as one edit.
+
+    Args:
+        first (str): A string.
+        second (str): Another string.
+        max_distance (int): Distances above this are not needed exactly.
+
+    Returns:
+        int: The distance, or `max_distance + 1` if it is larger.
+    """
+    if abs(len(first) - len(second)) > max_distance:
+        return max_distance + 1
+    previous_previous: list[int] = []
+    previous = list(range(len(second) + 1))
+    for i, first_char in enumerate(first, start=1):
+        current = [i] + [0] * len(second)
+        for j, second_char in enumerate(second, start=1):
+            cost = first_char != second_char
+            current[j] = min(
+                previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost
+            )
+            if (
+                i > 1
+                and j > 1
+                and first_char == second[j - 2]
+                and first[i - 2] == second_char
+            ):
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+    return min(previous[-1], max_distance + 1)
+
+
+class SpellingCorrector:
+    """Word by word spelling correction against a fixed vocabulary.
+
+    Attributes:
+        frequencies (dict[str, int]): Vocabulary words and their frequency.
+        max_edit_distance (int): Largest number of edits corrected.
+        prefix_length (int): Only the first characters of a word are used to
+            find candidates, which keeps the index small.
+        min_length (int): Shorter words are never corrected.
+        deletes (dict[str, tuple[str, ...]]): Vocabulary words under each of
+            their deletions.
+    """
+
+    def __init__(
+        self,
+        words: Iterable[str],
+        max_edit_distance: int = 2,
+        prefix_length: int = 7,
+        min_length: int = 4,
+    ):
+        """Builds the deletion index.
+
+        Args:
+            words (Iterable[str]): Vocabulary, repeated words count towards
+                their frequency.
+            max_edit_distance (int, optional): Largest number of edits
+                corrected. Defaults to 2.
+            prefix_length (int, optional): Characters of a word used to find
+                candidates. Defaults to 7.
+            min_length (int, optional): Words shorter than this are left as
+                they are. Defaults to 4.
+
+        Raises:
+            ValueError: If `prefix_length` is not above `max_edit_distance`.
+        """
+        if prefix_length <= max_edit_distance:
+            raise ValueError("prefix_length must be greater than max_edit_distance.")
+        self.max_edit_distance = max_edit_distance
+        self.prefix_length = prefix_length
+        self.min_length = min_length
+        self.frequencies: dict[str, int] = dict(Counter(words))
+
+        deletes: dict[str, list[str]] = {}
+        for word in self.frequencies:
+            for deleted in self._deletes(word):
+                deletes.setdefault(deleted, []).append(word)
+        self.deletes = {key: tuple(words) for key, words in deletes.items()}
+
+    @classmethod
+    def from_lookup(cls, soc_lookup: "SOCLookup", **kwargs) -> "SpellingCorrector":
+        """Builds the vocabulary from the normalised titles of a `SOCLookup`.
+
+        Args:
+            soc_lookup (SOCLookup): Lookup providing `lookup_dict` and
+                `normaliser`.
+            **kwargs: Passed to `SpellingCorrector`.
+
+        Returns:
+            SpellingCorrector: Corrector over the words of the coding index.
+        """
+        return cls(
+            (
+                word
+                for description in soc_lookup.lookup_dict
+                for word in soc_lookup.normaliser(description).split()
+            ),
+            **kwargs,
+        )
+
+    def __len__(self):
+        return len(self.frequencies)
+
+    def _deletes(self, word: str) -> set[str]:
+        """Returns the word prefix and every string made by deleting up to
+        `max_edit_distance` characters from it.
+        """
+        prefix = word[: self.prefix_length]
+        found = {prefix}
+        edge = {prefix}
+        for _ in range(self.max_edit_distance):
+            edge = {
+                candidate[:pos] + candidate[pos + 1 :]
+                for candidate in edge
+                for pos in range(len(candidate))
+            }
+            found |= edge
+        return found
+
+    def suggest(self, word: str) -> Optional[tuple[str, int]]:
+        """Returns the closest vocabulary word.
+
+        Args:
+            word (str): A single, normalised word.
+
+        Returns:
+            Optional[tuple[str, int]]: The closest word, the most frequent on
+            ties, with its edit distance; None if no word is close enough.
+        """
+        if word in self.frequencies:
+            return word, 0
+        best: Optional[tuple[str, int]] = None
+        checked: set[str] = set()
+        for deleted in self._deletes(word):
+            for candidate in self.deletes.get(deleted, ()):
+                if candidate in checked:
+                    continue
+                checked.add(candidate)
+                limit = self.max_edit_distance if best is None else best[1]
+                distance = edit_distance(word, candidate, limit)
+                if distance > limit:
+                    continue
+                if (
+                    best is None
+                    or distance < best[1]
+                    or self.frequencies[candidate] > self.frequencies[best[0]]
+                ):
+                    best = candidate, distance
+        return best
+
+    def correct_word(self, word: str) -> str:
+        """Returns the correction of a word, or the word itself."""
+        return self._correct_word(word)[0]
+
+    def _correct_word(self, word: str) -> tuple[str, int]:
+        if len(word) < self.min_length or not word.isalpha():
+            return word, 0
+        suggestion = self.suggest(word)
+        return (word, 0) if suggestion is None else suggestion
+
+    def correct(self, text: str) -> str:
+        """Corrects each word of a normalised text.
+
+        Args:
+            text (str): Text with words separated by whitespace.
+
+        Returns:
+            str: The text with misspelt words replaced, single spaced.
+        """
+        return self.correct_with_distance(text)[0]
+
+    def correct_with_distance(self, text: str) -> tuple[str, int]:
+        """Corrects each word of a normalised text and counts the edits.
+
+        Args:
+            text (str): Text with words separated by whitespace.
+
+        Returns:
+            tuple[str, int]: The corrected text, as `correct`, and the total
+            edit distance of the corrections.
+        """
+        words = []
+        distance = 0
+        for word in text.split():
+            corrected, edits = self._correct_word(word)
+            words.append(corrected)
+            distance += edits
+        return " ".join(words), distance
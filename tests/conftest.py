@@ -0,0 +1,81 @@
+"""Small SOC workbooks in the published layout, and the resources loaded
+from them, for tests which read files.
+"""
+
+import pandas as pd
+import pytest
+
+from src.occupational_classification.datasets.soc_loader import load_soc_resources
+
+_BLANK = "<blank>"
+_STRUCTURE_COLUMNS = [
+    "SOC\n2020 Major Group",
+    "SOC\n2020 Sub-Major Group",
+    "SOC\n2020 Minor Group",
+    "SOC 2020 Unit Group",
+    "SOC\n2020 \nGroup Title",
+    "Typical Entry Routes And Associated Qualifications",
+    "Group  Description",
+    "Tasks",
+]
+_GROUPS = [
+    ("1", "Managers, directors and senior officials"),
+    ("11", "Corporate managers and directors"),
+    ("111", "Chief executives and senior officials"),
+    ("1111", "Chief executives and senior officials"),
+    ("1112", "Elected officers and representatives"),
+    ("2", "Professional occupations"),
+    ("21", "Science, research, engineering and technology professionals"),
+    ("211", "Natural and social science professionals"),
+    ("2112", "Biological scientists"),
+]
+_INDEX = [
+    ("1111", "Chief executive", None, None),
+    ("1111", "President", "vice", "banking"),
+    ("1112", "Councillor", None, "local government"),
+    ("2112", "Zoologist", None, None),
+    ("2112", "Scientist", "research", "biological"),
+]
+
+
+def _structure_row(code: str, title: str) -> list[str]:
+    level = len(code)
+    codes = [code if level == position else _BLANK for position in range(1, 5)]
+    if level < 4:  # noqa: PLR2004
+        return [*codes, title, _BLANK, f"Group {code} description.", _BLANK]
+    return [
+        *codes,
+        title,
+        f"Qualifications for {code}.",
+        f"{title} description.",
+        f"TASKS~ignored~first task {code}~second task {code}",
+    ]
+
+
+@pytest.fixture(scope="session")
+def structure_file(tmp_path_factory):
+    """Writes a SOC structure workbook with two major groups."""
+    filepath = tmp_path_factory.mktemp("soc") / "structure.xlsx"
+    df = pd.DataFrame(
+        [_structure_row(code, title) for code, title in _GROUPS],
+        columns=_STRUCTURE_COLUMNS,
+    )
+    df.to_excel(filepath, sheet_name="SOC2020 descriptions", index=False)
+    return str(filepath)
+
+
+@pytest.fixture(scope="session")
+def index_file(tmp_path_factory):
+    """Writes a SOC coding index workbook with five titles."""
+    filepath = tmp_path_factory.mktemp("soc") / "index.xlsx"
+    df = pd.DataFrame(
+        _INDEX, columns=["SOC_2020", "INDEXOCC_-_natural_word_order", "ADD", "IND"]
+    )
+    df.to_excel(filepath, sheet_name="SOC2020 coding index", index=False)
+    return str(filepath)
+
+
+@pytest.fixture(scope="module")
+def resources(index_file, structure_file):
+    """Loads the lookups and hierarchy of the workbooks, once per module."""
+    return load_soc_resources(index_file, structure_file, executor="sequential")
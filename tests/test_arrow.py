@@ -0,0 +1,90 @@
+import pytest
+
+from src.occupational_classification.lookup.soc_lookup import SOCLookup
+from src.occupational_classification.meta.soc_meta import SocMeta
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from src.occupational_classification.lookup.soc_arrow import (  # noqa: E402
+    RESULT_COLUMNS,
+    ArrowBatchLookup,
+)
+
+DESCRIPTIONS = [
+    "Zoologist",
+    "zoologists",
+    None,
+    "nobody",
+    "chief executive",
+    "Zoologist",
+]
+
+
+@pytest.fixture
+def soc_lookup(index_file, structure_file):
+    return SOCLookup(index_file, meta=SocMeta(structure_file))
+
+
+def test_lookup_arrow_matches_lookup_batch(soc_lookup):
+    expected = soc_lookup.lookup_batch(DESCRIPTIONS)
+
+    result = soc_lookup.lookup_arrow(pa.array(DESCRIPTIONS))
+
+    assert result.column_names == ["description", *RESULT_COLUMNS]
+    for name in RESULT_COLUMNS:
+        assert pa.types.is_dictionary(result.schema.field(name).type)
+    assert result.column("code").to_pylist() == [
+        "2112",
+        "2112",
+        None,
+        None,
+        "1111",
+        "2112",
+    ]
+    assert result.to_pandas().astype(object).equals(expected.astype(object))
+
+
+def test_lookup_arrow_tables_and_batches(soc_lookup):
+    chunked = pa.chunked_array([DESCRIPTIONS[:2], DESCRIPTIONS[2:]])
+    table = pa.table({"answer": chunked, "row": list(range(len(DESCRIPTIONS)))})
+
+    result = soc_lookup.lookup_arrow(table, column="answer")
+    assert result.column_names == ["answer", "row", *RESULT_COLUMNS]
+    assert result.column("code").num_chunks == 2  # noqa: PLR2004
+    assert result.column("code_major_group").to_pylist() == [
+        "2",
+        "2",
+        None,
+        None,
+        "1",
+        "2",
+    ]
+
+    encoded = pa.record_batch(
+        {"description": pa.array(DESCRIPTIONS).dictionary_encode()}
+    )
+    batch = ArrowBatchLookup(soc_lookup).lookup(encoded)
+    assert isinstance(batch, pa.RecordBatch)
+    assert batch.column(1).to_pylist() == result.column("code").to_pylist()
+    with pytest.raises(ValueError, match="result columns"):
+        soc_lookup.lookup_arrow(result, column="answer")
+
+
+def test_lookup_parquet(soc_lookup, tmp_path):
+    source = tmp_path / "descriptions.parquet"
+    destination = tmp_path / "coded.parquet"
+    pq.write_table(pa.table({"description": DESCRIPTIONS * 3}), source)
+
+    n_rows = ArrowBatchLookup(soc_lookup).lookup_parquet(
+        source, destination, batch_size=4
+    )
+
+    assert n_rows == len(DESCRIPTIONS) * 3
+    coded = pq.read_table(destination)
+    assert coded.column("code").to_pylist() == (
+        ["2112", "2112", None, None, "1111", "2112"] * 3
+    )
+    assert coded.column("code_title").to_pylist()[4] == (
+        "Chief executives and senior officials"
+    )
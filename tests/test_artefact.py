@@ -0,0 +1,61 @@
+import gzip
+import json
+
+import pytest
+
+from src.occupational_classification.datasets.soc_artefact import (
+    load_soc_artefact,
+    save_soc_artefact,
+)
+
+
+def test_artefact_round_trip(resources, tmp_path):
+    path = tmp_path / "soc_resources.json.gz"
+    save_soc_artefact(resources, path)
+    loaded = load_soc_artefact(path)
+
+    assert loaded.soc_index.equals(resources.soc_index)
+    assert loaded.meta.soc_meta == resources.meta.soc_meta
+    assert loaded.meta.df.equals(resources.meta.df)
+    assert loaded.lookup.meta is loaded.meta
+    assert loaded.lookup.lookup_dict == resources.lookup.lookup_dict
+    assert (
+        loaded.lookup.normalised_lookup_dict == resources.lookup.normalised_lookup_dict
+    )
+    assert loaded.lookup.lookup("Zoologists") == resources.lookup.lookup("Zoologists")
+    assert loaded.lookup.lookup("scientist", similarity=True) == (
+        resources.lookup.lookup("scientist", similarity=True)
+    )
+    assert loaded.rephrase_lookup.lookup("2112") == resources.rephrase_lookup.lookup(
+        "2112"
+    )
+
+    node = loaded.hierarchy["1111"]
+    assert node.parent is loaded.hierarchy["111"]
+    assert loaded.hierarchy["111"].children == [node, loaded.hierarchy["1112"]]
+    assert node.job_titles == ["Chief executive", "Vice president (banking)"]
+    assert node.tasks == ["first task 1111", "second task 1111"]
+    assert node.qualifications == "Qualifications for 1111."
+    assert [node.soc_code for node in loaded.hierarchy.nodes] == [
+        node.soc_code for node in resources.hierarchy.nodes
+    ]
+    assert loaded.hierarchy.all_leaf_text().equals(resources.hierarchy.all_leaf_text())
+    assert "read_artefact" in loaded.timings
+
+
+def test_artefact_version_is_checked(resources, tmp_path):
+    path = tmp_path / "soc_resources.json.gz"
+    save_soc_artefact(resources, path)
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        artefact = json.load(file)
+    artefact["version"] = 99
+    with gzip.open(path, "wt", encoding="utf-8") as file:
+        json.dump(artefact, file)
+
+    with pytest.raises(ValueError, match="version 99"):
+        load_soc_artefact(path)
+
+    with gzip.open(path, "wt", encoding="utf-8") as file:
+        json.dump([], file)
+    with pytest.raises(ValueError, match="not a SOC resources artefact"):
+        load_soc_artefact(path)
@@ -0,0 +1,64 @@
+import pytest
+
+from src.occupational_classification.lookup.soc_autocomplete import (
+    SOCAutocomplete,
+    normalise_prefix,
+)
+
+ENTRIES = [
+    ("head teacher", "2321"),
+    ("headteacher", "2321"),
+    ("head chef", "5434"),
+    ("health visitor", "2255"),
+    ("head chef", "5434"),
+    ("zoologist", "2112"),
+    ("Zoo keeper", "6129"),
+]
+
+
+@pytest.mark.parametrize(
+    "prefix, expected",
+    [("Head", "head"), ("head ", "head "), ("  HEAD   te", "head te"), ("", "")],
+)
+def test_normalise_prefix(prefix, expected):
+    assert normalise_prefix(prefix) == expected
+
+
+def test_complete_alphabetical():
+    autocomplete = SOCAutocomplete(ENTRIES)
+    result = autocomplete.complete("hea")
+    assert [item["description"] for item in result] == [
+        "head chef",
+        "head teacher",
+        "headteacher",
+        "health visitor",
+    ]
+    assert result[0] == {"description": "head chef", "code": "5434", "frequency": 2}
+
+
+def test_complete_trailing_space_and_top_n():
+    autocomplete = SOCAutocomplete(ENTRIES)
+    result = autocomplete.complete("Head ", top_n=1)
+    assert result == [{"description": "head chef", "code": "5434", "frequency": 2}]
+
+
+def test_complete_no_match():
+    autocomplete = SOCAutocomplete(ENTRIES)
+    assert autocomplete.complete("plumber") == []
+    assert autocomplete.complete("zoo", top_n=0) == []
+
+
+@pytest.mark.parametrize("precompute_threshold", [0, 2, 100])
+def test_complete_ranked_by_frequency(precompute_threshold):
+    frequencies = {"headteacher": 50, "health visitor": 10, "zoologist": 70}
+    autocomplete = SOCAutocomplete(
+        ENTRIES, frequencies=frequencies, precompute_threshold=precompute_threshold
+    )
+    result = autocomplete.complete("he", top_n=3, rank_by_frequency=True)
+    assert [item["description"] for item in result] == [
+        "headteacher",
+        "health visitor",
+        "head chef",
+    ]
+    result = autocomplete.complete("", top_n=1, rank_by_frequency=True)
+    assert result == [{"description": "zoologist", "code": "2112", "frequency": 70}]
@@ -0,0 +1,52 @@
+import pandas as pd
+import pytest
+
+from src.occupational_classification.lookup.soc_batch import DeduplicatedBatch
+from src.occupational_classification.lookup.soc_lookup import SOCLookup
+from src.occupational_classification.meta.soc_meta import SocMeta
+from src.occupational_classification.utils.normalisation import TextNormaliser
+
+
+def test_deduplicated_batch():
+    values = ["Nurses", "nurse", None, "Teacher", "NURSE ", "Teacher"]
+    batch = DeduplicatedBatch(values, normaliser=TextNormaliser())
+
+    assert batch.values == ["Nurses", "Teacher"]
+    assert batch.normalised == ["nurse", "teacher"]
+    assert batch.keys.tolist() == [0, 0, -1, 1, 0, 1]
+    assert batch.n_unique == 2  # noqa: PLR2004
+    assert batch.dedup_ratio == pytest.approx(1 - 2 / 6)
+
+    calls = []
+    results = batch.map(lambda value: calls.append(value) or value.upper(), "-")
+    assert calls == ["Nurses", "Teacher"]
+    assert results.tolist() == ["NURSES", "NURSES", "-", "TEACHER", "NURSES", "TEACHER"]
+
+
+def test_deduplicated_batch_without_normaliser():
+    series = pd.Series(["a", "A", "a"], index=[5, 6, 7])
+    batch = DeduplicatedBatch(series)
+
+    assert batch.values == ["a", "A"]
+    results = batch.scatter([(1, 2), (3, 4)])
+    assert list(results.index) == [5, 6, 7]
+    assert results.tolist() == [(1, 2), (3, 4), (1, 2)]
+    with pytest.raises(ValueError, match="Expected 2 results"):
+        batch.scatter([1])
+    assert DeduplicatedBatch([]).dedup_ratio == 0.0
+
+
+def test_lookup_deduplicated(index_file, structure_file):
+    lookup = SOCLookup(index_file, meta=SocMeta(structure_file))
+    descriptions = ["Zoologists", "zoologist", "Councillor", None, "zoologist"]
+    responses, batch = lookup.lookup_deduplicated(descriptions)
+
+    assert batch.n_unique == 2  # noqa: PLR2004
+    assert [response and response["code"] for response in responses] == [
+        "2112",
+        "2112",
+        None,
+        None,
+        "2112",
+    ]
+    assert responses[0] is responses[1]
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from src.occupational_classification.datasets.soc_loader import load_soc_resources
+from src.occupational_classification.search.soc_bm25 import BM25Index
+
+_DOCUMENTS = [
+    ("2112", {"title": "Biological scientists", "tasks": ["studies animals"]}),
+    ("5111", {"title": "Farmers", "tasks": ["raises animals", "grows crops"]}),
+    ("2311", {"title": "Teachers", "description": "Teach science in schools"}),
+]
+
+
+def test_search_ranks_and_scores():
+    bm25 = BM25Index(_DOCUMENTS)
+    results = bm25.search("farmer growing crops and animals", top_k=2)
+
+    assert [result["code"] for result in results] == ["5111", "2112"]
+    assert results[0]["title"] == "Farmers"
+    assert results[0]["score"] > results[1]["score"] > 0
+    assert bm25.search("astronaut") == []
+    assert bm25.search("animals", top_k=0) == []
+
+
+def test_field_weights():
+    title_only = BM25Index(_DOCUMENTS, field_weights={"title": 1.0})
+    assert title_only.search("animals") == []
+
+    scores = BM25Index(_DOCUMENTS).scores("teachers science")
+    assert scores.dtype == np.float32
+    assert np.argmax(scores) == 2  # noqa: PLR2004
+
+
+def test_postings_hold_precomputed_scores():
+    bm25 = BM25Index(_DOCUMENTS)
+    docs, impact = bm25.postings["animal"]
+    assert sorted(bm25.codes[doc] for doc in docs) == ["2112", "5111"]
+    assert (impact > 0).all()
+    assert bm25.scores("animals animals")[docs] == pytest.approx(2 * impact)
+
+
+def test_from_hierarchy(index_file, structure_file):
+    resources = load_soc_resources(index_file, structure_file, executor="sequential")
+    bm25 = BM25Index.from_hierarchy(resources.hierarchy)
+
+    assert sorted(bm25.codes) == ["1111", "1112", "2112"]
+    assert bm25.search("zoologist")[0]["code"] == "2112"
+    assert bm25.search("elected councillor")[0]["code"] == "1112"
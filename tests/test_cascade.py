@@ -0,0 +1,97 @@
+import time
+
+import pytest
+
+from src.occupational_classification.lookup.soc_cascade import (
+    STAGES,
+    CascadeLookup,
+    CascadeStage,
+)
+
+
+@pytest.fixture(scope="module")
+def cascade(resources):
+    return CascadeLookup.from_lookup(resources.lookup, hierarchy=resources.hierarchy)
+
+
+class SlowStage(CascadeStage):
+    name = "slow"
+
+    def match(self, description, normalised):
+        time.sleep(0.02)
+        return "9999", 0.1, description
+
+
+@pytest.mark.parametrize(
+    ("description", "code", "stage"),
+    [
+        ("Zoologist", "2112", "exact"),
+        ("zoologists", "2112", "normalised"),
+        ("chief executive", "1111", "exact"),
+        ("a zoologist at the zoo", "2112", "token"),
+        ("zoologsit", "2112", "fuzzy"),
+        ("biological scientists", "2112", "free_text"),
+    ],
+)
+def test_stage_answering(cascade, description, code, stage):
+    response = cascade.lookup(description)
+
+    assert (response["code"], response["stage"]) == (code, stage)
+    assert response["confidence"] >= cascade.threshold
+    assert [step["stage"] for step in response["stages"]] == list(
+        STAGES[: STAGES.index(stage) + 1]
+    )
+    assert all(step["seconds"] >= 0 for step in response["stages"])
+    assert not response["deadline_exceeded"]
+
+
+def test_no_confident_stage(cascade):
+    response = cascade.lookup("astronaut")
+
+    assert response["code"] is None
+    assert response["stage"] is None
+    assert [step["stage"] for step in response["stages"]] == list(STAGES)
+    # A low threshold accepts a weaker answer
+    assert cascade.lookup("zoologist and councillor")["stage"] is None
+    response = cascade.lookup("zoologist and councillor", threshold=0.5)
+    assert (response["stage"], response["confidence"]) == ("token", 0.5)
+
+
+def test_deadline_skips_stages(resources):
+    cascade = CascadeLookup.from_lookup(resources.lookup, stages=["exact", "fuzzy"])
+    cascade.stages.insert(0, SlowStage())
+
+    response = cascade.lookup("zoologist", deadline=0)
+    assert response["deadline_exceeded"]
+    assert response["stages"] == []
+    # The slow stage runs to the end, and the deadline passes meanwhile
+    deadline = 0.01
+    response = cascade.lookup("zoologist", deadline=deadline)
+    assert response["deadline_exceeded"]
+    assert [step["stage"] for step in response["stages"]] == ["slow"]
+    assert response["stages"][0]["seconds"] >= deadline
+    assert response["code"] is None
+    response = cascade.lookup("zoologist", deadline=60)
+    assert [step["stage"] for step in response["stages"]] == ["slow", "exact"]
+    assert response["stages"][0]["confidence"] == pytest.approx(0.1)
+
+
+def test_stage_selection(resources):
+    cascade = CascadeLookup.from_lookup(resources.lookup)
+
+    # By default, the free-text stage is left out without a hierarchy
+    assert [stage.name for stage in cascade.stages] == list(STAGES[:-1])
+    with pytest.raises(ValueError, match="needs a hierarchy"):
+        CascadeLookup.from_lookup(resources.lookup, stages=STAGES)
+    with pytest.raises(ValueError, match="Unknown stages"):
+        CascadeLookup.from_lookup(resources.lookup, stages=["exact", "semantic"])
+    with pytest.raises(ValueError, match="threshold"):
+        CascadeLookup(resources.lookup, [], threshold=2)
+
+
+def test_stage_must_match():
+    class IncompleteStage(CascadeStage):
+        name = "incomplete"
+
+    with pytest.raises(TypeError, match="abstract"):
+        IncompleteStage()
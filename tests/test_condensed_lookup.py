@@ -0,0 +1,85 @@
+import pytest
+
+from src.occupational_classification.data_access.condensed_data_access import (
+    load_condensed_classification,
+    parse_condensed_lines,
+)
+from src.occupational_classification.lookup.condensed_lookup import CondensedLookup
+
+
+# parse_condensed_lines()
+def test_parse_condensed_lines():
+    lines = ["1111: Chief executives and senior officials", "", " 9111 :Farm workers "]
+    assert parse_condensed_lines(lines) == {
+        "1111": "Chief executives and senior officials",
+        "9111": "Farm workers",
+    }
+
+
+def test_parse_condensed_lines_title_with_colon():
+    assert parse_condensed_lines(["CP1: Tea: green"]) == {"CP1": "Tea: green"}
+
+
+@pytest.mark.parametrize("line", ["1111 Chief executives", ": No code"])
+def test_parse_condensed_lines_malformed(line):
+    with pytest.raises(ValueError, match="Line 2"):
+        parse_condensed_lines(["1112: Elected officers", line])
+
+
+# load_condensed_classification()
+def test_load_condensed_classification(tmp_path):
+    filepath = tmp_path / "condensed.txt"
+    filepath.write_text("1: Managers\n2: Professionals\n", encoding="utf-8")
+    assert load_condensed_classification(filepath) == {
+        "1": "Managers",
+        "2": "Professionals",
+    }
+
+
+# CondensedLookup
+@pytest.mark.parametrize(
+    "file_name, expected_len, code, expected_title",
+    [
+        ("soc_4d_condensed.txt", 412, "9111", "Farm workers"),
+        ("coicop_5d_condensed.txt", 302, "CP01111", "Rice"),
+    ],
+)
+def test_condensed_lookup_packaged_files(file_name, expected_len, code, expected_title):
+    lookup = CondensedLookup(file_name)
+    assert len(lookup) == expected_len
+    assert code in lookup
+    assert lookup.lookup(code) == {"code": code, "title": expected_title}
+
+
+def test_condensed_lookup_default_file_from_config():
+    lookup = CondensedLookup()
+    assert lookup.code_titles == CondensedLookup("soc_4d_condensed.txt").code_titles
+
+
+def test_condensed_lookup_code_not_found():
+    lookup = CondensedLookup("soc_4d_condensed.txt")
+    assert lookup.lookup("0000") == {"code": "0000", "error": "Code not found"}
+
+
+@pytest.mark.parametrize(
+    "title, expected_code",
+    [("Farm workers", "9111"), ("farm worker.", "9111"), ("Astronaut", None)],
+)
+def test_condensed_lookup_title(title, expected_code):
+    lookup = CondensedLookup("soc_4d_condensed.txt")
+    assert lookup.lookup_title(title) == {"title": title, "code": expected_code}
+
+
+def test_condensed_lookup_ambiguous_title(tmp_path):
+    filepath = tmp_path / "condensed.txt"
+    filepath.write_text(
+        "1: Farm worker\n2: FARM WORKERS\n3: Fishers\n", encoding="utf-8"
+    )
+    lookup = CondensedLookup(filepath)
+    assert lookup.lookup_title("Farm worker") == {"title": "Farm worker", "code": None}
+    assert lookup.lookup_title("fisher") == {"title": "fisher", "code": "3"}
+
+
+def test_condensed_lookup_file_not_found():
+    with pytest.raises(FileNotFoundError):
+        CondensedLookup("missing_condensed.txt")
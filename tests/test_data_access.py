@@ -73,7 +73,7 @@ def test_load_soc_index_load(mock_excel):
         "IND": ["secondary school", "broadcasting", "garage"],
     }
     mock_df = pd.DataFrame(mock_data)
-    with patch("pandas.read_excel", return_value=mock_df):
+    with patch.object(soc_data_access, "read_excel_columns", return_value=mock_df):
         df = soc_data_access.load_soc_index("filepath.xlsx")
     expected_data = {
         "code": ["1111", "2222", "3333"],
@@ -96,7 +96,7 @@ def test_load_soc_index_code_filter(mock_excel):
         "IND": ["secondary school", "broadcasting"],
     }
     mock_df = pd.DataFrame(mock_data)
-    with patch("pandas.read_excel", return_value=mock_df):
+    with patch.object(soc_data_access, "read_excel_columns", return_value=mock_df):
         df = soc_data_access.load_soc_index("filepath.xlsx")
     expected_data = {
         "code": ["1111"],
@@ -119,7 +119,7 @@ def test_load_soc_index_dropna(mock_excel):
         "IND": ["secondary school", "broadcasting", "garage"],
     }
     mock_df = pd.DataFrame(mock_data)
-    with patch("pandas.read_excel", return_value=mock_df):
+    with patch.object(soc_data_access, "read_excel_columns", return_value=mock_df):
         df = soc_data_access.load_soc_index("filepath.xlsx")
     expected_data = {
         "code": ["1111"],
@@ -129,3 +129,63 @@ def test_load_soc_index_dropna(mock_excel):
     }
     expected_df = pd.DataFrame(expected_data)
     pd.testing.assert_frame_equal(df, expected_df)
+
+
+# read_excel_columns()
+
+
+@pytest.fixture
+def excel_file(tmp_path):
+    """Writes a small workbook with an extra column and trailing empty rows."""
+    filepath = tmp_path / "index.xlsx"
+    df = pd.DataFrame(
+        {
+            "SOC_2020": [1111, 2112, None],
+            "Unused": ["a", "b", None],
+            "INDEXOCC_-_natural_word_order": ["Teacher", None, None],
+            "ADD": ["mathematics", "nos", None],
+        }
+    )
+    df.to_excel(filepath, sheet_name="SOC2020 coding index", index=False)
+    return filepath
+
+
+@pytest.mark.parametrize("engine", ["openpyxl", "pandas", "calamine"])
+def test_read_excel_columns(excel_file, engine):
+    """Test engines agree, read only the selected columns, as strings."""
+    if engine == "calamine":
+        pytest.importorskip("python_calamine")
+    df = soc_data_access.read_excel_columns(
+        excel_file,
+        sheet_name="SOC2020 coding index",
+        usecols=["ADD", "SOC_2020", "INDEXOCC_-_natural_word_order"],
+        engine=engine,
+    )
+    expected_df = pd.DataFrame(
+        {
+            "ADD": ["mathematics", "nos"],
+            "SOC_2020": ["1111", "2112"],
+            "INDEXOCC_-_natural_word_order": ["Teacher", None],
+        },
+        dtype=str,
+    )
+    pd.testing.assert_frame_equal(df, expected_df)
+
+
+def test_read_excel_columns_missing_column(excel_file):
+    """Test a missing column raises an error."""
+    with pytest.raises(ValueError):
+        soc_data_access.read_excel_columns(
+            excel_file,
+            sheet_name="SOC2020 coding index",
+            usecols=["SOC_2020", "IND"],
+            engine="openpyxl",
+        )
+
+
+def test_read_excel_columns_unknown_engine(excel_file):
+    """Test an unknown engine raises an error."""
+    with pytest.raises(ValueError, match="Excel engine"):
+        soc_data_access.read_excel_columns(
+            excel_file, sheet_name="SOC2020 coding index", usecols=["ADD"], engine="x"
+        )
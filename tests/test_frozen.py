@@ -0,0 +1,109 @@
+import copy
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.occupational_classification.datasets.soc_loader import load_soc_resources
+
+_DESCRIPTIONS = [
+    "Zoologist",
+    "vice president (banking)",
+    "Chief executives",
+    "councillor",
+    "not an occupation",
+    "scientist",
+]
+
+
+def test_frozen_lookup_matches_original(resources):
+    frozen = resources.lookup.freeze()
+    for description in _DESCRIPTIONS:
+        assert frozen.lookup(description, similarity=True) == resources.lookup.lookup(
+            description, similarity=True
+        )
+        assert frozen.similar_descriptions(
+            "e", limit=2, offset=1
+        ) == resources.lookup.similar_descriptions("e", limit=2, offset=1)
+    assert frozen.freeze() is frozen
+
+
+def test_frozen_snapshots_are_read_only(resources):
+    lookup = resources.lookup.freeze()
+    soc = resources.hierarchy.freeze()
+
+    with pytest.raises(AttributeError, match="frozen"):
+        lookup.lookup_dict = {}
+    with pytest.raises(TypeError):
+        lookup.lookup_dict["zoologist"] = "1111"
+    with pytest.raises(AttributeError, match="frozen"):
+        soc["2112"].group_title = "changed"
+    with pytest.raises(AttributeError):
+        soc["2112"].tasks.append("changed")
+
+    # data is a copy, so changes to it do not reach the snapshot
+    assert lookup.data is not lookup.data
+    data = lookup.data
+    data.loc[0, "label"] = "9999"
+    lookup.meta.get_meta_by_code("2112")["tasks"].append("changed")
+    assert lookup.data.loc[0, "label"] != "9999"
+    assert "changed" not in lookup.meta.get_meta_by_code("2112")["tasks"]
+
+
+def test_frozen_snapshots_are_independent_of_original(index_file, structure_file):
+    resources = load_soc_resources(index_file, structure_file, executor="sequential")
+    lookup = resources.lookup.freeze()
+    soc = resources.hierarchy.freeze()
+
+    resources.lookup.lookup_dict["zoologist"] = "1111"
+    resources.hierarchy["2112"].job_titles.append("Changed")
+    assert lookup.lookup("zoologist")["code"] == "2112"
+    assert "Changed" not in soc["2112"].job_titles
+    assert soc["2112"].parent is soc["211"]
+    assert soc["211"].children == (soc["2112"],)
+
+
+def test_frozen_process_json_does_not_modify_input(resources):
+    rephrase = resources.rephrase_lookup.freeze()
+    input_json = {
+        "soc_code": "2112",
+        "soc_candidates": [{"soc_code": "1111", "soc_descriptive": "chief"}],
+    }
+    original = copy.deepcopy(input_json)
+
+    output = rephrase.process_json(input_json)
+    assert input_json == original
+    assert output["soc_description"] == "Biological scientists"
+    assert output["soc_candidates"][0]["soc_descriptive"] == (
+        "Chief executives and senior officials"
+    )
+
+
+def test_concurrent_reads(resources):
+    lookup = resources.lookup.freeze()
+    rephrase = resources.rephrase_lookup.freeze()
+    soc = resources.hierarchy.freeze()
+    descriptions = _DESCRIPTIONS * 200
+    expected = [
+        lookup.lookup(description, similarity=True) for description in descriptions
+    ]
+    expected_rollup = soc.rollup(["2112", "1111", "1112"])
+    barrier = threading.Barrier(8)
+
+    def read(worker: int):
+        barrier.wait()
+        if worker % 2:
+            return lookup.lookup_many(
+                descriptions, similarity=True, max_workers=4, chunk_size=16
+            )
+        results = []
+        for description in descriptions:
+            results.append(lookup.lookup(description, similarity=True))
+            rephrase.process_json({"soc_code": "2112", "soc_candidates": []})
+            soc.contains_codes(["2112", "9"])
+        assert soc.rollup(["2112", "1111", "1112"]).equals(expected_rollup)
+        return results
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for results in executor.map(read, range(8)):
+            assert results == expected
@@ -0,0 +1,58 @@
+import pytest
+
+from src.occupational_classification.datasets.soc_loader import load_soc_resources
+from src.occupational_classification.search.soc_hierarchical import (
+    JOB_TITLE_LEVEL,
+    LEVELS,
+    HierarchicalSearch,
+)
+
+
+@pytest.fixture(scope="module")
+def soc(index_file, structure_file):
+    return load_soc_resources(
+        index_file, structure_file, executor="sequential"
+    ).hierarchy
+
+
+def test_search_returns_path(soc):
+    results = HierarchicalSearch(soc, beam_width=1).search("zoologist")
+
+    assert [result["code"] for result in results] == ["2112"]
+    assert [(step["level"], step["code"]) for step in results[0]["path"]] == [
+        ("Major", "2"),
+        ("Sub-Major", "21"),
+        ("Minor", "211"),
+    ]
+    assert results[0]["title"] == "Biological scientists"
+    assert results[0]["path"][0]["score"] > 0
+
+
+def test_beam_width_prunes_branches(soc):
+    search = HierarchicalSearch(soc, beam_width=1)
+    # "officials" only matches Major group 1, "scientist" only group 2
+    query = "chief executives and senior officials scientist"
+    narrow = {result["code"] for result in search.search(query)}
+    wide = {result["code"] for result in search.search(query, beam_width=2)}
+
+    assert narrow < wide
+    assert {"1111", "2112"} <= wide
+    assert search.search("astronaut") == []
+
+
+def test_job_title_level(soc):
+    search = HierarchicalSearch(soc, levels=(*LEVELS, JOB_TITLE_LEVEL))
+    results = search.search("vice president banking", top_k=1)
+
+    assert results[0]["code"] == "1111"
+    assert results[0]["title"] == "Vice president (banking)"
+    assert results[0]["path"][-1]["level"] == "Unit"
+
+
+def test_invalid_levels(soc):
+    with pytest.raises(ValueError, match="Unknown levels"):
+        HierarchicalSearch(soc, levels=("Division",))
+    with pytest.raises(ValueError, match="order"):
+        HierarchicalSearch(soc, levels=("Unit", "Major"))
+    with pytest.raises(ValueError, match="beam_width"):
+        HierarchicalSearch(soc, beam_width=0)
@@ -1,7 +1,9 @@
 # pylint: disable=C0301
+import pandas as pd
 import pytest
 
 from src.occupational_classification.lookup import soc_lookup
+from src.occupational_classification.meta.soc_meta import SocMeta
 
 
 @pytest.mark.parametrize(
@@ -169,3 +171,102 @@ def test_lookup_code_major_group(code, expected_meta):
 def test_unique_code_major_group(candidates, expected_meta):
     lookup = soc_lookup.SOCLookup().unique_code_major_group(candidates)
     assert lookup == expected_meta
+
+
+@pytest.mark.parametrize(
+    "description, expected_code",
+    [
+        ("Zoologist ", "2112"),
+        ("zoologist.", "2112"),
+        ("Zoologists", "2112"),
+        ("Benefits fraud investigator, government", "4111"),
+        ("  Vice   President (Banking)", "1131"),
+    ],
+)
+def test_lookup_normalised_description(description, expected_code):
+    lookup = soc_lookup.SOCLookup().lookup(description)
+    assert lookup["code"] == expected_code
+    assert lookup["description"] == description.lower()
+
+
+def test_lookup_normalised_description_not_found():
+    lookup = soc_lookup.SOCLookup().lookup("not an occupation at all")
+    assert lookup["code"] is None
+
+
+def test_rephrase_lookup_from_condensed_file():
+    rephrase_lookup = soc_lookup.SOCRephraseLookup(
+        condensed_data_path="soc_4d_condensed.txt"
+    )
+    assert rephrase_lookup.meta is None
+    assert rephrase_lookup.lookup("9111") == {
+        "soc_code": "9111",
+        "input_description": "Farm workers",
+    }
+    assert rephrase_lookup.lookup("1") == {
+        "soc_code": "1",
+        "error": "SOC code not found",
+    }
+
+
+def test_lookup_needs_structure_of_other_index(index_file, structure_file):
+    with pytest.raises(ValueError, match="structure_data_path"):
+        soc_lookup.SOCLookup(index_file)
+
+    lookup = soc_lookup.SOCLookup(index_file, structure_data_path=structure_file)
+    assert lookup.meta.get_meta_by_code("211")["group_title"] == (
+        "Natural and social science professionals"
+    )
+    rephrase_lookup = soc_lookup.SOCRephraseLookup(structure_data_path=structure_file)
+    assert (
+        rephrase_lookup.lookup("2112")["input_description"] == "Biological scientists"
+    )
+
+
+def test_lookup_batch():
+    lookup = soc_lookup.SOCLookup()
+    descriptions = pd.Series(
+        ["Zoologist", "saw doctor", "not an occupation", None, "Zoologist"],
+        index=[10, 11, 12, 13, 14],
+    )
+    result = lookup.lookup_batch(descriptions)
+
+    assert list(result.index) == [10, 11, 12, 13, 14]
+    assert (result.dtypes == "category").all()
+    assert result["code"].tolist()[:2] == ["2112", "8139"]
+    assert result["code"].isna().tolist() == [False, False, True, True, False]
+    assert result["code_major_group"].tolist()[:2] == ["2", "8"]
+    assert (
+        result["code_title"][10] == lookup.meta.get_meta_by_code("2112")["group_title"]
+    )
+    assert result["code_major_group_title"][11] == (
+        lookup.meta.get_meta_by_code("8")["group_title"]
+    )
+    assert set(result["code"].cat.categories) >= {"2112", "8139"}
+    assert result["code"].cat.categories.str.len().unique().tolist() == [4]
+
+
+def test_lookup_similarity_pages(index_file, structure_file):
+    lookup = soc_lookup.SOCLookup(index_file, meta=SocMeta(structure_file))
+    lookup.SIMILARITY_CHUNK_SIZE = 2
+    everything = lookup.lookup("e", similarity=True)["potential_matches"]
+    assert "has_more" not in everything
+
+    page = lookup.lookup("e", similarity=True, limit=1, offset=1)["potential_matches"]
+    assert page["descriptions"] == everything["descriptions"][1:2]
+    assert page["has_more"]
+    assert page["descriptions_count_is_estimate"]
+    assert page["descriptions_count"] > 0
+    assert set(page["codes"]) <= set(everything["codes"])
+
+    last_page = lookup.similar_descriptions("e", limit=10, offset=3)
+    assert last_page["descriptions"] == everything["descriptions"][3:]
+    assert not last_page["has_more"]
+    assert not last_page["descriptions_count_is_estimate"]
+    assert last_page["descriptions_count"] == everything["descriptions_count"]
+
+
+def test_lookup_similarity_negative_limit(index_file, structure_file):
+    lookup = soc_lookup.SOCLookup(index_file, meta=SocMeta(structure_file))
+    with pytest.raises(ValueError, match="negative"):
+        lookup.similar_descriptions("e", limit=-1)
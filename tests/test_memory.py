@@ -0,0 +1,52 @@
+import sys
+
+from src.occupational_classification.datasets.soc_loader import load_soc_resources
+from src.occupational_classification.utils.memory import (
+    deep_sizeof,
+    intern_strings,
+    memory_report,
+)
+
+
+def test_intern_strings_shares_equal_strings():
+    first = "".join(["chief ", "executive"])
+    second = "".join(["chief ", "exec", "utive"])
+    assert first is not second
+
+    interned = intern_strings({"tasks": [first], "title": (second,)})
+    assert interned["tasks"][0] is interned["title"][0]
+    assert intern_strings(7) == 7  # noqa: PLR2004
+
+
+def test_deep_sizeof_counts_shared_objects_once():
+    text = "x" * 1000
+    assert deep_sizeof([text, text]) == sys.getsizeof([text, text]) + sys.getsizeof(
+        text
+    )
+
+    seen: set[int] = set()
+    deep_sizeof(text, seen)
+    assert deep_sizeof([text], seen) == sys.getsizeof([text])
+
+
+def test_loaded_strings_are_shared(index_file, structure_file):
+    resources = load_soc_resources(index_file, structure_file, executor="sequential")
+    node = resources.hierarchy["2112"]
+    meta = resources.meta.get_meta_by_code("2112")
+
+    assert node.soc_code is meta["code"]
+    assert node.group_title is meta["group_title"]
+    assert node.tasks[0] is meta["tasks"][1]
+    assert resources.lookup.lookup_dict["zoologist"] is meta["code"]
+
+
+def test_memory_report(index_file, structure_file):
+    resources = load_soc_resources(index_file, structure_file, executor="sequential")
+    report = memory_report(lookup=resources.lookup, hierarchy=resources.hierarchy)
+
+    assert set(report) == {"metadata", "index", "hierarchy", "total"}
+    assert all(size > 0 for size in report.values())
+    assert report["total"] == (
+        report["metadata"] + report["index"] + report["hierarchy"]
+    )
+    assert memory_report() == {"metadata": 0, "index": 0, "hierarchy": 0, "total": 0}
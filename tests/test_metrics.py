@@ -0,0 +1,149 @@
+import math
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+# Lookups record into the installed package's metrics module
+from occupational_classification.utils import metrics as package_metrics
+from src.occupational_classification.datasets.soc_loader import load_soc_resources
+from src.occupational_classification.lookup.soc_lookup import SOCLookup
+from src.occupational_classification.meta.soc_meta import SocMeta
+from src.occupational_classification.utils.metrics import (
+    Histogram,
+    MetricsRegistry,
+)
+
+
+@pytest.fixture
+def metrics():
+    registry = package_metrics.enable_metrics(package_metrics.MetricsRegistry())
+    yield registry
+    package_metrics.disable_metrics()
+
+
+def test_histogram_quantiles():
+    histogram = Histogram(buckets=[1, 2, 4])
+    assert math.isnan(histogram.quantile(0.5))
+    for value in [0.5, 1.5, 1.5, 3, 10]:
+        histogram.observe(value)
+
+    assert histogram.counts == [1, 2, 1, 1]
+    assert histogram.quantile(0.5) == pytest.approx(1.75)
+    assert histogram.quantile(0.99) == 4  # noqa: PLR2004
+    snapshot = histogram.snapshot()
+    assert snapshot["count"] == 5  # noqa: PLR2004
+    assert snapshot["sum"] == pytest.approx(16.5)
+    with pytest.raises(ValueError, match="ascending"):
+        Histogram(buckets=[2, 1])
+
+
+def test_histogram_threads():
+    histogram = Histogram(buckets=[1])
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(
+            executor.map(
+                lambda _: [histogram.observe(0.5) for _ in range(1000)], range(8)
+            )
+        )
+
+    assert histogram.counts == [8000, 0]
+    assert histogram.sum == pytest.approx(4000)
+
+
+def test_histogram_folds_finished_threads():
+    histogram = Histogram(buckets=[1])
+    workers = 4
+    for _ in range(50):
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(lambda _: histogram.observe(2), range(8)))
+
+    # The base shard, and those of threads not yet cleaned up
+    assert len(histogram._shards) <= 1 + workers
+    assert histogram.counts == [0, 400]
+    assert histogram.sum == pytest.approx(800)
+
+
+def test_registry_exports():
+    registry = MetricsRegistry(buckets=[0.1, 1])
+    registry.counter("soc_errors_total", operation="rephrase", error='a"b').inc(2)
+    registry.histogram("soc_operation_duration_seconds", operation="x").observe(0.5)
+    with pytest.raises(ZeroDivisionError), registry.time("timed_seconds", step="s"):
+        1 / 0  # noqa: B018
+
+    exported = registry.to_dict()
+    assert exported["soc_errors_total"]["type"] == "counter"
+    assert {
+        "labels": {"operation": "rephrase", "error": 'a"b'},
+        "value": 2.0,
+    } in exported["soc_errors_total"]["series"]
+    assert exported["timed_seconds"]["series"][0]["count"] == 1
+    assert {
+        "labels": {"step": "s", "error": "ZeroDivisionError"},
+        "value": 1.0,
+    } in exported["soc_errors_total"]["series"]
+
+    text = registry.to_prometheus()
+    assert "# TYPE soc_operation_duration_seconds histogram" in text
+    assert 'soc_errors_total{operation="rephrase",error="a\\"b"} 2' in text
+    assert 'soc_operation_duration_seconds_bucket{operation="x",le="0.1"} 0' in text
+    assert 'soc_operation_duration_seconds_bucket{operation="x",le="+Inf"} 1' in text
+    assert 'soc_operation_duration_seconds_count{operation="x"} 1' in text
+    with pytest.raises(ValueError, match="not a counter"):
+        registry.counter("timed_seconds")
+    registry.reset()
+    assert registry.to_prometheus() == ""
+
+
+def test_operations_are_recorded(metrics, index_file, structure_file):
+    resources = load_soc_resources(index_file, structure_file, executor="sequential")
+    resources.lookup.lookup("zoologist")
+    resources.lookup.lookup("nobody", similarity=True)
+    resources.lookup.lookup_deduplicated(["zoologist", "Zoologists", "councillor"])
+    resources.rephrase_lookup.lookup("2112")
+    resources.rephrase_lookup.lookup("0000")
+    resources.hierarchy["2112"]
+    with pytest.raises(KeyError):
+        resources.hierarchy["0000"]
+
+    exported = metrics.to_dict()
+    stages = {
+        series["labels"]["stage"]
+        for series in exported["soc_load_duration_seconds"]["series"]
+    }
+    assert {"load", "build_lookup", "build_hierarchy", "total"} <= stages
+    latencies = {
+        series["labels"]["operation"]: series["count"]
+        for series in exported["soc_operation_duration_seconds"]["series"]
+    }
+    assert latencies == {
+        "hierarchy_access": 2,
+        "lookup_deduplicated": 1,
+        "lookup_exact": 3,
+        "lookup_similarity": 1,
+        "rephrase": 2,
+    }
+    errors = {
+        (series["labels"]["operation"], series["labels"]["error"]): series["value"]
+        for series in exported["soc_errors_total"]["series"]
+    }
+    assert errors == {
+        ("lookup_exact", "no_match"): 1,
+        ("lookup_similarity", "no_match"): 1,
+        ("rephrase", "code_not_found"): 1,
+        ("hierarchy_access", "KeyError"): 1,
+    }
+    cache = {
+        series["labels"]["result"]: series["value"]
+        for series in exported["soc_cache_requests_total"]["series"]
+    }
+    assert cache == {"hit": 1, "miss": 2}
+
+
+def test_disabled_records_nothing(index_file, structure_file):
+    registry = package_metrics.enable_metrics(package_metrics.MetricsRegistry())
+    package_metrics.disable_metrics()
+    lookup = SOCLookup(index_file, meta=SocMeta(structure_file))
+    lookup.lookup("zoologist")
+
+    assert package_metrics.get_metrics() is None
+    assert registry.to_dict() == {}
@@ -0,0 +1,76 @@
+import pytest
+
+from src.occupational_classification.utils.normalisation import (
+    TextNormaliser,
+    build_normalised_lookup,
+    fold_plural,
+)
+
+
+@pytest.mark.parametrize(
+    "token, expected",
+    [
+        ("teachers", "teacher"),
+        ("secretaries", "secretary"),
+        ("glasses", "glass"),
+        ("coaches", "coach"),
+        ("boxes", "box"),
+        ("glass", "glass"),
+        ("bus", "bus"),
+        ("analysis", "analysis"),
+        ("gas", "gas"),
+        ("teacher", "teacher"),
+    ],
+)
+def test_fold_plural(token, expected):
+    assert fold_plural(token) == expected
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Teacher ", "teacher"),
+        ("teacher.", "teacher"),
+        ("Teachers", "teacher"),
+        ("  Senior   TEACHER  ", "senior teacher"),
+        ("Bar & restaurant manager", "bar and restaurant manager"),
+        ("Asst. Mgr (retail)", "assistant manager retail"),
+        ("driver's mate", "driver mate"),
+        ("Fraud investigator (government)", "fraud investigator government"),
+        ("", ""),
+    ],
+)
+def test_default_normaliser(text, expected):
+    assert TextNormaliser()(text) == expected
+
+
+def test_normaliser_is_idempotent():
+    normaliser = TextNormaliser()
+    once = normaliser("Asst. Bar & Restaurant Managers (Hotels)")
+    assert normaliser(once) == once
+
+
+def test_normaliser_steps_can_be_disabled():
+    normaliser = TextNormaliser(
+        expand_ampersand=False,
+        strip_punctuation=False,
+        fold_plurals=False,
+        abbreviations={},
+    )
+    assert normaliser(" Asst. Teachers & Co ") == "asst. teachers & co"
+
+
+def test_normaliser_custom_abbreviations():
+    normaliser = TextNormaliser(abbreviations={"HGV": "heavy goods vehicle"})
+    assert normaliser("hgv driver") == "heavy goods vehicle driver"
+    assert normaliser("mgr") == "mgr"
+
+
+def test_build_normalised_lookup_leaves_out_ambiguous_texts():
+    pairs = [
+        ("Nurse", "1"),
+        ("nurses", "1"),
+        ("Farm worker", "2"),
+        ("farm workers", "3"),
+    ]
+    assert build_normalised_lookup(pairs, TextNormaliser()) == {"nurse": "1"}
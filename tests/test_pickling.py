@@ -0,0 +1,93 @@
+import pickle
+
+import pytest
+
+from src.occupational_classification.utils.normalisation import TextNormaliser
+
+_DESCRIPTIONS = ["Zoologist", "chief executives", "zoologsit", "nobody"]
+
+
+def round_trip(value):
+    return pickle.loads(  # noqa: S301
+        pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    )
+
+
+def test_lookup_round_trip(resources):
+    lookup = resources.lookup
+    restored = round_trip(lookup)
+
+    assert restored.data.equals(lookup.data)
+    assert restored.lookup_dict == lookup.lookup_dict
+    assert restored.normalised_lookup_dict == lookup.normalised_lookup_dict
+    assert restored.spelling_corrector is None
+    for description in _DESCRIPTIONS:
+        assert restored.lookup(description, similarity=True) == lookup.lookup(
+            description, similarity=True
+        )
+
+
+def test_spelling_corrector_is_kept(resources):
+    lookup = round_trip(resources.lookup)
+    corrector = lookup.enable_spelling_correction(max_edit_distance=1)
+    restored = round_trip(lookup)
+
+    assert restored.spelling_corrector.max_edit_distance == 1
+    assert restored.spelling_corrector.frequencies == corrector.frequencies
+    assert restored.spelling_corrector.deletes == corrector.deletes
+    assert restored.match_code("zoologsit") == "2112"
+
+
+def test_normaliser_pickles_settings():
+    normaliser = TextNormaliser(fold_plurals=False, abbreviations={"Mgr": "manager"})
+    normaliser("mgr nurses")
+    restored = round_trip(normaliser)
+
+    assert repr(restored) == repr(normaliser)
+    assert restored._normalise_token.cache_info().currsize == 0
+    assert restored("Mgr nurses") == "manager nurses"
+
+
+def test_hierarchy_round_trip(resources):
+    soc = resources.hierarchy
+    text = soc.all_leaf_text()
+    restored = round_trip(soc)
+
+    assert restored._views == {}
+    assert [node.soc_code for node in restored.nodes] == [
+        node.soc_code for node in soc.nodes
+    ]
+    node = restored["2112"]
+    assert node.parent is restored["211"]
+    assert node.parent.children == [node]
+    assert restored["1"].parent is None
+    assert node.job_titles == soc["2112"].job_titles
+    assert node.tasks == soc["2112"].tasks
+    assert node.group_level == "Unit"
+    assert restored.all_leaf_text().equals(text)
+
+
+def test_frozen_round_trip(resources):
+    lookup = round_trip(resources.lookup.freeze())
+    rephrase_lookup = round_trip(resources.rephrase_lookup.freeze())
+    meta = round_trip(resources.meta.freeze())
+    soc = round_trip(resources.hierarchy.freeze())
+
+    # The resources are built by the installed package's classes
+    assert type(lookup).__name__ == "FrozenSOCLookup"
+    assert type(lookup.meta).__name__ == "FrozenSocMeta"
+    assert lookup.lookup("zoologist") == resources.lookup.lookup("zoologist")
+    assert type(rephrase_lookup).__name__ == "FrozenSOCRephraseLookup"
+    assert rephrase_lookup.lookup("2112") == resources.rephrase_lookup.lookup("2112")
+    assert type(meta).__name__ == "FrozenSocMeta"
+    assert meta.get_meta_by_code("1111") == resources.meta.get_meta_by_code("1111")
+    assert type(soc).__name__ == "FrozenSOC"
+    assert soc["2112"].parent is soc["211"]
+    with pytest.raises(AttributeError, match="frozen"):
+        soc["2112"].tasks = ()
+
+
+def test_shared_objects_stay_shared(resources):
+    lookup, rephrase_lookup = round_trip((resources.lookup, resources.rephrase_lookup))
+
+    assert lookup.meta is rephrase_lookup.meta
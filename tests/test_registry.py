@@ -0,0 +1,108 @@
+import shutil
+import threading
+
+import pandas as pd
+import pytest
+
+from src.occupational_classification.datasets import soc_registry
+from src.occupational_classification.datasets.soc_registry import (
+    DatasetRegistry,
+    frame_digest,
+)
+
+
+@pytest.fixture
+def previous_index_file(index_file, tmp_path):
+    """An older index release, without the zoologist."""
+    df = pd.read_excel(index_file, sheet_name="SOC2020 coding index")
+    filepath = tmp_path / "previous_index.xlsx"
+    df[df["INDEXOCC_-_natural_word_order"] != "Zoologist"].to_excel(
+        filepath, sheet_name="SOC2020 coding index", index=False
+    )
+    return str(filepath)
+
+
+def test_registry_shares_identical_data(
+    index_file, structure_file, previous_index_file, tmp_path
+):
+    copied_index_file = tmp_path / "copied_index.xlsx"
+    shutil.copy(index_file, copied_index_file)
+    registry = DatasetRegistry()
+    registry.register("current", index_file, structure_file)
+    registry.register("copy", copied_index_file, structure_file)
+    registry.register("previous", previous_index_file, structure_file)
+
+    assert list(registry) == ["current", "copy", "previous"]
+    assert "previous" in registry
+    assert not registry.is_loaded("current")
+
+    current = registry["current"]
+    assert registry.get("current") is current
+    assert registry["copy"] is current
+    previous = registry["previous"]
+    assert previous is not current
+    assert previous.meta is current.meta
+    assert current.lookup.lookup("zoologist")["code"] == "2112"
+    assert previous.lookup.lookup("zoologist")["code"] is None
+    assert previous.lookup.lookup("chief executive")["code"] == "1111"
+    # Different releases share the interned strings of their dictionaries
+    current_titles = {title: title for title in current.lookup.lookup_dict}
+    assert current_titles["chief executive"] is next(
+        title for title in previous.lookup.lookup_dict if title == "chief executive"
+    )
+
+    registry.unload("current")
+    assert registry.is_loaded("copy")
+    assert registry["current"] is current
+    with pytest.raises(ValueError, match="already registered"):
+        registry.register("current", index_file, structure_file)
+    with pytest.raises(KeyError, match="unknown"):
+        registry.get("unknown")
+
+
+def test_loaded_dataset_is_read_during_load(
+    index_file, structure_file, previous_index_file, monkeypatch
+):
+    registry = DatasetRegistry()
+    registry.register("current", index_file, structure_file)
+    registry.register("previous", previous_index_file, structure_file)
+    current = registry["current"]
+    building, release = threading.Event(), threading.Event()
+    build_soc_resources = soc_registry.build_soc_resources
+
+    def slow_build(*args):
+        building.set()
+        release.wait(5)
+        return build_soc_resources(*args)
+
+    monkeypatch.setattr(soc_registry, "build_soc_resources", slow_build)
+    loader = threading.Thread(target=registry.get, args=("previous",))
+    loader.start()
+    assert building.wait(5)
+    try:
+        assert registry.get("current") is current
+        assert not registry.is_loaded("previous")
+    finally:
+        release.set()
+        loader.join()
+    assert registry.is_loaded("previous")
+
+
+def test_registry_config_file(index_file, structure_file, tmp_path):
+    config_file = tmp_path / "config_previous.toml"
+    config_file.write_text(
+        f'[data_source]\nsoc_index = "{index_file}"\nsoc_structure = "{structure_file}"\n'
+    )
+    registry = DatasetRegistry()
+    registry.register("previous", config_name=config_file)
+
+    assert registry.paths("previous") == (index_file, structure_file)
+    assert registry["previous"].hierarchy["2112"].soc_code == "2112"
+
+
+def test_frame_digest():
+    df = pd.DataFrame({"code": ["1111", "2112"], "title": ["a", "b"]})
+
+    assert frame_digest(df) == frame_digest(df.copy())
+    assert frame_digest(df) != frame_digest(df.iloc[:1])
+    assert frame_digest(df) != frame_digest(df.rename(columns={"title": "name"}))
@@ -0,0 +1,49 @@
+from src.occupational_classification.lookup.soc_lookup import SOCLookup
+from src.occupational_classification.lookup.soc_scanner import TitleScanner
+from src.occupational_classification.meta.soc_meta import SocMeta
+
+TITLES = {
+    "nurse": "2231",
+    "staff nurse": "2231",
+    "senior staff nurse": "2232",
+    "nurses": "9999",
+    "ward clerk": "4159",
+    "clerk": "4159",
+    "hospital porter": "9259",
+}
+
+
+def test_scan_prefers_longest_matches():
+    scanner = TitleScanner(TITLES)
+    text = "I work as a Senior Staff-Nurse on a hospital ward, not a ward clerk."
+
+    assert len(scanner) == 6  # noqa: PLR2004
+    results = scanner.scan(text)
+    assert [(result["code"], result["title"]) for result in results] == [
+        ("2232", "senior staff nurse"),
+        ("4159", "ward clerk"),
+    ]
+    assert results[0]["text"] == "Senior Staff-Nurse"
+    assert text[results[1]["start"] : results[1]["end"]] == "ward clerk"
+
+
+def test_scan_overlapping():
+    scanner = TitleScanner(TITLES)
+    results = scanner.scan("senior staff nurses", overlapping=True)
+
+    assert sorted(result["title"] for result in results) == [
+        "nurse",
+        "senior staff nurse",
+        "staff nurse",
+    ]
+    assert scanner.scan("") == []
+    assert scanner.scan("hospital cleaner") == []
+
+
+def test_scan_from_lookup(index_file, structure_file):
+    lookup = SOCLookup(index_file, meta=SocMeta(structure_file))
+    scanner = TitleScanner.from_lookup(lookup)
+
+    results = scanner.scan("Our chief executives met a zoologist & a councillor.")
+    assert [result["code"] for result in results] == ["1111", "2112"]
+    assert results[0]["text"] == "chief executives"
@@ -1,3 +1,5 @@
+import numpy as np
+import pandas as pd
 import pytest
 
 from src.occupational_classification.hierarchy import soc_hierarchy
@@ -190,3 +192,152 @@ def test_soc_all_group_qualifications():
             "text": "Qualification1",
         }
     ]
+
+
+def test_soc_group_views_are_cached_until_nodes_change():
+    node = soc_hierarchy.SocNode("1", "Title1", "Description1")
+    node.job_titles = ["Job1", "Job1", "Job2"]
+    obj = soc_hierarchy.SOC([node], lookup={})
+
+    columns = obj.group_columns("job_titles")
+    assert columns["code"].tolist() == ["1", "1", "1"]
+    assert columns["text"].tolist() == ["Job1", "Job1", "Job2"]
+    assert obj.group_columns("job_titles") is columns
+    assert not columns["text"].flags.writeable
+    leaf_text = obj.all_leaf_text()
+    assert leaf_text.to_dict("list") == {
+        "code": ["1", "1", "1"],
+        "text": ["Title1", "Job1", "Job2"],
+    }
+    leaf_text.loc[0, "text"] = "changed"
+    assert obj.all_leaf_text()["text"][0] == "Title1"
+
+    node.job_titles.append("Job3")
+    assert obj.group_columns("job_titles") is columns
+    obj.invalidate_views()
+    assert obj.group_columns("job_titles")["text"].tolist()[-1] == "Job3"
+
+    obj.nodes.append(soc_hierarchy.SocNode("2", "Title2", "Description2"))
+    assert list(obj.all_group_titles()) == [
+        {"code": "1", "text": "Title1"},
+        {"code": "2", "text": "Title2"},
+    ]
+    obj.nodes = [node]
+    assert obj.group_columns("titles")["code"].tolist() == ["1"]
+    with pytest.raises(ValueError, match="Unknown field"):
+        obj.group_columns("unknown")
+
+
+# Roll-up of coded records
+@pytest.fixture
+def small_soc():
+    codes = ["1", "11", "111", "1111", "1112", "2", "21", "211", "2112"]
+    nodes = [soc_hierarchy.SocNode(code, f"Title{code}", "") for code in codes]
+    return soc_hierarchy.SOC(nodes, lookup={node.soc_code: node for node in nodes})
+
+
+def test_soc_rollup_counts(small_soc):
+    # Integers are not valid codes, as for validate_codes
+    result = small_soc.rollup(["1111", "1112", "2112", "1111", None, "abc", "21", 2112])
+    assert result.to_dict("list") == {
+        "level": [
+            "Major",
+            "Major",
+            "Sub-Major",
+            "Sub-Major",
+            "Minor",
+            "Minor",
+            "Unit",
+            "Unit",
+            "Unit",
+        ],
+        "code": ["1", "2", "11", "21", "111", "211", "1111", "1112", "2112"],
+        "group_title": [
+            "Title1",
+            "Title2",
+            "Title11",
+            "Title21",
+            "Title111",
+            "Title211",
+            "Title1111",
+            "Title1112",
+            "Title2112",
+        ],
+        "count": [3, 2, 3, 2, 3, 1, 2, 1, 1],
+    }
+
+
+@pytest.mark.parametrize(
+    "aggfunc, expected_weights",
+    [("sum", [6.0, 4.0]), ("mean", [2.0, 4.0]), ("max", [3.0, 4.0])],
+)
+def test_soc_rollup_weights(small_soc, aggfunc, expected_weights):
+    codes = pd.Series(["1111", "1112", "2112", "1111"], dtype="category")
+    result = small_soc.rollup(
+        codes, weights=[1, 2, 4, 3], aggfunc=aggfunc, levels=["Major"]
+    )
+    assert result["code"].tolist() == ["1", "2"]
+    assert result["count"].tolist() == [3, 1]
+    assert result["weight"].tolist() == expected_weights
+
+
+def test_soc_rollup_unknown_code_has_no_title(small_soc):
+    result = small_soc.rollup(["9999"], levels=["Major", "Unit"])
+    assert result["code"].tolist() == ["9", "9999"]
+    assert result["group_title"].tolist() == [None, None]
+
+
+def test_soc_rollup_errors(small_soc):
+    with pytest.raises(ValueError, match="Unknown levels"):
+        small_soc.rollup(["1111"], levels=["Division"])
+    with pytest.raises(ValueError, match="same length"):
+        small_soc.rollup(["1111"], weights=[1, 2])
+
+
+# Bulk validation
+def _with_none(values):
+    return [None if pd.isna(value) else value for value in values]
+
+
+def test_validate_codes_matches_soc_code():
+    codes = ["1111", "12", "", None, "12a5", " ", "12345", 1111, "1111"]
+    result = soc_hierarchy.validate_codes(codes)
+
+    expected_errors = []
+    for code in codes:
+        try:
+            soc_hierarchy.SocCode(code)
+            expected_errors.append(None)
+        except (TypeError, ValueError) as error:
+            expected_errors.append(str(error))
+    assert result["code"].tolist() == codes
+    assert _with_none(result["error"]) == expected_errors
+    assert result["is_valid"].tolist() == [error is None for error in expected_errors]
+    assert _with_none(result["level"]) == [
+        "Unit",
+        "Sub-Major",
+        None,
+        None,
+        None,
+        None,
+        None,
+        None,
+        "Unit",
+    ]
+    assert "in_hierarchy" not in result
+
+
+def test_validate_codes_numpy_and_series_input():
+    codes = np.array(["1", "21", "211"])
+    from_array = soc_hierarchy.validate_codes(codes)
+    from_series = soc_hierarchy.validate_codes(pd.Series(codes, index=[5, 6, 7]))
+    assert from_array["is_valid"].all()
+    assert list(from_series.index) == [5, 6, 7]
+    assert from_series["level"].tolist() == ["Major", "Sub-Major", "Minor"]
+
+
+def test_soc_validate_and_contains_codes(small_soc):
+    codes = ["1111", "9999", "x", None, "21"]
+    result = small_soc.validate_codes(codes)
+    assert result["in_hierarchy"].tolist() == [True, False, False, False, True]
+    assert small_soc.contains_codes(codes).tolist() == [True, False, False, False, True]
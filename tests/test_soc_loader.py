@@ -0,0 +1,47 @@
+import pytest
+
+from src.occupational_classification.datasets.soc_loader import load_soc_resources
+from src.occupational_classification.meta.soc_meta import SocMeta
+
+
+@pytest.mark.parametrize("executor", ["process", "thread", "sequential"])
+def test_load_soc_resources(index_file, structure_file, executor):
+    resources = load_soc_resources(index_file, structure_file, executor=executor)
+
+    assert resources.lookup.meta is resources.meta
+    assert resources.rephrase_lookup.meta is resources.meta
+    assert resources.lookup.lookup("Zoologist")["code"] == "2112"
+    assert resources.lookup.lookup("vice president (banking)")["code"] == "1111"
+    assert resources.rephrase_lookup.lookup("2112") == {
+        "soc_code": "2112",
+        "input_description": "Biological scientists",
+    }
+    assert resources.hierarchy["2112"].parent.soc_code == "211"
+    assert resources.hierarchy["1111"].job_titles == [
+        "Chief executive",
+        "Vice president (banking)",
+    ]
+    assert resources.hierarchy["1111"].tasks == ["first task 1111", "second task 1111"]
+    assert {"load", "build_lookup", "build_hierarchy", "total"} <= set(
+        resources.timings
+    )
+
+
+def test_load_soc_resources_unknown_executor(index_file, structure_file):
+    with pytest.raises(ValueError, match="Executor"):
+        load_soc_resources(index_file, structure_file, executor="gpu")
+
+
+def test_soc_meta_from_dataframe(structure_file):
+    from_file = SocMeta(structure_file)
+    from_df = SocMeta(df=from_file.df)
+    assert from_df.soc_meta == from_file.soc_meta
+    assert from_df.get_meta_by_code("1112")["group_title"] == (
+        "Elected officers and representatives"
+    )
+    assert "error" in from_df.get_meta_by_code("9999")
+
+
+def test_soc_meta_requires_path_or_dataframe():
+    with pytest.raises(ValueError):
+        SocMeta()
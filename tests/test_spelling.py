@@ -0,0 +1,64 @@
+import pytest
+
+from src.occupational_classification.lookup.soc_lookup import SOCLookup
+from src.occupational_classification.meta.soc_meta import SocMeta
+from src.occupational_classification.utils.spelling import (
+    SpellingCorrector,
+    edit_distance,
+)
+
+
+@pytest.mark.parametrize(
+    ("first", "second", "expected"),
+    [
+        ("accountant", "accountant", 0),
+        ("acountant", "accountant", 1),
+        ("electrican", "electrician", 1),
+        ("nrue", "nurse", 2),
+        ("nurse", "nusre", 1),
+        ("cook", "chef", 3),
+    ],
+)
+def test_edit_distance(first, second, expected):
+    assert edit_distance(first, second, 3) == expected
+    assert edit_distance(first, second, 1) == min(expected, 2)
+
+
+def test_spelling_corrector():
+    words = ["accountant", "electrician", "nurse", "nurse", "purse", "manager"]
+    corrector = SpellingCorrector(words)
+
+    assert len(corrector) == 5  # noqa: PLR2004
+    assert corrector.suggest("accountant") == ("accountant", 0)
+    assert corrector.suggest("acountant") == ("accountant", 1)
+    assert corrector.suggest("electrican") == ("electrician", 1)
+    # Equally close, the more frequent word wins
+    assert corrector.suggest("durse") == ("nurse", 1)
+    assert corrector.suggest("zzzzzz") is None
+    assert corrector.correct("acountant  mangaer") == "accountant manager"
+    assert corrector.correct_with_distance("acountant mangaer") == (
+        "accountant manager",
+        2,
+    )
+    # Short, numeric and unknown words are kept
+    assert corrector.correct("it 2nd qwerty") == "it 2nd qwerty"
+    with pytest.raises(ValueError, match="prefix_length"):
+        SpellingCorrector(words, max_edit_distance=2, prefix_length=2)
+
+
+def test_long_words_beyond_prefix():
+    corrector = SpellingCorrector(["administrator", "administration"])
+
+    assert corrector.correct("administrater") == "administrator"
+    assert corrector.correct("adminstration") == "administration"
+
+
+def test_lookup_spelling_correction(index_file, structure_file):
+    lookup = SOCLookup(index_file, meta=SocMeta(structure_file))
+    assert lookup.match_code("Zoologst") is None
+
+    corrector = lookup.enable_spelling_correction()
+    assert "zoologist" in corrector.frequencies
+    assert lookup.match_code("Zoologst") == "2112"
+    assert lookup.lookup("chief exectuive")["code"] == "1111"
+    assert lookup.freeze().match_code("zooligist") == "2112"
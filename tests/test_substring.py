@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from src.occupational_classification.lookup.soc_lookup import SOCLookup
+from src.occupational_classification.lookup.soc_substring import (
+    SubstringIndex,
+    is_literal,
+    suffix_array,
+)
+from src.occupational_classification.meta.soc_meta import SocMeta
+
+
+def test_suffix_array():
+    text = "banana\x00"
+    codes = np.array([ord(char) for char in text])
+    expected = sorted(range(len(text)), key=lambda start: text[start:])
+    assert suffix_array(codes).tolist() == expected
+    assert suffix_array(np.empty(0, dtype=np.int64)).tolist() == []
+
+
+def test_substring_index():
+    descriptions = ["staff nurse", None, "nurse", "nursery nurse", "zoo keeper", ""]
+    index = SubstringIndex(descriptions, ["1", "2", "3", "4", "5", "6"])
+
+    assert index.search("nurse") == (
+        ["staff nurse", "nurse", "nursery nurse"],
+        ["1", "3", "4"],
+    )
+    assert index.search("nurse nur") == ([], [])
+    assert index.search("e\x00z") == ([], [])
+    assert index.search("r") == (
+        ["staff nurse", "nurse", "nursery nurse", "zoo keeper"],
+        ["1", "3", "4", "5"],
+    )
+    assert index.rows("").tolist() == [0, 2, 3, 4, 5]
+    with pytest.raises(ValueError, match="one label"):
+        SubstringIndex(descriptions, [])
+
+
+def test_is_literal():
+    assert is_literal("nurse - staff & co")
+    assert not is_literal("asst.")
+    assert not is_literal("councillor (local government)")
+
+
+@pytest.mark.parametrize(
+    "query", ["e", "zoolog", "ist", "(banking)", "chief executive", "xyz", ""]
+)
+def test_lookup_with_substring_index(index_file, structure_file, query):
+    lookup = SOCLookup(index_file, meta=SocMeta(structure_file))
+    scanned = lookup.lookup(query, similarity=True)
+    scanned_page = lookup.similar_descriptions(query, limit=1)
+
+    lookup.enable_substring_index()
+    assert lookup.lookup(query, similarity=True) == scanned
+    assert lookup.freeze().lookup(query, similarity=True) == scanned
+    page = lookup.similar_descriptions(query, limit=1)
+    assert page["descriptions"] == scanned_page["descriptions"]
+    assert not page["descriptions_count_is_estimate"]